@@ -24,7 +24,7 @@ class AldousBroder(ABC):
 
             # If that neighbor has no links yet,
             # link it to current cell and decrement unvisited
-            if len(neighbor.links()) == 0:
+            if not neighbor.is_visited():
                 cell.link(neighbor)
                 unvisited -= 1
 
@@ -1,11 +1,13 @@
 from random import uniform
 
+from maze_creator.core.directions import EAST, NORTH
+from maze_creator.core.link_buffers import add_reciprocal_links, bernoulli_bytes
 from maze_creator.grids.grid import Grid
 
 
 class BinaryTree:
     @staticmethod
-    def create_maze(grid, horizontal_bias: float = 0.5) -> Grid:
+    def create_maze(grid, horizontal_bias: float = 0.5, vectorized: bool = False) -> Grid:
         """
         Generate a maze by walking through every cell in the grid and at each cell linking either the northern or
         the eastern cell to the one currently visited.
@@ -15,7 +17,12 @@ class BinaryTree:
 
         Because of this rule, this algorithm creates maze_creator that have a bias towards NE direction and will always have
         a completely linked eastern column and northern row (in default orientation)
+
+        Every cell's choice is independent of the others, so with vectorized=True all the choices are drawn in one
+        batch and written into the grid with a single merge_link_masks call instead of a link() per cell.
         """
+        if vectorized:
+            return BinaryTree._create_maze_vectorized(grid, horizontal_bias)
 
         for cell in grid.each_cell():
 
@@ -37,3 +44,23 @@ class BinaryTree:
                 cell.link(cell.north)
 
         return grid
+
+    @staticmethod
+    def _create_maze_vectorized(grid, horizontal_bias: float) -> Grid:
+        if hasattr(grid, "mask"):
+            raise Exception("Masked grids can't use binary algorithm.")
+
+        rows, columns = grid.rows, grid.columns
+
+        # One east/north decision per cell, east with probability horizontal_bias
+        choices = bernoulli_bytes(rows * columns, horizontal_bias, EAST, NORTH)
+
+        # Northernmost row always links east, easternmost column always links north, and the upper
+        # right-hand corner can't link anything
+        choices[:columns] = bytes([EAST]) * columns
+        choices[columns - 1 :: columns] = bytes([NORTH]) * rows
+        choices[columns - 1] = 0
+
+        grid.merge_link_masks(add_reciprocal_links(choices, columns))
+
+        return grid
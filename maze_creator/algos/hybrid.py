@@ -0,0 +1,71 @@
+from random import choice
+from typing import Union
+
+from maze_creator.algos.wilson import Wilson
+from maze_creator.core.unvisited import UnvisitedCells
+from maze_creator.grids.grid import Grid
+
+
+class AldousBroderWilson:
+    """
+    Uniform spanning tree generator that starts out as Aldous-Broder and finishes with Wilson's algorithm.
+
+    Aldous-Broder's random walk finds new cells quickly while most of the grid is unvisited, but crawls at the
+    end hunting for the last few cells. Wilson's loop-erased walks are the other way around, slow to begin with
+    since they have to wander into the small visited region, but fast once there's plenty of maze to hit. Both
+    phases share one UnvisitedCells index, so the Wilson phase simply carries on from wherever the walk stopped.
+    """
+
+    # When the switch isn't fixed, measure how often the walk finds a new cell over windows of this share of
+    # the grid...
+    AUTO_WINDOW = 0.1
+    # ...and hand over to Wilson once a window's rate drops below this share of the walk's overall rate
+    AUTO_SLOWDOWN = 0.5
+
+    @staticmethod
+    def create_maze(grid, switch_at: Union[float, None] = None) -> Grid:
+        """
+        switch_at is the fraction of cells the Aldous-Broder phase visits before Wilson's algorithm takes over.
+        Leave it as None to switch automatically once the walk starts finding new cells a lot less often than it
+        used to.
+        """
+        unvisited = UnvisitedCells(grid)
+        columns = grid.columns
+
+        # Start on a random cell and consider it visited
+        cell = grid.random_cell()
+        unvisited.visit(cell.row * columns + cell.column)
+
+        if switch_at is not None:
+            stop_at = grid.size() * (1 - switch_at)
+            window = 0
+        else:
+            stop_at = 0
+            window = max(64, int(grid.size() * AldousBroderWilson.AUTO_WINDOW))
+        steps = found = 0
+        total_steps = total_found = 0
+
+        while len(unvisited) > stop_at:
+            neighbor = choice(cell.neighbors())
+            position = neighbor.row * columns + neighbor.column
+
+            # Same as Aldous-Broder, link the neighbor if it hasn't been visited yet
+            if position in unvisited:
+                cell.link(neighbor)
+                unvisited.visit(position)
+                found += 1
+
+            cell = neighbor
+
+            steps += 1
+            if steps == window:
+                total_steps += steps
+                total_found += found
+                overall_rate = total_found / total_steps
+                if found < window * overall_rate * AldousBroderWilson.AUTO_SLOWDOWN:
+                    break
+                steps = found = 0
+
+        Wilson.walk(grid, unvisited)
+
+        return grid
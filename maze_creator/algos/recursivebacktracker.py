@@ -1,7 +1,14 @@
-from random import choice
+from array import array
+from itertools import permutations
+from random import choice, randrange
 
+from maze_creator.core.directions import EAST, NORTH, SOUTH, WEST
 from maze_creator.grids.grid import Grid
 
+# Every order the four directions can be tried in. Trying them in a random order and taking the first unvisited
+# neighbor picks uniformly among the unvisited neighbors without building a list of them.
+DIRECTION_ORDERS = tuple(permutations((NORTH, SOUTH, EAST, WEST)))
+
 
 class RecursiveBackTracker:
     """
@@ -14,7 +21,15 @@ class RecursiveBackTracker:
     """
 
     @staticmethod
-    def create_maze(grid) -> Grid:
+    def create_maze(grid, compact: bool = False) -> Grid:
+        """
+        With compact=True the stack is a typed array of cell positions (row * columns + column) and visited cells
+        are tracked in a bitmap, so the memory held by the stack is a few bytes per cell rather than a reference to
+        a Cell.
+        """
+        if compact:
+            return RecursiveBackTracker._create_maze_compact(grid)
+
         # Initialize the stack with random cell to start visiting on
         stack = [grid.random_cell()]
 
@@ -22,7 +37,7 @@ class RecursiveBackTracker:
             # Examine current item at the top of the stack and check to see if it has any unvisited neighbors
             current = stack[-1]
             unvisited_neighbors = list(
-                filter(lambda n: len(n.links()) == 0, current.neighbors())
+                filter(lambda n: not n.is_visited(), current.neighbors())
             )
             # If there are no unvisited neighbors pop another cell of the stack, otherwise choose another
             # random unvisited neighbor to visit
@@ -34,3 +49,53 @@ class RecursiveBackTracker:
                 stack.append(neighbor)
 
         return grid
+
+    @staticmethod
+    def _create_maze_compact(grid) -> Grid:
+        rows, columns = grid.rows, grid.columns
+
+        # Masked cells start out visited so the walk never steps onto them
+        visited = bytearray(b"\x01") * (rows * columns)
+        for cell in grid.each_cell():
+            visited[cell.row * columns + cell.column] = 0
+
+        start = grid.random_cell()
+        position = start.row * columns + start.column
+        visited[position] = 1
+        stack = array("l", [position])
+
+        while stack:
+            position = stack[-1]
+            row, column = divmod(position, columns)
+
+            # Try the directions in a random order and stop at the first unvisited neighbor
+            for direction in DIRECTION_ORDERS[randrange(24)]:
+                if direction == NORTH:
+                    if row == 0:
+                        continue
+                    neighbor = position - columns
+                elif direction == SOUTH:
+                    if row == rows - 1:
+                        continue
+                    neighbor = position + columns
+                elif direction == EAST:
+                    if column == columns - 1:
+                        continue
+                    neighbor = position + 1
+                else:
+                    if column == 0:
+                        continue
+                    neighbor = position - 1
+
+                if not visited[neighbor]:
+                    break
+            else:
+                # Dead end, backtrack
+                stack.pop()
+                continue
+
+            visited[neighbor] = 1
+            grid[row, column].link(grid[divmod(neighbor, columns)])
+            stack.append(neighbor)
+
+        return grid
@@ -1,11 +1,57 @@
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from random import choice, uniform
 
+from maze_creator.core.directions import EAST, NORTH
+from maze_creator.core.link_buffers import add_reciprocal_links, bernoulli_bytes
 from maze_creator.grids.grid import Grid
 
+# Aim for roughly a megabyte of link masks per band of rows handed to a worker
+BAND_CELLS = 1 << 20
+
+
+def _carve_rows(
+    first_row: int, row_count: int, columns: int, horizontal_bias: float, seed: int
+) -> bytes:
+    """
+    Run the sidewinder over a band of rows and return their link buffer. Only the EAST and NORTH side of each
+    link is recorded, the caller fills in the reciprocals. Lives at module level so worker processes can
+    pickle it.
+    """
+    rng = random.Random(seed)
+    band = bytearray()
+
+    for row in range(first_row, first_row + row_count):
+        if row == 0:
+            # The northernmost row is one big run with nothing to link north to
+            band += bytes([EAST]) * (columns - 1) + b"\x00"
+            continue
+
+        # EAST where the run carries on, 0 where it closes out (always at the eastern boundary)
+        decisions = bernoulli_bytes(columns, horizontal_bias, EAST, 0, rng)
+        decisions[-1] = 0
+
+        # Every run ends on a 0, so splitting on them gives the runs (the trailing empty piece is dropped)
+        run_lengths = [len(run) + 1 for run in decisions.split(b"\x00")[:-1]]
+
+        # Draw a 32-bit number per run and scale it to the run's length to pick the member linked north
+        draws = array("I", rng.randbytes(4 * len(run_lengths)))
+        run_start = 0
+        for run_length, draw in zip(run_lengths, draws):
+            decisions[run_start + ((draw * run_length) >> 32)] |= NORTH
+            run_start += run_length
+
+        band += decisions
+
+    return bytes(band)
+
 
 class SideWinder:
     @staticmethod
-    def create_maze(grid, horizontal_bias: float = 0.5) -> Grid:
+    def create_maze(
+        grid, horizontal_bias: float = 0.5, batched: bool = False, workers: int = 1
+    ) -> Grid:
         """
         Visit every cell in the gird and attach the eastern cell so long as the random number generated falls below the
         bias. After we hit our first miss, we have created a "run" (aka a group) of cells and then must pick a northern
@@ -19,7 +65,12 @@ class SideWinder:
         Called the sidewinder algorithm because a solution can be found to the maze by winding from bottom to the top
         of the maze looking for the northern cell connection since at the very least every row must be connected to
         its neighboring top row by at least one cell.
+
+        A row only depends on its own random draws, so with batched=True each row's close-out decisions are drawn in
+        bulk and bands of rows are carved independently, spread over worker processes when workers > 1.
         """
+        if batched:
+            return SideWinder._create_maze_batched(grid, horizontal_bias, workers)
 
         for row in grid.each_row():
             # Create an empty run for each row
@@ -49,3 +100,46 @@ class SideWinder:
                     # If we're still within a run just link current cell to its eastern neighbor
                     cell.link(cell.east)
         return grid
+
+    @staticmethod
+    def _create_maze_batched(grid, horizontal_bias: float, workers: int) -> Grid:
+        if hasattr(grid, "mask"):
+            raise Exception("Masked grids can't use sidewinder algorithm.")
+
+        rows, columns = grid.rows, grid.columns
+        band_rows = max(1, BAND_CELLS // columns)
+        bands = [(row, min(band_rows, rows - row)) for row in range(0, rows, band_rows)]
+        # Every band gets its own seed from the global generator, so the maze only depends on random.seed and
+        # not on how many workers carved it
+        seeds = [random.getrandbits(64) for _ in bands]
+
+        args = (
+            [first for first, _ in bands],
+            [count for _, count in bands],
+            [columns] * len(bands),
+            [horizontal_bias] * len(bands),
+            seeds,
+        )
+
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                carved = executor.map(_carve_rows, *args)
+                SideWinder._merge_bands(grid, bands, carved)
+        else:
+            SideWinder._merge_bands(grid, bands, map(_carve_rows, *args))
+
+        return grid
+
+    @staticmethod
+    def _merge_bands(grid, bands, carved) -> None:
+        """
+        Fill in the reciprocal links for each band and merge it into the grid. The band is padded with an empty
+        row above it so NORTH links out of its first row land as SOUTH links on the previous band's last row.
+        """
+        columns = grid.columns
+        for (first_row, _), band in zip(bands, carved):
+            if first_row == 0:
+                grid.merge_link_masks(add_reciprocal_links(band, columns))
+            else:
+                padded = add_reciprocal_links(bytes(columns) + band, columns)
+                grid.merge_link_masks(padded, first_row - 1)
@@ -1,5 +1,7 @@
 from random import choice
 
+from maze_creator.core.directions import EAST, NORTH, SOUTH, WEST, direction_between
+from maze_creator.core.unvisited import UnvisitedCells
 from maze_creator.grids.grid import Grid
 
 
@@ -12,38 +14,48 @@ class Wilson:
         Aldous-Broder and it can also take a similarly long time to run (since its a random walk). Runtime wise, this
         algorithm starts slow, since it has to find visited cells to carve paths to, but picks up in speed as more
         cells become visited (hence making it easier to carve paths).
+
+        Cells are tracked by position in a visited bitmap with an indexable set for random picks, and rather than
+        keeping the path as a list, the walk records the last exit taken out of every cell. Following those exits
+        from the start of the walk retraces the path with every loop already erased.
+        """
+        unvisited = UnvisitedCells(grid)
+        Wilson.walk(grid, unvisited)
+        return grid
+
+    @staticmethod
+    def walk(grid, unvisited: UnvisitedCells) -> None:
+        """
+        Run loop-erased random walks until every cell in unvisited has been carved into the maze. If nothing has
+        been visited yet, a random cell is marked visited to seed the maze.
         """
-        # Initialize a list of unvisited cells from the grid
-        unvisited = [cell for cell in grid.each_cell()]
+        columns = grid.columns
+        # The direction of the last step out of each position, overwritten every time the walk passes through
+        exits = bytearray(grid.rows * columns)
+        step = {NORTH: -columns, SOUTH: columns, EAST: 1, WEST: -1}
 
-        # Pick a random cell from the list and mark it visited by deleting from list
-        first = choice(unvisited)
-        unvisited.remove(first)
+        if len(unvisited) == grid.size():
+            unvisited.visit(unvisited.random())
 
         while len(unvisited) > 0:
             # Choose a cell at random and start a prospective path
-            cell = choice(unvisited)
-            path = [cell]
-
-            # While our cell is unvisited (loop erasure section)
-            while cell in unvisited:
-                # Take a random cell from our neighbors
-                cell = choice(cell.neighbors())
-                # Check to see if we've formed a loop yet, if we have erase it.
-                if cell in path:
-                    # If we've formed a loop, truncate path up until the cell first appeared
-                    # Add 1 to position so that it's included in the truncated slice
-                    position = path.index(cell)
-                    path = path[0 : position + 1]
-                else:
-                    # Otherwise just append the cell to the path
-                    path.append(cell)
-
-            # Once we hit a visited cell, we move to the path carving stage
-            # Iterate over each cell in our path (subtracting 1 from range so we stop 1 shy of the last element)
-            for i in range(len(path) - 1):
-                # Link every element to its next neighbor and then delete it from our unvisited cell
-                path[i].link(path[i + 1])
-                unvisited.remove(path[i])
-
-        return grid
+            start = unvisited.random()
+            position = start
+
+            # Walk until we run into the visited part of the maze
+            while position in unvisited:
+                row, column = divmod(position, columns)
+                neighbor = choice(grid[row, column].neighbors())
+                direction = direction_between(row, column, neighbor.row, neighbor.column)
+                exits[position] = direction
+                position += step[direction]
+
+            # Carve the loop-erased path by following the last exit out of each cell from the start
+            position = start
+            cell = grid[divmod(position, columns)]
+            while position in unvisited:
+                next_position = position + step[exits[position]]
+                next_cell = grid[divmod(next_position, columns)]
+                cell.link(next_cell)
+                unvisited.visit(position)
+                position, cell = next_position, next_cell
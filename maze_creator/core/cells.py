@@ -1,74 +1,157 @@
-from typing import Dict, List
+from typing import List, Tuple, Union
+
+from maze_creator.core.directions import (
+    EAST,
+    NORTH,
+    OPPOSITE,
+    SOUTH,
+    WEST,
+    direction_between,
+)
 
 
 class Cell:
     """
     Cells represent an individual tile in a maze. Cells know about their neighbors and are optionally linked
     to each of their neighbors (i.e. there's a passage between them).
+
+    Links are kept as a 4-bit mask of NORTH/SOUTH/EAST/WEST directions, so a cell can only be linked to the
+    cells directly next to it.
     """
 
+    __slots__ = (
+        "row",
+        "column",
+        "north",
+        "south",
+        "east",
+        "west",
+        "link_mask",
+        "_neighbors",
+    )
+
     row: int
     column: int
-    north: "Cell"
-    east: "Cell"
-    west: "Cell"
-    south: "Cell"
-    neighboring_cells: Dict["Cell", bool]
+    north: Union["Cell", None]
+    east: Union["Cell", None]
+    west: Union["Cell", None]
+    south: Union["Cell", None]
+    link_mask: int
+    _neighbors: Tuple["Cell", ...]
 
     def __init__(self, row: int, column: int) -> None:
         self.row = row
         self.column = column
-        self.neighboring_cells = {}
+        self.north = None
+        self.south = None
+        self.east = None
+        self.west = None
+        self.link_mask = 0
+        self._neighbors = ()
 
     def __str__(self) -> str:
         return f"Cell @ [row:{self.row}, col:{self.column}]"
 
+    def set_neighbors(self, north, south, east, west) -> None:
+        """
+        Record the cells surrounding this one and precompute the tuple returned by neighbors()
+        """
+        self.north = north
+        self.south = south
+        self.east = east
+        self.west = west
+        self._neighbors = tuple(n for n in (north, south, east, west) if n is not None)
+
+    def _adopt(self, direction: int, cell: "Cell") -> None:
+        """
+        Remember cell as our neighbor in direction, this lets cells that were never placed in a grid be linked
+        """
+        if direction == NORTH and self.north is None:
+            self.set_neighbors(cell, self.south, self.east, self.west)
+        elif direction == SOUTH and self.south is None:
+            self.set_neighbors(self.north, cell, self.east, self.west)
+        elif direction == EAST and self.east is None:
+            self.set_neighbors(self.north, self.south, cell, self.west)
+        elif direction == WEST and self.west is None:
+            self.set_neighbors(self.north, self.south, self.east, cell)
+
     def link(self, cell_to_link: "Cell", bidi: bool = True) -> None:
         """
         Link another cell to this one, and optionally bidirectionally link the cell we're about to link to this one
         """
+        direction = direction_between(
+            self.row, self.column, cell_to_link.row, cell_to_link.column
+        )
+        if not direction:
+            raise ValueError(f"{cell_to_link} is not a neighbor of {self}")
 
-        self.neighboring_cells[cell_to_link] = True
+        self.link_mask |= direction
+        self._adopt(direction, cell_to_link)
 
         if bidi:
-            cell_to_link.neighboring_cells[self] = True
+            cell_to_link.link_mask |= OPPOSITE[direction]
+            cell_to_link._adopt(OPPOSITE[direction], self)
 
     def unlink(self, cell_to_unlink: "Cell", bidi: bool = True) -> None:
         """
         Unlink another cell to this one, and optionally bidirectionally unlink the cell we're about to unlink to this one
         """
+        direction = direction_between(
+            self.row, self.column, cell_to_unlink.row, cell_to_unlink.column
+        )
 
-        self.neighboring_cells[cell_to_unlink] = False
+        self.link_mask &= ~direction
 
         if bidi:
-            cell_to_unlink.neighboring_cells[self] = False
+            cell_to_unlink.link_mask &= ~OPPOSITE.get(direction, 0)
 
     def links(self) -> List["Cell"]:
         """
         Return all the cells linked to this cell
         """
+        mask = self.link_mask
+        links = []
+        if mask & NORTH:
+            links.append(self.north)
+        if mask & SOUTH:
+            links.append(self.south)
+        if mask & EAST:
+            links.append(self.east)
+        if mask & WEST:
+            links.append(self.west)
+
+        return links
+
+    def link_count(self) -> int:
+        """
+        Return how many cells are linked to this one without building a list of them
+        """
+        return self.link_mask.bit_count()
 
-        return [key for key in self.neighboring_cells.keys()]
+    def is_visited(self) -> bool:
+        """
+        Returns T/F if the cell has been linked to anything yet (i.e. a maze algorithm has visited it)
+        """
+        return self.link_mask != 0
 
-    def is_linked(self, other_cell: "Cell") -> bool:
+    def is_linked(self, other_cell: Union["Cell", None]) -> bool:
         """
         Returns T/F if the other_cell is linked to this one
         """
-
-        return self.neighboring_cells.get(other_cell, False)
-
-    def neighbors(self) -> List["Cell"]:
+        if other_cell is None:
+            return False
+        if other_cell is self.north:
+            return bool(self.link_mask & NORTH)
+        if other_cell is self.south:
+            return bool(self.link_mask & SOUTH)
+        if other_cell is self.east:
+            return bool(self.link_mask & EAST)
+        if other_cell is self.west:
+            return bool(self.link_mask & WEST)
+        return False
+
+    def neighbors(self) -> Tuple["Cell", ...]:
         """
         Return each of the immediate neighbor cells to this cell, regardless if they are linked to cell or not
         """
-        neighbors = []
-        if self.north:
-            neighbors.append(self.north)
-        if self.south:
-            neighbors.append(self.south)
-        if self.east:
-            neighbors.append(self.east)
-        if self.west:
-            neighbors.append(self.west)
-
-        return neighbors
+        return self._neighbors
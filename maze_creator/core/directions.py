@@ -0,0 +1,29 @@
+from typing import Dict, Tuple
+
+# Each direction is a single bit so a cell's links can be packed into a 4-bit mask
+NORTH = 1
+SOUTH = 2
+EAST = 4
+WEST = 8
+
+ALL_DIRECTIONS = (NORTH, SOUTH, EAST, WEST)
+
+OPPOSITE: Dict[int, int] = {NORTH: SOUTH, SOUTH: NORTH, EAST: WEST, WEST: EAST}
+
+# (row offset, column offset) of the neighbor lying in each direction
+OFFSETS: Dict[int, Tuple[int, int]] = {
+    NORTH: (-1, 0),
+    SOUTH: (1, 0),
+    EAST: (0, 1),
+    WEST: (0, -1),
+}
+
+_DIRECTION_FOR_OFFSET = {offset: direction for direction, offset in OFFSETS.items()}
+
+
+def direction_between(row: int, column: int, other_row: int, other_column: int) -> int:
+    """
+    Return the direction bit pointing from (row, column) to (other_row, other_column), or 0 when the two
+    positions are not orthogonal neighbors
+    """
+    return _DIRECTION_FOR_OFFSET.get((other_row - row, other_column - column), 0)
@@ -0,0 +1,103 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import List, Sequence, Union
+
+from maze_creator.core.distance_grid import UNREACHABLE, DistanceGrid, _breadth_first
+
+
+class MultiSourceDistanceGrid(DistanceGrid):
+    """
+    DistanceGrid grown from several cells at once: every source starts at distance 0, so a single breadth-first
+    search gives each cell its distance to the nearest source (e.g. the nearest exit). Alongside the distances it
+    records which source each cell is nearest to, ties going to whichever source got there first.
+
+    root is the first source, path_to leads back to whichever source is nearest the goal.
+    """
+
+    sources: List["Cell"]
+    labels: array  # Index into sources of the nearest source for every position, UNREACHABLE if none
+
+    def __init__(self, grid, cells: Sequence["Cell"]):
+        if not cells:
+            raise Exception("Need at least one source cell")
+        super().__init__(grid, cells[0])
+        self.sources = list(cells)
+        self.labels = array("i", self.distances)
+
+        for label, cell in enumerate(self.sources):
+            position = self._position(cell)
+            self.distances[position] = 0
+            # The same cell given twice keeps its first label
+            if self.labels[position] == UNREACHABLE:
+                self.labels[position] = label
+
+    def calc_distances(self) -> None:
+        """
+        Breadth-first search out from every source together, passing each source's label on to the cells it reaches
+        """
+        queue = array("i", dict.fromkeys(map(self._position, self.sources)))
+        sources = len(queue)
+        parents = array("i", [UNREACHABLE]) * len(self.distances)
+        _breadth_first(
+            self.grid.link_masks(), self.columns, self.distances, queue, parents
+        )
+
+        # The queue is left holding every reached position in breadth-first order, so each cell's parent has its
+        # label by the time the cell comes up
+        labels = self.labels
+        for position in islice(queue, sources, None):
+            labels[position] = labels[parents[position]]
+
+    def get_cell_source(self, cell: "Cell") -> Union["Cell", None]:
+        """
+        Get the source nearest to the given cell, None if no source can reach it
+        """
+        label = self.labels[self._position(cell)]
+        return None if label == UNREACHABLE else self.sources[label]
+
+
+def _distance_fields(masks: bytes, columns: int, roots: List[int]) -> bytes:
+    """
+    Compute one distance field per root and return them back to back. Lives at module level so worker processes
+    can pickle it.
+    """
+    unreached = array("i", [UNREACHABLE]) * len(masks)
+    fields = array("i")
+    for root in roots:
+        distances = array("i", unreached)
+        distances[root] = 0
+        _breadth_first(masks, columns, distances, array("i", [root]))
+        fields.extend(distances)
+    return fields.tobytes()
+
+
+def distance_matrix(grid, cells: Sequence["Cell"], workers: int = 1) -> array:
+    """
+    Compute an independent distance field from each of the given cells and return them as one flat K x n matrix
+    (K cells, n = rows * columns), so the field for cells[k] is matrix[k * n:(k + 1) * n] and the distance from
+    cells[k] to position p is matrix[k * n + p]. Unreachable positions hold UNREACHABLE.
+
+    The link masks are read once and shared by every field. With workers > 1 the roots are split into one chunk
+    per worker process, each receiving a single copy of the masks.
+    """
+    masks = grid.link_masks()
+    columns = grid.columns
+    roots = [cell.row * columns + cell.column for cell in cells]
+
+    matrix = array("i")
+    if workers > 1 and len(roots) > 1:
+        chunk = -(-len(roots) // workers)
+        chunks = [roots[start : start + chunk] for start in range(0, len(roots), chunk)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for fields in executor.map(
+                _distance_fields,
+                [masks] * len(chunks),
+                [columns] * len(chunks),
+                chunks,
+            ):
+                matrix.frombytes(fields)
+    else:
+        matrix.frombytes(_distance_fields(masks, columns, roots))
+
+    return matrix
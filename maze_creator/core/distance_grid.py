@@ -0,0 +1,190 @@
+from array import array
+from typing import List, Union
+
+from maze_creator.core.directions import EAST, NORTH, SOUTH, WEST
+from maze_creator.core.path import Path
+
+# Distance recorded for cells that can't be reached from the root (or are masked out of the grid)
+UNREACHABLE = -1
+
+
+def _breadth_first(
+    masks: bytes,
+    columns: int,
+    distances: array,
+    queue: array,
+    parents: Union[array, None] = None,
+) -> None:
+    """
+    Breadth-first search over a buffer of link masks, starting from the positions already in queue (whose
+    distances must already be set) and filling in distances for everything they can reach. When a parents array
+    is passed it also records the position each cell was reached from.
+    """
+    # The queue is a flat array of positions, iterating over it while appending to it visits cells in
+    # breadth-first order without ever popping anything
+    enqueue = queue.append
+    track = parents is not None
+
+    for position in queue:
+        distance = distances[position] + 1
+        links = masks[position]
+
+        # Visit each linked neighbor we haven't reached yet
+        if links & NORTH:
+            neighbor = position - columns
+            if distances[neighbor] < 0:
+                distances[neighbor] = distance
+                if track:
+                    parents[neighbor] = position
+                enqueue(neighbor)
+        if links & SOUTH:
+            neighbor = position + columns
+            if distances[neighbor] < 0:
+                distances[neighbor] = distance
+                if track:
+                    parents[neighbor] = position
+                enqueue(neighbor)
+        if links & EAST:
+            neighbor = position + 1
+            if distances[neighbor] < 0:
+                distances[neighbor] = distance
+                if track:
+                    parents[neighbor] = position
+                enqueue(neighbor)
+        if links & WEST:
+            neighbor = position - 1
+            if distances[neighbor] < 0:
+                distances[neighbor] = distance
+                if track:
+                    parents[neighbor] = position
+                enqueue(neighbor)
+
+
+def _walk_back(masks: bytes, columns: int, distances: array, goal: int) -> array:
+    """
+    Step back from goal through linked neighbors that are one closer to the root until reaching distance 0,
+    returning every position on the way (goal first)
+    """
+    positions = array("i", [goal])
+    current = goal
+    while distances[current] > 0:
+        links = masks[current]
+        previous = distances[current] - 1
+        for direction, step in (
+            (NORTH, -columns),
+            (SOUTH, columns),
+            (EAST, 1),
+            (WEST, -1),
+        ):
+            if links & direction and distances[current + step] == previous:
+                current += step
+                break
+        positions.append(current)
+    return positions
+
+
+class DistanceGrid:
+    """
+    Takes a grid and a root cell and calculates the distance from the root to every cell it is linked to.
+
+    Unlike Distances, which keeps a dict keyed by Cell objects, distances live in a flat integer array indexed by
+    position (row * columns + column), with UNREACHABLE for cells the root can't get to. The breadth-first search
+    reads the grid's link masks directly and queues plain integer positions, so it never touches a Cell. Offers the
+    same get_cell_distance / max API as Distances, while path_to hands back a compact Path.
+
+    With track_parents=True the search also records the position each cell was reached from, which turns path_to
+    into a straight walk back from the goal.
+    """
+
+    grid: "Grid"
+    root: "Cell"
+    columns: int
+    distances: array  # Distance from the root to every position in the grid
+    parents: Union[array, None]  # Position each cell was reached from, when tracked
+
+    def __init__(self, grid, cell: "Cell", track_parents: bool = False):
+        self.grid = grid
+        self.root = cell
+        self.columns = grid.columns
+        self.distances = array("i", [UNREACHABLE]) * (grid.rows * grid.columns)
+        self.distances[self._position(cell)] = 0
+        self.parents = array("i", self.distances) if track_parents else None
+
+    def _position(self, cell: "Cell") -> int:
+        return cell.row * self.columns + cell.column
+
+    def calc_distances(self) -> None:
+        """
+        Breadth-first search out from the root over the grid's link masks, recording parents when tracked
+        """
+        _breadth_first(
+            self.grid.link_masks(),
+            self.columns,
+            self.distances,
+            array("i", [self._position(self.root)]),
+            self.parents,
+        )
+
+    def get_cell_distance(self, cell: Union["Cell", None]) -> Union[int, None]:
+        """
+        Get the distance from root to given cell, None if it can't be reached or doesn't exist
+        """
+        if cell is None:
+            return None
+        distance = self.distances[self._position(cell)]
+        return None if distance == UNREACHABLE else distance
+
+    def set_cell_distance(self, cell: "Cell", dist: int) -> None:
+        """
+        Set the distance from root to supplied cell
+        """
+        self.distances[self._position(cell)] = dist
+
+    def get_all_cells(self) -> List["Cell"]:
+        """
+        Return a list of all the cells that we have recorded distances for
+        """
+        return [
+            self.grid[divmod(position, self.columns)]
+            for position, distance in enumerate(self.distances)
+            if distance != UNREACHABLE
+        ]
+
+    def max(self) -> tuple["Cell", int]:
+        """
+        Calculate the maximum cell from root
+        """
+        max_distance = max(self.distances)
+        if max_distance <= 0:
+            return self.root, 0
+
+        position = self.distances.index(max_distance)
+        return self.grid[divmod(position, self.columns)], max_distance
+
+    def path_to(self, goal: "Cell") -> Path:
+        """
+        Return the shortest path from root to goal. With parents tracked this just follows them back from the goal,
+        otherwise it steps back through linked neighbors that are one closer to root
+        """
+        if goal is None:
+            raise Exception("Cell doesn't exist or is blocked off")
+
+        current = self._position(goal)
+        if self.distances[current] == UNREACHABLE:
+            raise Exception("Cell can't be reached from the root")
+
+        # Collect the path from the goal backwards and flip it at the end
+        if self.parents is not None:
+            positions = array("i", [current])
+            parents = self.parents
+            root = self._position(self.root)
+            while current != root:
+                current = parents[current]
+                positions.append(current)
+        else:
+            positions = _walk_back(
+                self.grid.link_masks(), self.columns, self.distances, current
+            )
+
+        positions.reverse()
+        return Path(self.columns, positions)
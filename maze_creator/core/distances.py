@@ -81,8 +81,8 @@ class Distances:
 
     def path_to(self, goal: "Cell") -> "Distances":
         """
-        Use Dijkstra's algorithm to find a path from root to goal. Returns a distances mapping representing the
-        shortest path to the goal
+        Walk back from goal through linked cells that are closer to root. Returns a distances mapping representing
+        the shortest path to the goal (see WeightedDistanceGrid for a true Dijkstra over weighted cells)
         """
         if goal is None:
             raise Exception("Cell doesn't exist or is blocked off")
@@ -0,0 +1,72 @@
+"""
+Helpers for building link masks for a whole grid at once. A link buffer is a row-major bytes object holding one
+NORTH/SOUTH/EAST/WEST direction mask per cell, which grids can absorb in a single pass with merge_link_masks.
+The heavy lifting is done by bytes.translate and big-integer bit operations, so the per-cell work happens in C.
+"""
+
+import random
+from typing import Union
+
+from maze_creator.core.directions import EAST, NORTH, SOUTH, WEST
+
+
+def bernoulli_bytes(
+    count: int, probability: float, hit: int, miss: int, rng=random
+) -> bytearray:
+    """
+    Return count bytes where each one is independently hit with the given probability and miss otherwise.
+
+    Every cell draws a single random byte. Bytes below floor(probability * 256) are hits, bytes above it are
+    misses and the one byte value on the boundary is settled with an extra rng.random() draw, so the result
+    follows probability exactly instead of being rounded to 1/256 steps.
+    """
+    scaled = min(max(probability, 0.0), 1.0) * 256
+    threshold = int(scaled)
+    remainder = scaled - threshold
+
+    # Pick a byte value we can use to flag draws that landed on the boundary
+    undecided = next(value for value in range(256) if value not in (hit, miss))
+    table = bytearray(miss for _ in range(256))
+    table[:threshold] = bytes([hit]) * threshold
+    if threshold < 256 and remainder:
+        table[threshold] = undecided
+
+    decisions = bytearray(rng.randbytes(count).translate(table))
+
+    if remainder:
+        position = decisions.find(undecided)
+        while position != -1:
+            decisions[position] = hit if rng.random() < remainder else miss
+            position = decisions.find(undecided, position + 1)
+
+    return decisions
+
+
+def _repeat(value: int, count: int) -> int:
+    """
+    Big-integer with value in every one of its count bytes
+    """
+    return int.from_bytes(bytes([value]) * count, "little")
+
+
+def add_reciprocal_links(masks: Union[bytes, bytearray], columns: int) -> bytes:
+    """
+    Given a link buffer where each link is only recorded on one of its two cells, return a buffer where every
+    link is recorded on both (e.g. an EAST link also sets WEST on the next cell over). Links must not point
+    off the edge of the grid.
+    """
+    count = len(masks)
+    links = int.from_bytes(masks, "little")
+
+    # Each cell is one byte, so moving a bit to the next cell over is a shift by 8 and to the next row is a
+    # shift by 8 * columns. The extra one bit shift turns a direction into its opposite.
+    row_shift = 8 * columns - 1
+    reciprocals = (
+        ((links & _repeat(EAST, count)) << 9)
+        | ((links & _repeat(WEST, count)) >> 9)
+        | ((links & _repeat(NORTH, count)) >> row_shift)
+        | ((links & _repeat(SOUTH, count)) << row_shift)
+    )
+
+    combined = (links | reciprocals) & ((1 << (8 * count)) - 1)
+    return combined.to_bytes(count, "little")
@@ -0,0 +1,66 @@
+from array import array
+from typing import List
+
+from maze_creator.core.distance_grid import UNREACHABLE, _breadth_first, _walk_back
+from maze_creator.core.path import Path
+
+
+def component_longest_paths(grid) -> List[Path]:
+    """
+    Find the longest path in every connected part of the maze (a masked grid can leave several islands), in the
+    order their first cell appears in the grid. Cells without any links aren't part of any component.
+
+    Uses two breadth-first sweeps per component: the cell farthest from any starting cell is one end of a longest
+    path, and the cell farthest from that end is the other. The queue of a breadth-first search is in distance order,
+    so the farthest cell is simply the last one queued. This is exact when the component is a tree (every algorithm
+    in algos carves one), on mazes with loops it gives a long path but not necessarily the longest.
+    """
+    masks = grid.link_masks()
+    columns = grid.columns
+    unreached = array("i", [UNREACHABLE]) * len(masks)
+    from_start = array("i", unreached)
+    from_end = array("i", unreached)
+
+    # 1 for every linked cell no sweep has reached yet
+    remaining = bytearray(masks).translate(bytes([0]) + bytes([1]) * 255)
+    paths = []
+
+    start = remaining.find(1)
+    while start != -1:
+        # First sweep finds one end of the longest path, and with it every cell in the component
+        component = array("i", [start])
+        from_start[start] = 0
+        _breadth_first(masks, columns, from_start, component)
+        end = component[-1]
+
+        # Second sweep from that end finds the other
+        sweep = array("i", [end])
+        from_end[end] = 0
+        _breadth_first(masks, columns, from_end, sweep)
+        paths.append(Path(columns, _walk_back(masks, columns, from_end, sweep[-1])))
+
+        for position in component:
+            remaining[position] = 0
+        start = remaining.find(1, start)
+
+    return paths
+
+
+def longest_path(grid) -> Path:
+    """
+    Return the longest path through the maze, the longest of the per-component ones when there are several.
+    path[0] and path[-1] are its ends (good start and finish cells for a puzzle) and path.distance() its length.
+    """
+    paths = component_longest_paths(grid)
+    if not paths:
+        # Nothing is linked, so any single cell is as long as it gets
+        cell = next(grid.each_cell())
+        return Path(grid.columns, array("i", [cell.row * grid.columns + cell.column]))
+    return max(paths, key=len)
+
+
+def diameter(grid) -> int:
+    """
+    Return the number of steps along the longest path through the maze
+    """
+    return longest_path(grid).distance()
@@ -1,50 +1,181 @@
-from random import randint
-from typing import Union
+from array import array
+from itertools import compress
+from random import randint, sample as random_sample
+from typing import Generator, List, Tuple, Union
 import os
 from PIL import Image
 
+# Translation tables pulling the bit for column (8 * n + slot) out of a packed byte, most significant bit first
+_SLOT_BITS = [bytes(value >> (7 - slot) & 1 for value in range(256)) for slot in range(8)]
+
+
+class _MaskRow:
+    """
+    One row of a mask, so code written against the old list of lists (mask.bits[row][column]) keeps working
+    """
+
+    def __init__(self, mask: "Mask", row: int):
+        self.mask = mask
+        self.row = row
+
+    def __len__(self) -> int:
+        return self.mask.columns
+
+    def __getitem__(self, column: int) -> bool:
+        if not 0 <= column < self.mask.columns:
+            raise IndexError("Mask column out of range")
+        return self.mask[self.row, column]
+
+    def __setitem__(self, column: int, enabled: bool) -> None:
+        self.mask[self.row, column] = enabled
+
+    def __iter__(self) -> Generator[bool, None, None]:
+        for column in range(self.mask.columns):
+            yield self.mask[self.row, column]
+
+
+class _MaskRows:
+    """
+    Sequence of the rows of a mask, each row view is only built when it's asked for
+    """
+
+    def __init__(self, mask: "Mask"):
+        self.mask = mask
+
+    def __len__(self) -> int:
+        return self.mask.rows
+
+    def __getitem__(self, row: int) -> _MaskRow:
+        if not 0 <= row < self.mask.rows:
+            raise IndexError("Mask row out of range")
+        return _MaskRow(self.mask, row)
+
+    def __iter__(self) -> Generator[_MaskRow, None, None]:
+        for row in range(self.mask.rows):
+            yield _MaskRow(self.mask, row)
+
 
 class Mask:
+    """
+    Which locations of a grid are part of the maze. Locations are stored as a packed bit array, one bit each and
+    set when the location is enabled. Every row starts on a fresh byte and the first column of a byte sits in its
+    most significant bit, the same layout Pillow uses for 1-bit images.
+    """
 
     def __init__(self, rows, columns):
         self.rows = rows
         self.columns = columns
-        self.bits = [[True for _ in range(columns)] for _ in range(rows)]
+        self.stride = -(-columns // 8)
+        # Every location starts enabled, the bits padding out each row stay clear
+        last = (0xFF00 >> (columns - 8 * (self.stride - 1))) & 0xFF
+        self.packed = bytearray((b"\xff" * (self.stride - 1) + bytes([last])) * rows)
+        # Enabled count and positions (row * columns + column) of every enabled location, worked out on first use
+        # and thrown away whenever a location changes
+        self._count = None
+        self._index = None
+
+    @property
+    def bits(self) -> _MaskRows:
+        """
+        Row by row view of the mask, mask.bits[row][column] reads and writes single locations
+        """
+        return _MaskRows(self)
 
     def count(self):
         """
         How many locations are enabled in the mask
         """
-        count = 0
-        for rows in self.bits:
-            for bool in rows:
-                if bool:
-                    count += 1
+        if self._count is None:
+            self._count = int.from_bytes(self.packed, "big").bit_count()
+        return self._count
 
-        return count
+    def _enabled_index(self) -> array:
+        """
+        Positions of every enabled location in row-major order, rebuilt after the mask changes
+        """
+        if self._index is None:
+            cells = self.enabled_cells()
+            self._index = array("i", compress(range(len(cells)), cells))
+        return self._index
 
     def random_location(self):
         """
-        Pick a random location from the gird that's enabled
+        Pick a random location from the gird that's enabled, in constant time however sparse the mask is
         """
-        x = randint(0, self.columns - 1)
-        y = randint(0, self.rows - 1)
-        while not (self.bits[y][x]):
-            x = randint(0, self.columns - 1)
-            y = randint(0, self.rows - 1)
+        index = self._enabled_index()
+        if not index:
+            raise Exception("Mask has no enabled locations")
+        return divmod(index[randint(0, len(index) - 1)], self.columns)
 
-        return (y, x)
+    def sample(self, k: int) -> List[Tuple[int, int]]:
+        """
+        Pick k distinct enabled locations at random
+        """
+        index = self._enabled_index()
+        if k > len(index):
+            raise Exception("Can't sample more locations than are enabled")
+        columns = self.columns
+        return [divmod(position, columns) for position in random_sample(index, k)]
 
-    def __getitem__(self, tup) -> Union["Cell", None]:
+    def __getitem__(self, tup) -> Union[bool, None]:
         """
-        Return a slice of the underlying grid only if the rows and columns are non-negative, otherwise return None
-        This way we can access the Cell of a Grid by Grid[row, column]
+        Return whether the location at Mask[row, column] is enabled, or None if it's outside the mask
         """
         y, x = tup
         if 0 <= y <= (self.rows - 1) and 0 <= x <= (self.columns - 1):
-            return self.bits[y][x]
+            return bool(self.packed[y * self.stride + (x >> 3)] & (0x80 >> (x & 7)))
         return None
 
+    def __setitem__(self, tup, enabled: bool) -> None:
+        """
+        Enable or disable the location at Mask[row, column]
+        """
+        y, x = tup
+        if not (0 <= y <= (self.rows - 1) and 0 <= x <= (self.columns - 1)):
+            raise Exception("Location is outside the mask")
+        offset, bit = y * self.stride + (x >> 3), 0x80 >> (x & 7)
+        if bool(self.packed[offset] & bit) == bool(enabled):
+            return
+        self.packed[offset] ^= bit
+        self._count = None
+        self._index = None
+
+    def enabled_cells(self) -> bytes:
+        """
+        Return a row-major buffer holding 1 for every enabled location and 0 for every disabled one
+        """
+        cells = bytearray(8 * len(self.packed))
+        for slot, table in enumerate(_SLOT_BITS):
+            cells[slot::8] = self.packed.translate(table)
+
+        width = 8 * self.stride
+        if width == self.columns:
+            return bytes(cells)
+        return b"".join(
+            cells[row * width : row * width + self.columns] for row in range(self.rows)
+        )
+
+    @staticmethod
+    def from_cells(rows: int, columns: int, cells: bytes) -> "Mask":
+        """
+        Build a mask from a row-major buffer holding 1 for every enabled location and 0 for every disabled one
+        """
+        mask = Mask(rows, columns)
+        width = 8 * mask.stride
+        if width != columns:
+            padding = bytes(width - columns)
+            cells = b"".join(
+                cells[row * columns : (row + 1) * columns] + padding
+                for row in range(rows)
+            )
+
+        # Each slot is a big-integer holding every 8th location, shifted to its bit of the byte
+        packed = 0
+        for slot in range(8):
+            packed |= int.from_bytes(cells[slot::8], "little") << (7 - slot)
+        mask.packed = bytearray(packed.to_bytes(len(cells) // 8, "little"))
+        return mask
+
     @staticmethod
     def from_txt(file):
         path = os.path.abspath(file)
@@ -55,38 +186,38 @@ class Mask:
         cleaned_lines = [l.strip() for l in lines]
         rows = len(cleaned_lines)
         columns = len(cleaned_lines[0])
-        mask = Mask(rows, columns)
-
-        cur_row = 0
-        cur_col = 0
-        while cur_row < rows:
-            while cur_col < columns:
-                if cleaned_lines[cur_row][cur_col] == "X":
-                    mask.bits[cur_row][cur_col] = False
-                cur_col += 1
 
-            cur_col = 0
-            cur_row += 1
-
-        return mask
+        # "X" marks a disabled location, anything else is enabled
+        enabled = bytes(0 if value == ord("X") else 1 for value in range(256))
+        cells = b"".join(
+            line.encode("latin-1", "replace")[:columns].translate(enabled)
+            for line in cleaned_lines
+        )
+        if len(cells) != rows * columns:
+            raise Exception("Every line of a mask must be as wide as the first")
+        return Mask.from_cells(rows, columns, cells)
 
     @staticmethod
-    def from_image(image):
+    def from_image(image, cutoff: int = 128, alpha: bool = False):
+        """
+        Load a mask from an image in any mode Pillow reads (RGB, RGBA, grayscale, palette...). The image is converted
+        to a single channel once and thresholded in bulk, straight into the packed bits. Pixels with a luminance
+        below cutoff (out of 255) are disabled, so dark shapes cut holes in the maze. With alpha=True the alpha
+        channel is thresholded instead, disabling every pixel that is more transparent than cutoff.
+        """
+        if not 0 <= cutoff <= 256:
+            raise Exception("Cutoff must be between 0 and 256")
         path = os.path.abspath(image)
-        img = Image.open(path)
-        mask = Mask(img.height, img.width)
-        cur_row = 0
-        cur_col = 0
-        while cur_row < img.height:
-            while cur_col < img.width:
-                pixel_color = img.getpixel((cur_col,cur_row))
-                if pixel_color == (0,0,0):
-                     mask.bits[cur_row][cur_col] = False
-                cur_col += 1
-
-            cur_col = 0
-            cur_row += 1
-
+        with Image.open(path) as img:
+            if alpha:
+                channel = img.convert("RGBA").getchannel("A")
+            else:
+                channel = img.convert("L")
+
+        mask = Mask(channel.height, channel.width)
+        # Mode "1" images pack 8 pixels to a byte with each row padded out to a byte, exactly like the mask
+        threshold = [0] * cutoff + [255] * (256 - cutoff)
+        mask.packed = bytearray(channel.point(threshold, "1").tobytes())
         return mask
 
 
@@ -0,0 +1,51 @@
+from array import array
+from typing import Iterator, Tuple, Union
+
+
+class Path:
+    """
+    Ordered route through a grid from a start cell to a goal, kept as a flat array of positions
+    (row * columns + column). Iterating yields (row, column) pairs in order and membership checks take O(1),
+    so renderers can ask "is this cell on the path?" for every cell without scanning it.
+    """
+
+    columns: int
+    positions: array
+
+    def __init__(self, columns: int, positions: array):
+        self.columns = columns
+        self.positions = positions
+        self._members = None
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        columns = self.columns
+        for position in self.positions:
+            yield divmod(position, columns)
+
+    def __getitem__(self, index: int) -> Tuple[int, int]:
+        return divmod(self.positions[index], self.columns)
+
+    def __contains__(self, cell: Union["Cell", Tuple[int, int], None]) -> bool:
+        """
+        Check whether a cell (or a (row, column) pair) lies on the path
+        """
+        if cell is None:
+            return False
+        if isinstance(cell, tuple):
+            row, column = cell
+        else:
+            row, column = cell.row, cell.column
+
+        # Built on first use so paths that are only walked never pay for the set
+        if self._members is None:
+            self._members = set(self.positions)
+        return row * self.columns + column in self._members
+
+    def distance(self) -> int:
+        """
+        Number of steps from the start of the path to the goal
+        """
+        return len(self.positions) - 1
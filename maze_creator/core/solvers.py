@@ -0,0 +1,142 @@
+from array import array
+from heapq import heappop, heappush
+from typing import Dict, List, Tuple
+
+from maze_creator.core.directions import EAST, NORTH, SOUTH, WEST
+from maze_creator.core.path import Path
+
+
+def _endpoints(grid, start: "Cell", goal: "Cell") -> Tuple[int, int]:
+    if start is None or goal is None:
+        raise Exception("Cell doesn't exist or is blocked off")
+    columns = grid.columns
+    return start.row * columns + start.column, goal.row * columns + goal.column
+
+
+def _walk_back(parents: Dict[int, int], position: int) -> array:
+    """
+    Follow parents from position until reaching the cell that has no parent, returning every position on the way
+    """
+    positions = array("i", [position])
+    while parents[position] != position:
+        position = parents[position]
+        positions.append(position)
+    return positions
+
+
+class BidirectionalBFS:
+    """
+    Point-to-point shortest path search that grows a breadth-first frontier from both ends at once and stops as soon
+    as they meet. Each round expands a whole layer of whichever frontier is smaller, so the search touches roughly
+    the cells within half the path length of either end instead of everything reachable from the start.
+    Only the cells it reaches are stored (in dicts keyed by position), so nothing is allocated per grid cell.
+    """
+
+    @staticmethod
+    def solve(grid, start: "Cell", goal: "Cell") -> Tuple[Path, int]:
+        """
+        Return the path from start to goal along with the number of cells expanded to find it
+        """
+        source, target = _endpoints(grid, start, goal)
+        columns = grid.columns
+        link_mask_at = grid.link_mask_at
+        steps = ((NORTH, -columns), (SOUTH, columns), (EAST, 1), (WEST, -1))
+
+        # Each side maps a reached position to the position it was reached from (the end itself maps to itself)
+        forward = {source: source}
+        backward = {target: target}
+        forward_layer: List[int] = [source]
+        backward_layer: List[int] = [target]
+        expanded = 0
+        meeting = source if source == target else None
+
+        while meeting is None and forward_layer and backward_layer:
+            # Grow the smaller frontier by one full layer
+            if len(forward_layer) <= len(backward_layer):
+                layer, parents, other = forward_layer, forward, backward
+            else:
+                layer, parents, other = backward_layer, backward, forward
+
+            next_layer = []
+            for position in layer:
+                expanded += 1
+                links = link_mask_at(position)
+                for direction, step in steps:
+                    if links & direction:
+                        neighbor = position + step
+                        if neighbor not in parents:
+                            parents[neighbor] = position
+                            next_layer.append(neighbor)
+                            # Every meeting found in this layer is equally short, the first one will do
+                            if meeting is None and neighbor in other:
+                                meeting = neighbor
+
+            if parents is forward:
+                forward_layer = next_layer
+            else:
+                backward_layer = next_layer
+
+        if meeting is None:
+            raise Exception("Goal can't be reached from the start")
+
+        # Walk from the meeting cell back to the start, flip that leg, then walk forwards to the goal
+        positions = _walk_back(forward, meeting)
+        positions.reverse()
+        positions.extend(_walk_back(backward, meeting)[1:])
+        return Path(columns, positions), expanded
+
+
+class AStar:
+    """
+    Point-to-point shortest path search that always expands the cell with the lowest distance travelled plus
+    Manhattan distance left to the goal, and stops when the goal itself comes off the heap. On a maze the Manhattan
+    distance never overestimates, so the path is a shortest one, and cells leading away from the goal are only
+    expanded once the ones heading towards it run out.
+    """
+
+    @staticmethod
+    def solve(grid, start: "Cell", goal: "Cell") -> Tuple[Path, int]:
+        """
+        Return the path from start to goal along with the number of cells expanded to find it
+        """
+        source, target = _endpoints(grid, start, goal)
+        columns = grid.columns
+        link_mask_at = grid.link_mask_at
+        steps = ((NORTH, -columns), (SOUTH, columns), (EAST, 1), (WEST, -1))
+        goal_row, goal_column = goal.row, goal.column
+
+        parents = {source: source}
+        travelled = {source: 0}
+        closed = set()
+        # Entries are (estimate, -travelled, position), ties go to the cell that has come further
+        heap = [(abs(start.row - goal_row) + abs(start.column - goal_column), 0, source)]
+        expanded = 0
+
+        while heap:
+            _, _, position = heappop(heap)
+            if position in closed:
+                continue
+            if position == target:
+                positions = _walk_back(parents, target)
+                positions.reverse()
+                return Path(columns, positions), expanded
+
+            closed.add(position)
+            expanded += 1
+            distance = travelled[position] + 1
+            links = link_mask_at(position)
+            for direction, step in steps:
+                if links & direction:
+                    neighbor = position + step
+                    if neighbor not in closed and distance < travelled.get(
+                        neighbor, distance + 1
+                    ):
+                        travelled[neighbor] = distance
+                        parents[neighbor] = position
+                        row, column = divmod(neighbor, columns)
+                        estimate = (
+                            distance + abs(row - goal_row) + abs(column - goal_column)
+                        )
+                        heappush(heap, (estimate, -distance, neighbor))
+
+        raise Exception("Goal can't be reached from the start")
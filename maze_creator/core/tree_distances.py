@@ -0,0 +1,126 @@
+from array import array
+from typing import List, Union
+
+from maze_creator.core.distance_grid import UNREACHABLE, DistanceGrid
+from maze_creator.core.path import Path
+
+
+class TreeDistances:
+    """
+    Index for answering many distance and path questions on a perfect maze (one where the links form a spanning
+    tree, which is what every algorithm in algos produces).
+
+    A single breadth-first search from a root records each cell's depth and parent. On top of the parents we keep
+    binary lifting tables, ancestors[k][position] being the cell 2**k steps closer to the root, so the lowest common
+    ancestor of two cells is found in O(log n). In a tree the only route between two cells goes through their lowest
+    common ancestor, which gives
+        distance(a, b) = depth(a) + depth(b) - 2 * depth(lca(a, b))
+    and path(a, b) is just the two climbs up to the ancestor. The tables take about 4 * log2(depth) bytes per cell.
+
+    The answers are only shortest paths when the maze really is a tree, use DistanceGrid for mazes with loops.
+    """
+
+    grid: "Grid"
+    root: "Cell"
+    columns: int
+    depths: array  # Distance from the root to every position, UNREACHABLE if not connected to it
+    # ancestors[k][position] is the cell 2**k steps up from position, clamped at the root
+    ancestors: List[array]
+
+    def __init__(self, grid, root: Union["Cell", None] = None):
+        self.grid = grid
+        self.root = root if root is not None else next(grid.each_cell())
+        self.columns = grid.columns
+
+        search = DistanceGrid(grid, self.root, track_parents=True)
+        search.calc_distances()
+        self.depths = search.distances
+
+        # The root is its own parent, and so is anything the root can't reach, so the climbs below stop there
+        parents = search.parents
+        root_position = self._position(self.root)
+        parents[root_position] = root_position
+        if min(self.depths) == UNREACHABLE:
+            for position, depth in enumerate(self.depths):
+                if depth == UNREACHABLE:
+                    parents[position] = position
+
+        # Each level jumps twice as far as the one before: up[k][p] = up[k-1][up[k-1][p]]
+        self.ancestors = [parents]
+        for _ in range(1, max(max(self.depths).bit_length(), 1)):
+            previous = self.ancestors[-1]
+            self.ancestors.append(array("i", map(previous.__getitem__, previous)))
+
+    def _position(self, cell: "Cell") -> int:
+        if cell is None:
+            raise Exception("Cell doesn't exist or is blocked off")
+        return cell.row * self.columns + cell.column
+
+    def _climb(self, position: int, steps: int) -> int:
+        """
+        Return the position steps cells closer to the root
+        """
+        level = 0
+        while steps:
+            if steps & 1:
+                position = self.ancestors[level][position]
+            steps >>= 1
+            level += 1
+        return position
+
+    def _lowest_common_ancestor(self, first: int, second: int) -> int:
+        depths = self.depths
+        if depths[first] < depths[second]:
+            first, second = second, first
+
+        # Bring both positions to the same depth, then climb them together while their ancestors differ
+        first = self._climb(first, depths[first] - depths[second])
+        if first == second:
+            return first
+
+        for level in reversed(self.ancestors):
+            if level[first] != level[second]:
+                first, second = level[first], level[second]
+        return self.ancestors[0][first]
+
+    def _connected(self, first: int, second: int) -> bool:
+        return self.depths[first] != UNREACHABLE and self.depths[second] != UNREACHABLE
+
+    def distance(self, start: "Cell", goal: "Cell") -> Union[int, None]:
+        """
+        Number of steps between two cells, None if either of them can't be reached from the root
+        """
+        first, second = self._position(start), self._position(goal)
+        if not self._connected(first, second):
+            return None
+
+        ancestor = self._lowest_common_ancestor(first, second)
+        depths = self.depths
+        return depths[first] + depths[second] - 2 * depths[ancestor]
+
+    def path(self, start: "Cell", goal: "Cell") -> Path:
+        """
+        Route from start to goal, climbing from start up to their common ancestor and back down to goal
+        """
+        first, second = self._position(start), self._position(goal)
+        if not self._connected(first, second):
+            raise Exception("Cells aren't connected to each other")
+
+        ancestor = self._lowest_common_ancestor(first, second)
+        parents = self.ancestors[0]
+
+        # Climb from start up to the ancestor
+        positions = array("i", [first])
+        while first != ancestor:
+            first = parents[first]
+            positions.append(first)
+
+        # Climb from goal up to (but not including) the ancestor and append that leg reversed
+        descent = array("i")
+        while second != ancestor:
+            descent.append(second)
+            second = parents[second]
+        descent.reverse()
+        positions.extend(descent)
+
+        return Path(self.columns, positions)
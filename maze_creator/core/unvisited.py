@@ -0,0 +1,55 @@
+import random
+from array import array
+
+
+class UnvisitedCells:
+    """
+    Indexable set of the cells of a grid that haven't been visited yet. Cells are identified by their position
+    (row * columns + column). Positions live in a dense pool and each one remembers its slot in the pool, so
+    membership tests, removals and uniform random picks are all O(1).
+    """
+
+    columns: int
+    visited: bytearray  # 1 for cells that are visited or masked out of the grid
+    pool: array  # Dense array of the unvisited positions
+    slots: array  # Where each position currently sits in the pool
+
+    def __init__(self, grid):
+        self.columns = grid.columns
+        size = grid.rows * grid.columns
+        self.visited = bytearray(b"\x01") * size
+        self.pool = array("l")
+        self.slots = array("l", [-1]) * size
+
+        for cell in grid.each_cell():
+            position = cell.row * self.columns + cell.column
+            self.visited[position] = 0
+            self.slots[position] = len(self.pool)
+            self.pool.append(position)
+
+    def __len__(self) -> int:
+        return len(self.pool)
+
+    def __contains__(self, position: int) -> bool:
+        return not self.visited[position]
+
+    def visit(self, position: int) -> None:
+        """
+        Mark a position visited, moving the last entry of the pool into the slot it leaves behind
+        """
+        if self.visited[position]:
+            return
+
+        self.visited[position] = 1
+        slot = self.slots[position]
+        last = self.pool.pop()
+        if last != position:
+            self.pool[slot] = last
+            self.slots[last] = slot
+        self.slots[position] = -1
+
+    def random(self, rng=random) -> int:
+        """
+        Pick an unvisited position uniformly at random
+        """
+        return self.pool[rng.randrange(len(self.pool))]
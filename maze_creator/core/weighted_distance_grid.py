@@ -0,0 +1,74 @@
+from array import array
+from heapq import heappop, heappush
+
+from maze_creator.core.directions import EAST, NORTH, SOUTH, WEST
+from maze_creator.core.distance_grid import UNREACHABLE, DistanceGrid
+
+
+class WeightedDistanceGrid(DistanceGrid):
+    """
+    DistanceGrid where stepping into a cell costs that cell's weight (see Grid.set_weight) instead of 1, so the
+    distance field is the cheapest total cost from the root and path_to returns the cheapest route.
+
+    Distances are found with Dijkstra's algorithm over a binary heap. Each heap entry is a single int packing
+    cost * cells + position, which orders entries by cost exactly like a (cost, position) tuple but without building
+    a tuple per push. Parents are always tracked since, with weights, a neighbor one step closer to the root isn't
+    necessarily the one the cheapest route came from. With every weight left at 1 the distances match DistanceGrid.
+    """
+
+    def __init__(self, grid, cell: "Cell"):
+        super().__init__(grid, cell, track_parents=True)
+        # Costs can grow well past the step counts DistanceGrid stores, so widen the distances. Parents are cell
+        # positions, which still fit the narrower array.
+        self.distances = array("q", self.distances)
+
+    def calc_distances(self) -> None:
+        """
+        Dijkstra's algorithm out from the root over the grid's link masks and cell weights
+        """
+        columns = self.columns
+        cells = len(self.distances)
+        masks = self.grid.link_masks()
+        distances = self.distances
+        parents = self.parents
+        weights = self.grid.weights
+        if weights is None:
+            weights = array("i", [1]) * cells
+
+        heap = [self._position(self.root)]
+
+        while heap:
+            cost, position = divmod(heappop(heap), cells)
+            # Skip entries left behind after a cheaper route to the cell was found
+            if cost > distances[position]:
+                continue
+            links = masks[position]
+
+            if links & NORTH:
+                neighbor = position - columns
+                total = cost + weights[neighbor]
+                if distances[neighbor] == UNREACHABLE or total < distances[neighbor]:
+                    distances[neighbor] = total
+                    parents[neighbor] = position
+                    heappush(heap, total * cells + neighbor)
+            if links & SOUTH:
+                neighbor = position + columns
+                total = cost + weights[neighbor]
+                if distances[neighbor] == UNREACHABLE or total < distances[neighbor]:
+                    distances[neighbor] = total
+                    parents[neighbor] = position
+                    heappush(heap, total * cells + neighbor)
+            if links & EAST:
+                neighbor = position + 1
+                total = cost + weights[neighbor]
+                if distances[neighbor] == UNREACHABLE or total < distances[neighbor]:
+                    distances[neighbor] = total
+                    parents[neighbor] = position
+                    heappush(heap, total * cells + neighbor)
+            if links & WEST:
+                neighbor = position - 1
+                total = cost + weights[neighbor]
+                if distances[neighbor] == UNREACHABLE or total < distances[neighbor]:
+                    distances[neighbor] = total
+                    parents[neighbor] = position
+                    heappush(heap, total * cells + neighbor)
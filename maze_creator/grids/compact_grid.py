@@ -0,0 +1,275 @@
+from random import randint
+from typing import Generator, List, Union
+
+from maze_creator.core.directions import (
+    ALL_DIRECTIONS,
+    EAST,
+    NORTH,
+    OPPOSITE,
+    SOUTH,
+    WEST,
+    direction_between,
+)
+from maze_creator.core.mask import Mask
+from maze_creator.grids.grid import Grid
+
+# The low four bits of a cell's flags hold its link directions
+LINK_BITS = NORTH | SOUTH | EAST | WEST
+# Flag set on cells that have been masked out of the grid
+MASKED = 16
+
+# Translation table that strips everything but the link bits from a flag byte
+_LINKS_ONLY = bytes(value & LINK_BITS for value in range(256))
+# Translation table turning a flag byte into 1 for a cell of the grid and 0 for a masked one
+_PRESENT = bytes(not value & MASKED for value in range(256))
+# Translation table turning a mask's enabled cells (1 / 0) into starting flag bytes
+_MASKED_IF_DISABLED = bytes(0 if value else MASKED for value in range(256))
+
+
+class CompactCell:
+    """
+    Lightweight stand-in for a Cell that reads and writes its link state straight from a CompactGrid's flag
+    buffer. Views are created on demand and two views compare equal when they point at the same tile.
+    """
+
+    __slots__ = ("grid", "row", "column", "index")
+
+    def __init__(self, grid: "CompactGrid", row: int, column: int) -> None:
+        self.grid = grid
+        self.row = row
+        self.column = column
+        self.index = row * grid.columns + column
+
+    def __str__(self) -> str:
+        return f"Cell @ [row:{self.row}, col:{self.column}]"
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, CompactCell)
+            and other.index == self.index
+            and other.grid is self.grid
+        )
+
+    def __hash__(self) -> int:
+        return self.index
+
+    @property
+    def north(self) -> Union["CompactCell", None]:
+        return self.grid[self.row - 1, self.column]
+
+    @property
+    def south(self) -> Union["CompactCell", None]:
+        return self.grid[self.row + 1, self.column]
+
+    @property
+    def east(self) -> Union["CompactCell", None]:
+        return self.grid[self.row, self.column + 1]
+
+    @property
+    def west(self) -> Union["CompactCell", None]:
+        return self.grid[self.row, self.column - 1]
+
+    def _direction_to(self, other_cell: "CompactCell") -> int:
+        return direction_between(self.row, self.column, other_cell.row, other_cell.column)
+
+    def link(self, cell_to_link: "CompactCell", bidi: bool = True) -> None:
+        """
+        Link another cell to this one, and optionally bidirectionally link the cell we're about to link to this one
+        """
+        direction = self._direction_to(cell_to_link)
+        if not direction:
+            raise ValueError(f"{cell_to_link} is not a neighbor of {self}")
+
+        self.grid.flags[self.index] |= direction
+
+        if bidi:
+            self.grid.flags[cell_to_link.index] |= OPPOSITE[direction]
+
+    def unlink(self, cell_to_unlink: "CompactCell", bidi: bool = True) -> None:
+        """
+        Unlink another cell to this one, and optionally bidirectionally unlink the cell we're about to unlink to this one
+        """
+        direction = self._direction_to(cell_to_unlink)
+        if not direction:
+            return
+
+        self.grid.flags[self.index] &= ~direction
+
+        if bidi:
+            self.grid.flags[cell_to_unlink.index] &= ~OPPOSITE[direction]
+
+    def links(self) -> List["CompactCell"]:
+        """
+        Return all the cells linked to this cell
+        """
+        flags = self.grid.flags[self.index]
+        return [
+            self.grid._neighbor(self, direction)
+            for direction in ALL_DIRECTIONS
+            if flags & direction
+        ]
+
+    def link_count(self) -> int:
+        """
+        Return how many cells are linked to this one without building a list of them
+        """
+        return (self.grid.flags[self.index] & LINK_BITS).bit_count()
+
+    def is_visited(self) -> bool:
+        """
+        Returns T/F if the cell has been linked to anything yet (i.e. a maze algorithm has visited it)
+        """
+        return bool(self.grid.flags[self.index] & LINK_BITS)
+
+    def is_linked(self, other_cell: Union["CompactCell", None]) -> bool:
+        """
+        Returns T/F if the other_cell is linked to this one
+        """
+        if other_cell is None:
+            return False
+
+        direction = self._direction_to(other_cell)
+        return bool(direction and self.grid.flags[self.index] & direction)
+
+    def neighbors(self) -> List["CompactCell"]:
+        """
+        Return each of the immediate neighbor cells to this cell, regardless if they are linked to cell or not
+        """
+        neighbors = []
+        for direction in ALL_DIRECTIONS:
+            neighbor = self.grid._neighbor(self, direction)
+            if neighbor:
+                neighbors.append(neighbor)
+
+        return neighbors
+
+
+class CompactGrid(Grid):
+    """
+    Grid that keeps every cell as a single byte in a flat, row-major bytearray instead of a graph of Cell
+    objects. The low four bits hold the NORTH/SOUTH/EAST/WEST links and the MASKED bit marks cells that are
+    not part of the maze. Cells handed out by the grid are CompactCell views over that buffer, so the
+    algorithms, Distances and MazeImageCreator can run on it unchanged.
+    """
+
+    flags: bytearray
+
+    def _prepare_grid(self) -> None:
+        """
+        Allocate one zeroed byte per cell, every cell starts with no links
+        """
+        self.flags = bytearray(self.rows * self.columns)
+
+    def _configure_cells(self) -> None:
+        """
+        Neighbors are derived from a cell's position on demand, so there is nothing to wire up
+        """
+        pass
+
+    def __getitem__(self, tup) -> Union[CompactCell, None]:
+        """
+        Return a view of the cell at Grid[row, column], or None if it's outside the grid or masked out
+        """
+        y, x = tup
+        if 0 <= y <= (self.rows - 1) and 0 <= x <= (self.columns - 1):
+            if not self.flags[y * self.columns + x] & MASKED:
+                return CompactCell(self, y, x)
+        return None
+
+    def _neighbor(self, cell: CompactCell, direction: int) -> Union[CompactCell, None]:
+        if direction == NORTH:
+            return self[cell.row - 1, cell.column]
+        if direction == SOUTH:
+            return self[cell.row + 1, cell.column]
+        if direction == EAST:
+            return self[cell.row, cell.column + 1]
+        if direction == WEST:
+            return self[cell.row, cell.column - 1]
+        return None
+
+    def merge_link_masks(self, masks: bytes, first_row: int = 0) -> None:
+        """
+        OR a row-major buffer of link direction masks (see core.link_buffers) straight into the flag buffer,
+        starting at first_row. Both sides of every link must already be present in the buffer.
+        """
+        start = first_row * self.columns
+        end = start + len(masks)
+        merged = int.from_bytes(self.flags[start:end], "little") | int.from_bytes(
+            masks, "little"
+        )
+        self.flags[start:end] = merged.to_bytes(end - start, "little")
+
+    def link_masks(self, first_row: int = 0, row_count: Union[int, None] = None) -> bytes:
+        """
+        Return a row-major buffer holding every cell's link direction mask, masked cells have no links.
+        Pass first_row / row_count to only get a band of rows.
+        """
+        if first_row == 0 and row_count is None:
+            return bytes(self.flags.translate(_LINKS_ONLY))
+        end = self.rows if row_count is None else first_row + row_count
+        band = self.flags[first_row * self.columns : end * self.columns]
+        return bytes(band.translate(_LINKS_ONLY))
+
+    def present_cells(self) -> bytes:
+        """
+        Return a row-major buffer holding 1 for every cell of the grid and 0 where a cell is masked out
+        """
+        return bytes(self.flags.translate(_PRESENT))
+
+    def link_mask_at(self, position: int) -> int:
+        """
+        Return the link direction mask of the cell at row-major position, masked cells have no links
+        """
+        return self.flags[position] & LINK_BITS
+
+    # Utility functions
+    def random_cell(self) -> CompactCell:
+        """
+        Return a random cell from the Grid
+        """
+        return CompactCell(self, randint(0, self.rows - 1), randint(0, self.columns - 1))
+
+    # Iterators
+    def each_row(self) -> Generator[List[Union[CompactCell, None]], None, None]:
+        """
+        Generator function for each row, masked cells are returned as None
+        """
+        for row in range(self.rows):
+            yield [self[row, column] for column in range(self.columns)]
+
+    def each_cell(self) -> Generator[CompactCell, None, None]:
+        """
+        Generator function for each cell
+        """
+        for row in self.each_row():
+            for cell in row:
+                if cell is not None:
+                    yield cell
+
+
+class MaskedCompactGrid(CompactGrid):
+    """
+    CompactGrid whose cells are switched off wherever the supplied mask is disabled
+    """
+
+    def __init__(self, mask: Mask):
+        self.mask = mask
+        super().__init__(mask.rows, mask.columns)
+
+    def _prepare_grid(self) -> None:
+        """
+        Allocate the flag buffer and set the MASKED bit on every cell that is not enabled in the mask
+        """
+        self.flags = bytearray(self.mask.enabled_cells().translate(_MASKED_IF_DISABLED))
+
+    def random_cell(self) -> CompactCell:
+        row, col = self.mask.random_location()
+        return CompactCell(self, row, col)
+
+    def size(self) -> int:
+        return self.mask.count()
+
+
+if __name__ == "__main__":
+    test = CompactGrid(10, 10)
+    print(test)
@@ -1,7 +1,9 @@
+from array import array
 from random import randint
 from typing import Generator, List, Union
 
 from maze_creator.core.cells import Cell
+from maze_creator.visuals.text_renderer import TextRenderer
 
 
 class Grid:
@@ -13,10 +15,13 @@ class Grid:
     rows: int
     columns: int
     grid: List[List["Cell"]]
+    # Cost of stepping into each cell (row-major), None until the first weight is set and every cell costs 1
+    weights: Union[array, None]
 
     def __init__(self, rows, columns):
         self.rows = rows
         self.columns = columns
+        self.weights = None
         self._prepare_grid()
         self._configure_cells()
 
@@ -28,46 +33,11 @@ class Grid:
 
     def __str__(self) -> str:
         """
-        Provide a pretty ASCII representation of the grid
+        Provide a pretty ASCII representation of the grid, see TextRenderer to write it out without building a string
         """
-        # Draw the top border
-        output = "+" + "---+" * self.columns + "\n"
-
-        for row in self.each_row():
-            # Because every cell generates its own southern and eastern borders we don't have to worry about
-            # western or northern borders
-            top = "|"  # Start of the eastern border
-            bottom = "+"  # Start of the southern border
-
-            for cell in row:
-                # Every cell is three spaces wide
-                body = f" {self.contents_of_cell(cell)} "
-                # If the cell is linked to the east add a space (open passage) otherwise add a pipe to represent wall
-                east_boundary = (
-                    " "
-                    if isinstance(cell, Cell)
-                    and hasattr(cell, "east")
-                    and cell.is_linked(cell.east)
-                    else "|"
-                )
-                top += body + east_boundary
-                # If the cell is linked to the south add three spaces (open passage)
-                # otherwise add vertical bars for wall
-                south_boundary = (
-                    "   "
-                    if isinstance(cell, Cell)
-                    and hasattr(cell, "south")
-                    and cell.is_linked(cell.south)
-                    else "---"
-                )
-                corner = "+"
-                bottom += south_boundary + corner
-
-            # Update output after each row has been visited
-            output += top + "\n"
-            output += bottom + "\n"
-
-        return output
+        # Only bother asking about every cell when a subclass has something to put in them
+        overridden = type(self).contents_of_cell is not Grid.contents_of_cell
+        return TextRenderer(self, self.contents_of_cell if overridden else None).render()
 
     def __getitem__(self, tup) -> Union["Cell", None]:
         """
@@ -96,10 +66,65 @@ class Grid:
                     row, column = c.row, c.column
 
                     # See __getitem__ for details on how this is implemented
-                    c.north = self[row - 1, column]
-                    c.south = self[row + 1, column]
-                    c.east = self[row, column + 1]
-                    c.west = self[row, column - 1]
+                    c.set_neighbors(
+                        self[row - 1, column],
+                        self[row + 1, column],
+                        self[row, column + 1],
+                        self[row, column - 1],
+                    )
+
+    def merge_link_masks(self, masks: bytes, first_row: int = 0) -> None:
+        """
+        OR a row-major buffer of link direction masks (see core.link_buffers) into the cells of the grid,
+        starting at first_row. Both sides of every link must already be present in the buffer.
+        """
+        cells = (cell for row in self.grid[first_row:] for cell in row)
+        for cell, mask in zip(cells, masks):
+            if cell is not None and mask:
+                cell.link_mask |= mask
+
+    def link_masks(self, first_row: int = 0, row_count: Union[int, None] = None) -> bytes:
+        """
+        Return a row-major buffer holding every cell's link direction mask, masked cells have no links.
+        Pass first_row / row_count to only get a band of rows.
+        """
+        end = self.rows if row_count is None else first_row + row_count
+        return bytes(
+            cell.link_mask if cell is not None else 0
+            for row in self.grid[first_row:end]
+            for cell in row
+        )
+
+    def present_cells(self) -> bytes:
+        """
+        Return a row-major buffer holding 1 for every cell of the grid and 0 where a cell is masked out
+        """
+        return bytes(cell is not None for row in self.grid for cell in row)
+
+    def link_mask_at(self, position: int) -> int:
+        """
+        Return the link direction mask of the cell at row-major position, masked cells have no links
+        """
+        cell = self.grid[position // self.columns][position % self.columns]
+        return cell.link_mask if cell is not None else 0
+
+    def set_weight(self, cell: "Cell", weight: int) -> None:
+        """
+        Set the cost of stepping into a cell, e.g. to make some terrain more expensive to cross
+        """
+        if weight < 0:
+            raise Exception("Cell weights can't be negative")
+        if self.weights is None:
+            self.weights = array("i", [1]) * (self.rows * self.columns)
+        self.weights[cell.row * self.columns + cell.column] = weight
+
+    def get_weight(self, cell: "Cell") -> int:
+        """
+        Get the cost of stepping into a cell
+        """
+        if self.weights is None:
+            return 1
+        return self.weights[cell.row * self.columns + cell.column]
 
     # Utility functions
     def random_cell(self) -> "Cell":
@@ -128,7 +153,7 @@ class Grid:
         """
         for row in self.grid:
             for cell in row:
-                if isinstance(cell, Cell):
+                if cell is not None:
                     yield cell
 
 
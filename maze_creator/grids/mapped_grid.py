@@ -0,0 +1,287 @@
+"""
+A compact on-disk format for carved mazes, and a read-only grid that works straight off a memory mapped file.
+
+Layout (all little-endian):
+
+    header      MAGIC, format version, flags (HAS_MASK), 2 padding bytes, rows and columns as 32-bit ints
+    link plane  2 bits per cell, the low one set for a SOUTH link and the high one for an EAST link. Cells are
+                packed 4 to a byte from the least significant bits up, each row starts on a fresh byte.
+    mask plane  only with HAS_MASK, 1 bit per cell set when the cell is part of the grid, 8 cells to a byte and
+                each row starting on a fresh byte
+
+NORTH and WEST links are the SOUTH / EAST links of the neighbors, so they aren't stored.
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from itertools import compress
+from random import randint
+from typing import List, Tuple, Union
+
+from maze_creator.core.directions import EAST, NORTH, SOUTH, WEST
+from maze_creator.core.link_buffers import add_reciprocal_links
+from maze_creator.grids.compact_grid import LINK_BITS, MASKED, CompactCell, CompactGrid
+from maze_creator.grids.grid import Grid
+
+MAGIC = b"MAZE"
+VERSION = 1
+# Header flag set when the file carries a mask plane
+HAS_MASK = 1
+HEADER = struct.Struct("<4sBB2xII")
+
+# Translation table turning a link mask into its 2 bit code
+_CODES = bytes(bool(value & SOUTH) | bool(value & EAST) << 1 for value in range(256))
+# Translation tables turning a packed byte into the SOUTH / EAST links of the cell in each of its 4 slots
+_SLOT_LINKS = [
+    bytes(
+        (SOUTH if value >> 2 * slot & 1 else 0) | (EAST if value >> 2 * slot & 2 else 0)
+        for value in range(256)
+    )
+    for slot in range(4)
+]
+# Translation tables turning a packed mask byte into 1 / 0 for the cell in each of its 8 slots
+_SLOT_PRESENT = [bytes(value >> slot & 1 for value in range(256)) for slot in range(8)]
+
+
+def _row_bytes(columns: int, per_byte: int) -> int:
+    return -(-columns // per_byte)
+
+
+def _pack(values: bytes, rows: int, columns: int, per_byte: int) -> bytes:
+    """
+    Pack a row-major buffer of small values (2 bits with 4 per byte, or 1 bit with 8 per byte) into whole bytes
+    per row. Each slot of the output is a big-integer of every per_byte-th value shifted into place, since none
+    of the values spill out of their byte the slots can simply be ORed together.
+    """
+    width = per_byte * _row_bytes(columns, per_byte)
+    if width != columns:
+        padding = bytes(width - columns)
+        values = b"".join(
+            values[row * columns : (row + 1) * columns] + padding for row in range(rows)
+        )
+
+    bits = 8 // per_byte
+    packed = 0
+    for slot in range(per_byte):
+        packed |= int.from_bytes(values[slot::per_byte], "little") << (bits * slot)
+    return packed.to_bytes(len(values) // per_byte, "little")
+
+
+def _unpack(packed: bytes, tables: List[bytes], rows: int, columns: int) -> bytes:
+    """
+    Reverse of _pack, one translate per slot spreads the packed bytes back out to a value per cell
+    """
+    per_byte = len(tables)
+    values = bytearray(per_byte * len(packed))
+    for slot, table in enumerate(tables):
+        values[slot::per_byte] = packed.translate(table)
+
+    width = per_byte * _row_bytes(columns, per_byte)
+    if width == columns:
+        return bytes(values)
+    return b"".join(values[row * width : row * width + columns] for row in range(rows))
+
+
+class _PackedFlags:
+    """
+    Read-only stand-in for a CompactGrid's flag buffer, decoding a single cell's flags from the packed planes
+    whenever CompactCell asks for them
+    """
+
+    def __init__(self, grid: "MappedGrid"):
+        self.grid = grid
+
+    def __len__(self) -> int:
+        return self.grid.rows * self.grid.columns
+
+    def _code(self, row: int, column: int) -> int:
+        grid = self.grid
+        packed = grid._map[grid._links_offset + row * grid._links_stride + column // 4]
+        return packed >> 2 * (column % 4) & 3
+
+    def __getitem__(self, index: int) -> int:
+        grid = self.grid
+        row, column = divmod(index, grid.columns)
+
+        code = self._code(row, column)
+        flags = (SOUTH if code & 1 else 0) | (EAST if code & 2 else 0)
+        if row and self._code(row - 1, column) & 1:
+            flags |= NORTH
+        if column and self._code(row, column - 1) & 2:
+            flags |= WEST
+
+        if grid._mask_offset is not None:
+            packed = grid._map[grid._mask_offset + row * grid._mask_stride + column // 8]
+            if not packed >> column % 8 & 1:
+                flags |= MASKED
+        return flags
+
+    def __setitem__(self, index: int, value: int) -> None:
+        raise Exception("Mapped grids are read only")
+
+
+class MappedGrid(CompactGrid):
+    """
+    Read-only CompactGrid backed by a memory mapped maze file (see MappedGrid.save). Nothing is copied on load,
+    so any number of processes opening the same file share one copy of it through the page cache. Cells look up
+    their links in the file on demand, and bulk reads (link_masks, present_cells) decode just the rows they
+    cover. Linking or unlinking cells raises.
+    """
+
+    def __init__(self, file):
+        self.path = os.path.abspath(file)
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            rows, columns = self._read_header()
+        except Exception:
+            self._map.close()
+            raise
+
+        self._size = None
+        # Positions of every cell that's part of a masked grid, worked out on first use
+        self._index = None
+        super().__init__(rows, columns)
+
+    def _read_header(self) -> Tuple[int, int]:
+        """
+        Check the header against the file and work out where the planes sit, returning (rows, columns)
+        """
+        if len(self._map) < HEADER.size:
+            raise Exception("Not a maze file")
+        magic, version, flags, rows, columns = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise Exception("Not a maze file")
+        if version != VERSION:
+            raise Exception("Maze file version not supported")
+
+        self._links_offset = HEADER.size
+        self._links_stride = _row_bytes(columns, 4)
+        self._mask_offset = None
+        self._mask_stride = _row_bytes(columns, 8)
+        end = self._links_offset + rows * self._links_stride
+        if flags & HAS_MASK:
+            self._mask_offset = end
+            end += rows * self._mask_stride
+        if len(self._map) != end:
+            raise Exception("Maze file is the wrong size for its header")
+
+        return rows, columns
+
+    def __reduce__(self):
+        # Worker processes reopen the file rather than receiving a copy of it
+        return MappedGrid, (self.path,)
+
+    def _prepare_grid(self) -> None:
+        self.flags = _PackedFlags(self)
+
+    def close(self) -> None:
+        """
+        Release the mapping, the grid can't be used afterwards
+        """
+        self._map.close()
+
+    def _mask_plane(self) -> bytes:
+        return self._map[
+            self._mask_offset : self._mask_offset + self.rows * self._mask_stride
+        ]
+
+    def merge_link_masks(self, masks: bytes, first_row: int = 0) -> None:
+        raise Exception("Mapped grids are read only")
+
+    def link_masks(self, first_row: int = 0, row_count: Union[int, None] = None) -> bytes:
+        """
+        Return a row-major buffer holding every cell's link direction mask, masked cells have no links.
+        Pass first_row / row_count to only decode a band of rows.
+        """
+        end = self.rows if row_count is None else min(self.rows, first_row + row_count)
+        if end <= first_row:
+            return b""
+
+        # The row above the band is decoded too, its SOUTH links are the band's NORTH links
+        start = max(first_row - 1, 0)
+        offset, stride = self._links_offset, self._links_stride
+        packed = self._map[offset + start * stride : offset + end * stride]
+        masks = _unpack(packed, _SLOT_LINKS, end - start, self.columns)
+        # SOUTH links out of the band's last row fall off the end of the buffer
+        masks = add_reciprocal_links(masks, self.columns)
+        return masks[(first_row - start) * self.columns :]
+
+    def present_cells(self) -> bytes:
+        """
+        Return a row-major buffer holding 1 for every cell of the grid and 0 where a cell is masked out
+        """
+        if self._mask_offset is None:
+            return b"\x01" * (self.rows * self.columns)
+        return _unpack(self._mask_plane(), _SLOT_PRESENT, self.rows, self.columns)
+
+    def link_mask_at(self, position: int) -> int:
+        """
+        Return the link direction mask of the cell at row-major position, masked cells have no links
+        """
+        return self.flags[position] & LINK_BITS
+
+    def _present_index(self) -> array:
+        """
+        Positions of every cell that's part of the grid in row-major order, the file is read only so it's built once
+        """
+        if self._index is None:
+            cells = self.present_cells()
+            self._index = array("i", compress(range(len(cells)), cells))
+        return self._index
+
+    def random_cell(self) -> CompactCell:
+        """
+        Return a random cell that's part of the grid, in constant time however sparse the mask is
+        """
+        if self._mask_offset is None:
+            return self[randint(0, self.rows - 1), randint(0, self.columns - 1)]
+
+        index = self._present_index()
+        if not index:
+            raise Exception("Grid has no cells")
+        return self[divmod(index[randint(0, len(index) - 1)], self.columns)]
+
+    def size(self) -> int:
+        """
+        Number of cells that are part of the grid
+        """
+        if self._size is None:
+            if self._mask_offset is None:
+                self._size = self.rows * self.columns
+            else:
+                # Padding bits are never set, so counting every set bit counts the cells
+                self._size = int.from_bytes(self._mask_plane(), "little").bit_count()
+        return self._size
+
+    @staticmethod
+    def save(grid: Grid, file) -> None:
+        """
+        Write any grid (Grid, MaskedGrid or the compact ones) to a maze file. The mask plane is only written when
+        some cell is masked out.
+        """
+        rows, columns = grid.rows, grid.columns
+        links = _pack(grid.link_masks().translate(_CODES), rows, columns, 4)
+        present = grid.present_cells()
+        masked = present.find(0) != -1
+
+        # Written next to the target and moved into place, so grids still mapping an older version of the file
+        # keep reading it rather than seeing it truncated underneath them
+        path = os.path.abspath(file)
+        partial = path + ".partial"
+        with open(partial, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, HAS_MASK if masked else 0, rows, columns))
+            f.write(links)
+            if masked:
+                f.write(_pack(present, rows, columns, 8))
+        os.replace(partial, path)
+
+    @staticmethod
+    def from_file(file) -> "MappedGrid":
+        """
+        Open a maze file written by MappedGrid.save
+        """
+        return MappedGrid(file)
@@ -1,8 +1,13 @@
+from typing import Union
+
 from maze_creator.algos.aldousbroder import AldousBroder
 from maze_creator.algos.huntandkill import HuntAndKill
+from maze_creator.algos.hybrid import AldousBroderWilson
 from maze_creator.algos.recursivebacktracker import RecursiveBackTracker
 from maze_creator.algos.wilson import Wilson
 from maze_creator.core.mask import Mask
+from maze_creator.core.tree_distances import TreeDistances
+from maze_creator.grids.compact_grid import MaskedCompactGrid
 from maze_creator.grids.masked_grid import MaskedGrid
 from maze_creator.views.distances_view import DistancesView
 from maze_creator.views.path_finder_view import PathFinderView
@@ -12,10 +17,13 @@ from maze_creator.visuals.maze_image_creator import MazeImageCreator, ColorChoic
 # TODO: Combine this with Maze class and determine which algorithms still work with masking
 class MaskedMaze:
 
-    def __init__(self, mask, type):
-        self.grid = MaskedGrid(mask)
+    def __init__(
+        self, mask, type, compact: bool = False, switch_at: Union[float, None] = None
+    ):
+        self.grid = MaskedCompactGrid(mask) if compact else MaskedGrid(mask)
         self.rows = mask.rows
         self.columns = mask.columns
+        self._tree_distances = None
 
         if type == "recursive":
             self.grid = RecursiveBackTracker.create_maze(self.grid)
@@ -31,9 +39,19 @@ class MaskedMaze:
             raise Exception("Masked grids can't use sidewinder algorithm.")
         elif type == "wilson":
             self.grid = Wilson.create_maze(self.grid)
+        elif type == "hybrid":
+            self.grid = AldousBroderWilson.create_maze(self.grid, switch_at)
         else:
             raise Exception("Maze type not recognized")
 
+    def tree_distances(self) -> TreeDistances:
+        """
+        Distance index over the maze, built on first use and shared by every query after that
+        """
+        if self._tree_distances is None:
+            self._tree_distances = TreeDistances(self.grid)
+        return self._tree_distances
+
     def __str__(self):
         return self.grid.__str__()
 
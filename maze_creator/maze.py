@@ -1,13 +1,20 @@
+from typing import Union
+
+from maze_creator.algos.aldousbroder import AldousBroder
+from maze_creator.algos.binarytree import BinaryTree
+from maze_creator.algos.huntandkill import HuntAndKill
+from maze_creator.algos.hybrid import AldousBroderWilson
+from maze_creator.algos.recursivebacktracker import RecursiveBackTracker
+from maze_creator.algos.sidewinder import SideWinder
+from maze_creator.algos.wilson import Wilson
+from maze_creator.core.tree_distances import TreeDistances
+from maze_creator.grids.compact_grid import CompactGrid
 from maze_creator.grids.grid import Grid
-from algos.aldousbroder import AldousBroder
-from algos.binarytree import BinaryTree
-from algos.huntandkill import HuntAndKill
-from algos.recursivebacktracker import RecursiveBackTracker
-from algos.sidewinder import SideWinder
-from algos.wilson import Wilson
+from maze_creator.grids.mapped_grid import MappedGrid
 from maze_creator.views.path_finder_view import PathFinderView
 from maze_creator.views.distances_view import DistancesView
-from visuals.maze_image_creator import MazeImageCreator, ColorChoice
+from maze_creator.visuals.maze_image_creator import MazeImageCreator, ColorChoice
+from maze_creator.visuals.text_parser import TextParser
 
 # Maze = Grid + Algorithm
 # MaskedMaze = MaskedGrid + Algorithm
@@ -25,9 +32,13 @@ class Maze:
         columns: int = 10,
         type: str = "Binary",
         horizontal_bias: float = 0.5,
+        compact: bool = False,
+        switch_at: Union[float, None] = None,
     ):
-        self.grid = Grid(rows, columns)
+        # The compact grid trades Cell objects for one byte per cell, use it for very large mazes
+        self.grid = CompactGrid(rows, columns) if compact else Grid(rows, columns)
         self.type = type.lower()
+        self._tree_distances = None
 
         if self.type == "aldous":
             self.grid = AldousBroder.create_maze(self.grid)
@@ -41,9 +52,44 @@ class Maze:
             self.grid = SideWinder.create_maze(self.grid, horizontal_bias)
         elif self.type == "wilson":
             self.grid = Wilson.create_maze(self.grid)
+        elif self.type == "hybrid":
+            self.grid = AldousBroderWilson.create_maze(self.grid, switch_at)
         else:
             raise Exception("Maze type not recognized")
 
+    def tree_distances(self) -> TreeDistances:
+        """
+        Distance index over the maze, built on first use and shared by every query after that
+        """
+        if self._tree_distances is None:
+            self._tree_distances = TreeDistances(self.grid)
+        return self._tree_distances
+
+    @staticmethod
+    def from_grid(grid: Grid) -> "Maze":
+        """
+        Wrap a grid that's already been carved (e.g. one loaded from a file) so views and image creators can use it
+        """
+        maze = Maze.__new__(Maze)
+        maze.grid = grid
+        maze.type = "loaded"
+        maze._tree_distances = None
+        return maze
+
+    @staticmethod
+    def from_txt(file, compact: bool = False) -> "Maze":
+        """
+        Load a maze from a text file holding an ASCII drawing like str(maze) produces, see TextParser
+        """
+        return Maze.from_grid(TextParser.from_txt(file, compact))
+
+    @staticmethod
+    def from_file(file) -> "Maze":
+        """
+        Open a maze saved with MappedGrid.save, the grid is read-only and shares the file through a memory map
+        """
+        return Maze.from_grid(MappedGrid.from_file(file))
+
     def __str__(self):
         return self.grid.__str__()
 
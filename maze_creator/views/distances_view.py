@@ -1,31 +1,50 @@
-from typing import List
+from typing import List, Sequence, Tuple, Union
 
 from maze_creator.core.cells import Cell
-from maze_creator.core.distances import Distances
+from maze_creator.core.distance_fields import MultiSourceDistanceGrid
+from maze_creator.core.distance_grid import DistanceGrid
 
 
 class DistancesView:
     """
-    Given a grid and cell coordinates, colors all cells according how far they are from the starting cell
+    Given a grid and cell coordinates, colors all cells according how far they are from the starting cell.
+    Passing sources, a list of (row, column) pairs, colors cells by how far they are from the nearest of them instead.
     """
 
     grid: List[List["Cell"]]
     cell: Cell
-    distances: Distances
+    distances: DistanceGrid
     max: int
     columns: int
     rows: int
 
-    def __init__(self, maze, row: 0, column: 0):
+    def __init__(
+        self,
+        maze,
+        row: 0,
+        column: 0,
+        sources: Union[Sequence[Tuple[int, int]], None] = None,
+    ):
         self.grid = maze.grid
         self.cell = self.grid[row, column]
-        self.calculate_distances(self.cell)
+        if sources:
+            self.calculate_nearest_distances([self.grid[source] for source in sources])
+        else:
+            self.calculate_distances(self.cell)
 
     def calculate_distances(self, cell) -> None:
         """
         Calculate all the distances from the supplied cell
         """
         # Calculate all the distances from the target cell to everywhere else in the graph
-        self.distances = Distances(cell)
+        self.distances = DistanceGrid(self.grid, cell)
+        self.distances.calc_distances()
+        _, self.max = self.distances.max()
+
+    def calculate_nearest_distances(self, cells: List["Cell"]) -> None:
+        """
+        Calculate the distance from every cell to the nearest of the supplied cells
+        """
+        self.distances = MultiSourceDistanceGrid(self.grid, cells)
         self.distances.calc_distances()
         _, self.max = self.distances.max()
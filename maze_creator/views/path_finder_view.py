@@ -1,16 +1,27 @@
 from typing import Union
 
-from maze_creator.core.cells import Cell
-from maze_creator.core.distances import Distances
+from maze_creator.core.distance_grid import DistanceGrid
+from maze_creator.core.solvers import AStar, BidirectionalBFS
+from maze_creator.core.weighted_distance_grid import WeightedDistanceGrid
+from maze_creator.visuals.text_renderer import TextRenderer
 
 
 # Views are applied on top of existing mazes
 class PathFinderView:
     """
-    Find the path between two different cells in a maze
+    Find the path between two different cells in a maze.
+
+    The solver picks how the path is found:
+        "bfs": breadth-first search over the whole maze, which also leaves the distance to every cell in distances
+        "dijkstra": like bfs but finds the cheapest path through weighted cells (see Grid.set_weight)
+        "tree": the maze's shared TreeDistances index, much cheaper when asking about many pairs in the same maze
+        "bidirectional": breadth-first search from both ends that stops when the two meet
+        "astar": A* search guided by the Manhattan distance to the goal
+    The last two only explore the cells around the route, nodes_expanded records how many cells they expanded.
     """
 
-    distances: Union[Distances, None]
+    distances: Union[DistanceGrid, None]
+    nodes_expanded: Union[int, None]
 
     path_distance = Union[int, None]
 
@@ -21,67 +32,50 @@ class PathFinderView:
         starting_cell_column,
         ending_cell_row,
         ending_cell_column,
+        solver: str = "bfs",
     ):
         self.grid = maze.grid
         self.starting_cell = self.grid[starting_cell_row, starting_cell_column]
-        self.distances = Distances(self.starting_cell)
-        self.distances.calc_distances()
         self.ending_cell = self.grid[ending_cell_row, ending_cell_column]
-        self.path = self.distances.path_to(self.ending_cell)
-        self.path_distance = self.distances.get_cell_distance(self.ending_cell)
+        self.distances = None
+        self.nodes_expanded = None
+        solver = solver.lower()
+
+        if solver == "bfs":
+            self.distances = DistanceGrid(
+                self.grid, self.starting_cell, track_parents=True
+            )
+            self.distances.calc_distances()
+            self.path = self.distances.path_to(self.ending_cell)
+        elif solver == "dijkstra":
+            self.distances = WeightedDistanceGrid(self.grid, self.starting_cell)
+            self.distances.calc_distances()
+            self.path = self.distances.path_to(self.ending_cell)
+        elif solver == "tree":
+            self.path = maze.tree_distances().path(self.starting_cell, self.ending_cell)
+        elif solver == "bidirectional":
+            self.path, self.nodes_expanded = BidirectionalBFS.solve(
+                self.grid, self.starting_cell, self.ending_cell
+            )
+        elif solver == "astar":
+            self.path, self.nodes_expanded = AStar.solve(
+                self.grid, self.starting_cell, self.ending_cell
+            )
+        else:
+            raise Exception("Solver not recognized")
+        self.path_distance = self.path.distance()
 
     def __str__(self) -> str:
         """
-        Provide a pretty ASCII representation of the grid
+        Provide a pretty ASCII representation of the grid with the path marked out
         """
-        # Draw the top border
-        output = "+" + "---+" * self.grid.columns + "\n"
-
-        for row in self.grid.each_row():
-            # Because every cell generates its own southern and eastern borders we don't have to worry about
-            # western or northern borders
-            top = "|"  # Start of the eastern border
-            bottom = "+"  # Start of the southern border
-
-            for cell in row:
-                # Skip cells that are masked
-                if cell is None:
-                    continue
-
-                # Every cell is three spaces wide
-                body = f" {self.contents_of_cell(cell)} "
-                # If the cell is linked to the east add a space (open passage) otherwise add a pipe to represent wall
-                east_boundary = (
-                    " "
-                    if isinstance(cell, Cell)
-                    and hasattr(cell, "east")
-                    and cell.is_linked(cell.east)
-                    else "|"
-                )
-                top += body + east_boundary
-                # If the cell is linked to the south add three spaces (open passage)
-                # otherwise add vertical bars for wall
-                south_boundary = (
-                    "   "
-                    if isinstance(cell, Cell)
-                    and hasattr(cell, "south")
-                    and cell.is_linked(cell.south)
-                    else "---"
-                )
-                corner = "+"
-                bottom += south_boundary + corner
-
-            # Update output after each row has been visited
-            output += top + "\n"
-            output += bottom + "\n"
-
-        return output
+        return TextRenderer(self.grid, self.contents_of_cell).render()
 
     def contents_of_cell(self, cell) -> str:
         """
         Helper function to pick what each cell should be displayed as in string representation.
         """
-        if self.path and self.path.get_cell_distance(cell) is not None:
+        if self.path and cell in self.path:
             # Use asterix to record spots in
             return "*"
         else:
@@ -1,13 +1,26 @@
+from io import BytesIO
+
 from PIL import Image, ImageDraw, ImageOps
 
+from maze_creator.visuals.palettes import (
+    ColorChoice,
+    distance_level,
+    heatmap_rgb,
+    palette_for,
+)
+from maze_creator.visuals.png_writer import PNGWriter
+from maze_creator.visuals.wall_runs import horizontal_wall_runs, vertical_wall_runs
+
+# Width in pixels of the black frame put around every rendered maze
+BORDER = 10
 
-class ColorChoice:
-    BLUE = 1
-    DARKGREEN = 2
-    PURPLE = 3
-    GREEN = 4
-    RED = 5
-    YELLOW = 6
+# Background colors for the "openings" mode, keyed by how many links a cell has
+OPENINGS_COLORS = {
+    4: (0, 204, 0),
+    3: (51, 255, 51),
+    2: (153, 255, 153),
+    1: (255, 255, 255),
+}
 
 
 # TODO: Need to figure out a class hierarchy that can deal with this
@@ -31,36 +44,63 @@ class MazeImageCreator:
         if self.type == "bw":
             return None
         elif self.type == "path":
-            if self.maze.path and self.maze.path.get_cell_distance(cell) is not None:
+            if self.maze.path and cell in self.maze.path:
                 return 200, 200, 200
         elif self.type == "distance":
             distance = self.maze.distances.get_cell_distance(cell)
-            intensity = (self.maze.max - distance) / self.maze.max
-            dark = 255 * intensity
-            bright = 128 + (127 * intensity)
-            # We can vary these
-            if color_choice == ColorChoice.BLUE:
-                return int(intensity), int(dark), int(bright)
-            elif color_choice == ColorChoice.DARKGREEN:
-                return int(intensity), int(bright), int(dark)
-            elif color_choice == ColorChoice.PURPLE:
-                return int(dark), int(intensity), int(bright)
-            elif color_choice == ColorChoice.GREEN:
-                return int(dark), int(bright), int(intensity)
-            elif color_choice == ColorChoice.RED:
-                return int(bright), int(intensity), int(dark)
-            elif color_choice == ColorChoice.YELLOW:
-                return int(bright), int(dark), int(intensity)
+            return self.distance_color(distance, color_choice)
         # Color by number of openings
         elif self.type == "openings":
-            num_of_neighbors = len(cell.links())
-            openings_color_map = {
-                4: (0, 204, 0),
-                3: (51, 255, 51),
-                2: (153, 255, 153),
-                1: (255, 255, 255),
-            }
-            return openings_color_map.get(num_of_neighbors, 1)
+            num_of_neighbors = cell.link_count()
+            return OPENINGS_COLORS.get(num_of_neighbors, 1)
+
+    def _cell_colors(self, canvas: bytes) -> bytes:
+        """
+        Return every position's background color as one RGB buffer, 3 bytes per position in row-major order,
+        working from the grid's buffers and the view's arrays rather than asking every cell. Masked cells and
+        cells without a color get the canvas.
+        """
+        size = self.grid.rows * self.grid.columns
+
+        if self.type == "path":
+            colors = bytearray(canvas * size)
+            if self.maze.path:
+                shade = bytes((200, 200, 200))
+                for position in self.maze.path.positions:
+                    colors[3 * position : 3 * position + 3] = shade
+            return bytes(colors)
+        elif self.type == "distance":
+            # The whole distance field goes through the palette in one go
+            return bytes(
+                heatmap_rgb(
+                    self.maze.distances.distances,
+                    self.maze.max,
+                    palette_for(self.color_choice),
+                    canvas,
+                )
+            )
+        elif self.type == "openings":
+            # Link masks only take 16 values, so color each of them once and pull the masks through one table per
+            # channel. Masked cells have no links and so fall back to the canvas, like cells with no openings
+            palette = [
+                OPENINGS_COLORS.get(mask.bit_count(), canvas) for mask in range(16)
+            ]
+            masks = self.grid.link_masks()
+            colors = bytearray(3 * size)
+            for channel in range(3):
+                table = bytes(color[channel] for color in palette).ljust(256, b"\x00")
+                colors[channel::3] = masks.translate(table)
+            return bytes(colors)
+
+        return canvas * size
+
+    def distance_color(self, distance: int, color_choice: ColorChoice):
+        """
+        Shade for a cell at the given distance, fading from dark at the root to bright at the maze's max distance.
+        Looked up in the color choice's palette (see palettes), custom palettes can be passed as the color choice.
+        """
+        level = distance_level(distance, self.maze.max)
+        return tuple(palette_for(color_choice)[3 * level : 3 * level + 3])
 
     def draw(
         self,
@@ -68,125 +108,83 @@ class MazeImageCreator:
         canvas_color: (int, int, int) = (255, 255, 255),
         line_color: (int, int, int) = (0, 0, 0),
         line_thickness: int = 10,
+    ) -> None:
+        """
+        Render the maze and open it in the system's image viewer
+        """
+        self.render(cell_size, canvas_color, line_color, line_thickness).show()
+
+    @staticmethod
+    def to_png(image: Image) -> bytes:
+        """
+        Encode a rendered image as PNG bytes, e.g. to send from a server or write to disk. Goes through the same
+        PNGWriter RasterImageCreator.write_png streams with, so both export paths produce the same file.
+        """
+        image = image.convert("RGB")
+        output = BytesIO()
+        writer = PNGWriter(output, image.width, image.height)
+        writer.write_rows(image.tobytes())
+        writer.close()
+        return output.getvalue()
+
+    def render(
+        self,
+        cell_size: int = 100,
+        canvas_color: (int, int, int) = (255, 255, 255),
+        line_color: (int, int, int) = (0, 0, 0),
+        line_thickness: int = 10,
     ) -> Image:
         """
-        Draw grid to canvas using the Pillow Library
+        Draw grid to canvas using the Pillow Library and return the image
+        Every cell's background fills its whole cell_size block, then the walls are drawn on top as rectangles
+        line_thickness wide, centred on their gridline (the extra pixel goes before the gridline when the
+        thickness is even). Horizontal walls reach past both ends of their run so corners are closed, vertical
+        walls span exactly the rows of their run. Walls are merged into runs along each gridline first (see
+        wall_runs), so the number of Pillow calls grows with the number of runs rather than the number of cells.
+        RasterImageCreator paints the same picture pixel for pixel.
         Note that a weakness of this rendering is that line width is drawn inside cells (instead of as a separate grid)
         which means that if line_width is large enough it'll draw over the cell.
-        In a future edit will need to disentangle the gridlines and the cells.
         In general, I'd recommend keeping line_thickness 10% the size of cell_size or less.
         """
-
-        img_width = cell_size * self.grid.columns
-        img_height = cell_size * self.grid.rows
-        im = Image.new("RGB", (img_width + 1, img_height + 1), canvas_color)
+        rows, columns = self.grid.rows, self.grid.columns
+        width = cell_size * columns + 1
+        height = cell_size * rows + 1
+        im = Image.new("RGB", (width, height), canvas_color)
 
         # Create a drawable version of the image
         draw = ImageDraw.Draw(im)
 
-        # Draw each of the cells onto the image
-        current_row = 0
-        for row in self.grid.each_row():
-            # Iterate through each mode, one iteration to loop through backgrounds, another to do cell walls
-            for mode in ["backgrounds", "walls"]:
-                current_column = 0
-                for cell in row:
-                    if cell is None:
-                        x1 = current_column * cell_size
-                        y1 = current_row * cell_size
-                        x2 = (current_column + 1) * cell_size
-                        y2 = (current_row + 1) * cell_size
-                    else:
-                        # Calc the northwest and southeast corner points, accounting for
-                        x1 = cell.column * cell_size
-                        y1 = cell.row * cell_size
-                        x2 = (cell.column + 1) * cell_size
-                        y2 = (cell.row + 1) * cell_size
-
-                    if mode == "backgrounds":
-                        color = self.background_color_for(
-                            cell, canvas_color, self.color_choice
-                        )
-                        if color and cell is not None:
-
-                            western_boundary = x1
-                            eastern_boundary = x2
-                            northern_boundary = y1
-                            southern_boundary = y2
-
-                            # Need to adjust for line boundaries here, as far as I can tell, PIL will set the line
-                            # at the midpoint of the line width, which is why we're using 0.5 here
-
-                            if not cell.north or not cell.is_linked(cell.north):
-                                northern_boundary += 0.5 * line_thickness
-
-                            if not cell.west or not cell.is_linked(cell.west):
-                                western_boundary += 0.5 * line_thickness
-
-                            if not cell.is_linked(cell.south):
-                                southern_boundary -= 0.5 * line_thickness
-
-                            if not cell.is_linked(cell.east):
-                                eastern_boundary -= 0.5 * line_thickness
-
-                            draw.rectangle(
-                                (
-                                    (western_boundary, northern_boundary),
-                                    (eastern_boundary, southern_boundary),
-                                ),
-                                color,
-                                color,
-                            )
-                    else:
-                        # Hack for masked cells, only draw border if on edge
-                        if cell is None:
-                            if current_row == 0:
-                                draw.line(
-                                    ((x1, y1), (x2, y1)), line_color, line_thickness
-                                )
-
-                            if current_column == 0:
-                                draw.line(
-                                    ((x1, y1), (x1, y2)), line_color, line_thickness
-                                )
-
-                            if current_row == self.maze.grid.rows - 1:
-                                draw.line(
-                                    ((x1, y2), (x2, y2)), line_color, line_thickness
-                                )
-
-                            if current_column == self.maze.grid.columns - 1:
-                                draw.line(
-                                    ((x2, y1), (x2, y2)), line_color, line_thickness
-                                )
-
-                        else:
-                            # Since every cell draws its southern and eastern borders, we only have to
-                            # draw northern and western borders if the cell has no neighbor in that direction
-                            if not cell.north:
-                                draw.line(
-                                    ((x1, y1), (x2, y1)), line_color, line_thickness
-                                )
-
-                            if not cell.west:
-                                draw.line(
-                                    ((x1, y1), (x1, y2)), line_color, line_thickness
-                                )
-
-                            # Every cell draws its own southern and eastern borders unless it is linked to that neighbor
-                            if not cell.is_linked(cell.south):
-                                draw.line(
-                                    ((x1, y2), (x2, y2)), line_color, line_thickness
-                                )
-
-                            if not cell.is_linked(cell.east):
-                                draw.line(
-                                    ((x2, y1), (x2, y2)), line_color, line_thickness
-                                )
-
-                    current_column += 1
-
-            current_row += 1
-
-        img_with_border = ImageOps.expand(im, border=10, fill="black")
-        return img_with_border.show()
+        # Draw the background of each cell onto the image, the last row of cells also covers the bottom pixel row
+        canvas = bytes(canvas_color)
+        colors = self._cell_colors(canvas)
+        for position in range(rows * columns):
+            color = colors[3 * position : 3 * position + 3]
+            if color == canvas:
+                continue
+            row, column = divmod(position, columns)
+            x, y = column * cell_size, row * cell_size
+            bottom = height - 1 if row == rows - 1 else y + cell_size - 1
+            draw.rectangle(((x, y), (x + cell_size - 1, bottom)), tuple(color))
+
+        def wall(x0: int, y0: int, x1: int, y1: int) -> None:
+            # Clip a wall (end exclusive) to the image and draw it
+            x0, y0, x1, y1 = max(x0, 0), max(y0, 0), min(x1, width), min(y1, height)
+            if x0 < x1 and y0 < y1:
+                draw.rectangle(((x0, y0), (x1 - 1, y1 - 1)), line_color)
+
+        half = line_thickness // 2
+        for gridline, start, end in vertical_wall_runs(self.grid):
+            x = gridline * cell_size - half
+            # Like the backgrounds, a run reaching the last row covers the bottom pixel row too
+            y1 = height if end == rows else end * cell_size
+            wall(x, start * cell_size, x + line_thickness, y1)
+        for gridline, start, end in horizontal_wall_runs(self.grid):
+            y = gridline * cell_size - half
+            wall(
+                start * cell_size - half,
+                y,
+                end * cell_size - half + line_thickness,
+                y + line_thickness,
+            )
+
+        return ImageOps.expand(im, border=BORDER, fill="black")
@@ -0,0 +1,126 @@
+from array import array
+from typing import Callable, Dict, Generator, Hashable, Tuple, Union
+
+from maze_creator.core.distance_grid import UNREACHABLE
+
+# Number of shades in a palette, distances are scaled onto 0 (the root) to LEVELS - 1 (the farthest cell)
+LEVELS = 256
+
+
+class ColorChoice:
+    BLUE = 1
+    DARKGREEN = 2
+    PURPLE = 3
+    GREEN = 4
+    RED = 5
+    YELLOW = 6
+
+
+def make_palette(shade: Callable[[float], Tuple[int, int, int]]) -> bytes:
+    """
+    Build a palette lookup table: LEVELS RGB entries back to back, where entry i is shade(intensity) for an
+    intensity falling from 1 at the root (i = 0) to 0 at the farthest cell (i = LEVELS - 1)
+    """
+    return b"".join(
+        bytes(shade((LEVELS - 1 - level) / (LEVELS - 1))) for level in range(LEVELS)
+    )
+
+
+def _heatmap(order: str) -> Callable[[float], Tuple[int, int, int]]:
+    """
+    The built in heatmaps mix a dark, bright and (near) zero channel, in an order that depends on the color
+    """
+
+    def shade(intensity: float) -> Tuple[int, int, int]:
+        channels = {
+            "i": int(intensity),
+            "d": int(255 * intensity),
+            "b": int(128 + (127 * intensity)),
+        }
+        return channels[order[0]], channels[order[1]], channels[order[2]]
+
+    return shade
+
+
+# Palettes by ColorChoice, add an entry built with make_palette to offer another one
+PALETTES: Dict[Hashable, bytes] = {
+    ColorChoice.BLUE: make_palette(_heatmap("idb")),
+    ColorChoice.DARKGREEN: make_palette(_heatmap("ibd")),
+    ColorChoice.PURPLE: make_palette(_heatmap("dib")),
+    ColorChoice.GREEN: make_palette(_heatmap("dbi")),
+    ColorChoice.RED: make_palette(_heatmap("bid")),
+    ColorChoice.YELLOW: make_palette(_heatmap("bdi")),
+}
+
+
+def palette_for(color_choice: Union[Hashable, bytes]) -> bytes:
+    """
+    Look up a registered palette, a palette built with make_palette can also be passed in directly
+    """
+    if isinstance(color_choice, (bytes, bytearray)):
+        if len(color_choice) != 3 * LEVELS:
+            raise Exception("Palettes need an RGB color for every level")
+        return bytes(color_choice)
+    if color_choice not in PALETTES:
+        raise Exception("Palette not recognized")
+    return PALETTES[color_choice]
+
+
+def distance_level(distance: int, max_distance: int) -> int:
+    """
+    Palette entry for a single distance
+    """
+    return distance * (LEVELS - 1) // max(max_distance, 1)
+
+
+def distance_levels(distances: array, max_distance: int) -> bytes:
+    """
+    Scale a whole distance field onto palette entries in one go, one byte per position. Unreachable positions get
+    entry 0, use unreachable_positions to find them.
+    """
+    if max_distance >= len(distances):
+        # Weighted fields can run far past the number of cells, scale each position on its own
+        return bytes(
+            distance_level(distance, max_distance) if distance != UNREACHABLE else 0
+            for distance in distances
+        )
+
+    # Every distance up to max_distance is scaled once, the trailing entry is what UNREACHABLE (-1) indexes
+    scale = bytes(
+        distance_level(distance, max_distance) for distance in range(max_distance + 1)
+    )
+    return bytes(map((scale + b"\x00").__getitem__, distances))
+
+
+def unreachable_positions(distances: array) -> Generator[int, None, None]:
+    """
+    Generator over the positions in a distance field that hold UNREACHABLE
+    """
+    position = -1
+    while True:
+        try:
+            position = distances.index(UNREACHABLE, position + 1)
+        except ValueError:
+            return
+        yield position
+
+
+def heatmap_rgb(
+    distances: array,
+    max_distance: int,
+    palette: bytes,
+    canvas: bytes = b"\xff\xff\xff",
+) -> bytearray:
+    """
+    Color a whole distance field through a palette, returning 3 RGB bytes per position (canvas where unreachable)
+    """
+    levels = distance_levels(distances, max_distance)
+
+    # Pull each channel through its own 256 byte table, then interleave the three
+    rgb = bytearray(3 * len(levels))
+    for channel in range(3):
+        rgb[channel::3] = levels.translate(palette[channel::3])
+
+    for position in unreachable_positions(distances):
+        rgb[3 * position : 3 * position + 3] = canvas
+    return rgb
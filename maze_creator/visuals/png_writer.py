@@ -0,0 +1,103 @@
+import struct
+import zlib
+from typing import BinaryIO
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Size of the IDAT chunks compressed data is written out in. Chunking at a fixed size (rather than whenever zlib
+# happens to return data) means the file only depends on the pixels, not on how they were fed in.
+IDAT_CHUNK = 1 << 16
+
+# Scanline filter type storing each byte as its difference from the byte above it
+FILTER_UP = 2
+
+
+def _subtract_bytes(a: bytes, b: bytes) -> bytes:
+    """
+    Byte by byte (a - b) % 256 over two equally long buffers. Both are read as one big-integer each, and setting
+    the top bit of every byte of a while clearing it in b keeps the borrows from crossing into the next byte, the
+    top bits are then patched back in with an XOR.
+    """
+    length = len(a)
+    high = int.from_bytes(b"\x80" * length, "big")
+    low = int.from_bytes(b"\x7f" * length, "big")
+    x, y = int.from_bytes(a, "big"), int.from_bytes(b, "big")
+    return (((x | high) - (y & low)) ^ ((x ^ y ^ high) & high)).to_bytes(length, "big")
+
+
+class PNGWriter:
+    """
+    Write an 8-bit RGB PNG to a file object a few scanlines at a time, so an image never has to be held in memory
+    as a whole. Every row is stored with the Up filter, which only needs the row before it and turns the long
+    runs of identical rows in a maze into zeros. Rows go through a single zlib stream and come out as IDAT chunks
+    of IDAT_CHUNK bytes.
+
+        writer = PNGWriter(fp, width, height)
+        for band in bands:
+            writer.write_rows(band)
+        writer.close()
+    """
+
+    def __init__(self, fp: BinaryIO, width: int, height: int, compression_level: int = 6):
+        self.fp = fp
+        self.width = width
+        self.height = height
+        self.stride = 3 * width
+        self.rows_written = 0
+        self._compressor = zlib.compressobj(compression_level)
+        self._pending = bytearray()
+        # The row above the next one written, the first row is filtered against zeros
+        self._previous = bytes(self.stride)
+
+        fp.write(PNG_SIGNATURE)
+        # Bit depth 8, color type 2 (RGB), default compression, filter and no interlacing
+        self._chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+
+    def _chunk(self, kind: bytes, data: bytes) -> None:
+        self.fp.write(struct.pack(">I", len(data)))
+        self.fp.write(kind)
+        self.fp.write(data)
+        self.fp.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(kind))))
+
+    def _flush_pending(self, final: bool = False) -> None:
+        while len(self._pending) >= IDAT_CHUNK or (final and self._pending):
+            self._chunk(b"IDAT", bytes(self._pending[:IDAT_CHUNK]))
+            del self._pending[:IDAT_CHUNK]
+
+    def write_rows(self, pixels: bytes) -> None:
+        """
+        Append one or more whole scanlines of RGB pixels, 3 bytes per pixel
+        """
+        if len(pixels) % self.stride:
+            raise Exception("Pixels must hold whole scanlines")
+        rows = len(pixels) // self.stride
+        if self.rows_written + rows > self.height:
+            raise Exception("More rows written than the image is high")
+        if not rows:
+            return
+
+        # The rows above the band are the last row written followed by every row of the band but its last
+        stride = self.stride
+        pixels = bytes(pixels)
+        differences = _subtract_bytes(pixels, self._previous + pixels[:-stride])
+        self._previous = pixels[-stride:]
+
+        # Every scanline starts with its filter type
+        filtered = bytearray()
+        for offset in range(0, len(pixels), stride):
+            filtered.append(FILTER_UP)
+            filtered += differences[offset : offset + stride]
+
+        self._pending += self._compressor.compress(filtered)
+        self.rows_written += rows
+        self._flush_pending()
+
+    def close(self) -> None:
+        """
+        Finish the compressed stream and write the end of the file
+        """
+        if self.rows_written != self.height:
+            raise Exception("Image closed before every row was written")
+        self._pending += self._compressor.flush()
+        self._flush_pending(final=True)
+        self._chunk(b"IEND", b"")
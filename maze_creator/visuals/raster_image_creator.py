@@ -0,0 +1,180 @@
+from typing import BinaryIO, Generator, Tuple
+
+from PIL import Image
+
+from maze_creator.visuals.maze_image_creator import BORDER, MazeImageCreator
+from maze_creator.visuals.png_writer import PNGWriter
+from maze_creator.visuals.wall_runs import horizontal_wall_runs, vertical_wall_runs
+
+# Color the black frame around the maze is painted with
+BORDER_COLOR = (0, 0, 0)
+
+
+class RasterImageCreator(MazeImageCreator):
+    """
+    MazeImageCreator that paints the picture straight into a raw RGB buffer instead of issuing a Pillow call per
+    wall per cell. Supports the same "bw", "path", "distance" and "openings" modes, and paints the same picture as
+    MazeImageCreator.render pixel for pixel.
+
+    Every cell row shares one scanline: the cells' background colors laid out as blocks with the vertical walls
+    painted over them, repeated cell_size times. The horizontal walls are then painted as strips of line_thickness
+    rows, one slice per pixel row of each run of walls (see wall_runs). The picture is built one row of cells at a
+    time, so it can be streamed out band by band (see write_png) as well as assembled in memory.
+    """
+
+    def frame_size(self, cell_size: int = 100) -> Tuple[int, int]:
+        """
+        Width and height in pixels of the rendered picture, frame included
+        """
+        return (
+            cell_size * self.grid.columns + 1 + 2 * BORDER,
+            cell_size * self.grid.rows + 1 + 2 * BORDER,
+        )
+
+    def render_bands(
+        self,
+        cell_size: int = 100,
+        canvas_color: (int, int, int) = (255, 255, 255),
+        line_color: (int, int, int) = (0, 0, 0),
+        line_thickness: int = 10,
+    ) -> Generator[bytearray, None, None]:
+        """
+        Render the maze as horizontal bands of whole pixel rows, top to bottom, 3 bytes per pixel and frame included.
+        Each row of cells is its own band, so only one band's worth of pixels is held at a time.
+        """
+        rows, columns = self.grid.rows, self.grid.columns
+        colors = self._cell_colors(bytes(canvas_color))
+
+        # Every row's scanline needs the vertical walls crossing it, every band the horizontal walls near it
+        walls_by_row = [[] for _ in range(rows)]
+        for gridline, start, end in vertical_wall_runs(self.grid):
+            for row in range(start, end):
+                walls_by_row[row].append(gridline)
+        runs_by_gridline = [[] for _ in range(rows + 1)]
+        for gridline, start, end in horizontal_wall_runs(self.grid):
+            runs_by_gridline[gridline].append((start, end))
+
+        # Content is the same size MazeImageCreator draws, the frame goes around it
+        width, _ = self.frame_size(cell_size)
+        content_width = width - 2 * BORDER
+        content_height = cell_size * rows + 1
+        stride = 3 * width
+        line = bytes(line_color)
+        half = line_thickness // 2
+
+        def span(start: int, end: int, limit: int) -> Tuple[int, int]:
+            # Clip a run of pixels to the content area
+            return max(0, start), min(limit, end)
+
+        frame = bytes(BORDER_COLOR) * width * BORDER
+        side = bytes(BORDER_COLOR) * BORDER
+        canvas_pixel = bytes(canvas_color)
+
+        yield bytearray(frame)
+
+        for row in range(rows):
+            first = row * columns
+            # Cell backgrounds as blocks of cell_size pixels
+            scanline = bytearray(
+                side
+                + b"".join(
+                    colors[offset : offset + 3] * cell_size
+                    for offset in range(3 * first, 3 * (first + columns), 3)
+                )
+                + canvas_pixel
+                + side
+            )
+
+            # Vertical walls, gridline c sits between columns c - 1 and c
+            for column in walls_by_row[row]:
+                x0, x1 = span(
+                    column * cell_size - half,
+                    column * cell_size - half + line_thickness,
+                    content_width,
+                )
+                scanline[3 * (BORDER + x0) : 3 * (BORDER + x1)] = line * (x1 - x0)
+
+            # The last band also holds the content's bottom pixel row, which sits on the bottom gridline
+            top = row * cell_size
+            bottom = content_height if row == rows - 1 else top + cell_size
+            band = scanline * (bottom - top)
+
+            # Horizontal walls, gridline g sits between rows g - 1 and g. Its strip can reach into this band from
+            # the gridlines at either end of it (and further for walls thicker than a cell).
+            first_gridline = max(0, (top + half - line_thickness) // cell_size)
+            last_gridline = min(rows, (bottom + half) // cell_size)
+            for gridline in range(first_gridline, last_gridline + 1):
+                y0, y1 = span(
+                    gridline * cell_size - half - top,
+                    gridline * cell_size - half + line_thickness - top,
+                    bottom - top,
+                )
+                for start, end in runs_by_gridline[gridline]:
+                    x0, x1 = span(
+                        start * cell_size - half,
+                        end * cell_size - half + line_thickness,
+                        content_width,
+                    )
+                    run = line * (x1 - x0)
+                    for y in range(y0, y1):
+                        offset = y * stride + 3 * BORDER
+                        band[offset + 3 * x0 : offset + 3 * x1] = run
+
+            yield band
+
+        yield bytearray(frame)
+
+    def render_rgb(
+        self,
+        cell_size: int = 100,
+        canvas_color: (int, int, int) = (255, 255, 255),
+        line_color: (int, int, int) = (0, 0, 0),
+        line_thickness: int = 10,
+    ) -> Tuple[int, int, bytearray]:
+        """
+        Render the maze, frame included, and return (width, height, pixels) where pixels holds 3 bytes per pixel,
+        row by row
+        """
+        width, height = self.frame_size(cell_size)
+        pixels = bytearray()
+        for band in self.render_bands(
+            cell_size, canvas_color, line_color, line_thickness
+        ):
+            pixels += band
+        return width, height, pixels
+
+    def write_png(
+        self,
+        fp: BinaryIO,
+        cell_size: int = 100,
+        canvas_color: (int, int, int) = (255, 255, 255),
+        line_color: (int, int, int) = (0, 0, 0),
+        line_thickness: int = 10,
+        compression_level: int = 6,
+    ) -> None:
+        """
+        Stream the maze to a PNG file one band at a time, so poster-sized mazes never need the whole picture in
+        memory. The file is byte for byte what MazeImageCreator.to_png makes of the in-memory render.
+        """
+        width, height = self.frame_size(cell_size)
+        writer = PNGWriter(fp, width, height, compression_level)
+        for band in self.render_bands(
+            cell_size, canvas_color, line_color, line_thickness
+        ):
+            writer.write_rows(band)
+        writer.close()
+
+    def render(
+        self,
+        cell_size: int = 100,
+        canvas_color: (int, int, int) = (255, 255, 255),
+        line_color: (int, int, int) = (0, 0, 0),
+        line_thickness: int = 10,
+    ) -> Image:
+        """
+        Render the maze into a Pillow image without opening a viewer
+        """
+        width, height, pixels = self.render_rgb(
+            cell_size, canvas_color, line_color, line_thickness
+        )
+        return Image.frombytes("RGB", (width, height), bytes(pixels))
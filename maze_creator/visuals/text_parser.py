@@ -0,0 +1,94 @@
+import os
+from typing import Iterable
+
+from maze_creator.core.directions import EAST, SOUTH
+from maze_creator.core.link_buffers import add_reciprocal_links
+from maze_creator.core.mask import Mask
+from maze_creator.grids.compact_grid import CompactGrid, MaskedCompactGrid
+from maze_creator.grids.grid import Grid
+from maze_creator.grids.masked_grid import MaskedGrid
+
+# Translation tables from the boundary characters of a drawing to link masks, a space is an open passage
+_EAST_LINKS = bytes(EAST if value == ord(" ") else 0 for value in range(256))
+_SOUTH_LINKS = bytes(SOUTH if value == ord(" ") else 0 for value in range(256))
+# Strips SOUTH from a link mask
+_NO_SOUTH = bytes(value & ~SOUTH for value in range(256))
+# Turns a link mask into 1 for a cell with any links and 0 for one without
+_LINKED = bytes(bool(value) for value in range(256))
+
+
+class TextParser:
+    """
+    Rebuilds a linked grid from the ASCII drawing TextRenderer (and so str(grid)) produces:
+
+        +---+---+
+        |       |
+        +   +---+
+        |   |   |
+        +---+---+
+
+    Only the boundaries are read, whatever is drawn inside the cells (a path, say) is ignored. A cell that isn't
+    linked to anything is taken to be masked out, so masked grids come back as MaskedGrid.
+    """
+
+    @staticmethod
+    def parse(lines: Iterable[str], compact: bool = False) -> Grid:
+        """
+        Build a grid from the lines of a drawing, e.g. an open file or text.splitlines(). Every pair of lines is
+        decoded into a row of link masks in one go, so the whole drawing is read in a single pass.
+        """
+        lines = iter(lines)
+        border = next(lines, "").rstrip("\r\n")
+        columns = (len(border) - 1) // 4
+        if columns < 1 or border != "+" + "---+" * columns:
+            raise Exception("Drawing must start with a top border")
+        width = 4 * columns + 1
+
+        masks = bytearray()
+        rows = 0
+        for top in lines:
+            top = top.rstrip("\r\n")
+            if not top:
+                # Allow trailing blank lines
+                break
+            bottom = next(lines, "").rstrip("\r\n")
+            if len(top) != width or len(bottom) != width:
+                raise Exception(
+                    "Every line of the drawing must be as wide as the top border"
+                )
+            top = top.encode("latin-1", "replace")
+            bottom = bottom.encode("latin-1", "replace")
+            if top[0] != ord("|") or bottom[::4].strip(b"+"):
+                raise Exception("Row is not laid out like a drawing of a grid")
+
+            # The eastern boundary of each cell is every 4th character after the opening pipe, the southern one is
+            # 3 characters wide and its middle one is enough. The outer wall is forced shut so no link leaves the grid.
+            row = int.from_bytes(top[4::4].translate(_EAST_LINKS)[:-1], "little") | (
+                int.from_bytes(bottom[2::4].translate(_SOUTH_LINKS), "little")
+            )
+            masks += row.to_bytes(columns, "little")
+            rows += 1
+
+        if rows == 0:
+            raise Exception("Drawing has no rows")
+        masks[-columns:] = masks[-columns:].translate(_NO_SOUTH)
+        masks = add_reciprocal_links(masks, columns)
+
+        # Cells without a single link can only have been masked out, unless nothing is linked at all
+        if 0 < masks.count(0) < len(masks):
+            mask = Mask.from_cells(rows, columns, masks.translate(_LINKED))
+            grid = MaskedCompactGrid(mask) if compact else MaskedGrid(mask)
+        else:
+            grid = CompactGrid(rows, columns) if compact else Grid(rows, columns)
+
+        grid.merge_link_masks(masks)
+        return grid
+
+    @staticmethod
+    def from_txt(file, compact: bool = False) -> Grid:
+        """
+        Load a grid from a text file holding a drawing
+        """
+        path = os.path.abspath(file)
+        with open(path, "r") as f:
+            return TextParser.parse(f, compact)
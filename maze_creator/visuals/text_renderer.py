@@ -0,0 +1,69 @@
+from typing import Callable, Generator, TextIO, Union
+
+from maze_creator.core.directions import EAST, SOUTH
+
+# What goes after a cell's body on its text row, and under it on the row below, for every link mask
+_EAST_BOUNDARIES = tuple(" " if mask & EAST else "|" for mask in range(16))
+_SOUTH_BOUNDARIES = tuple("   +" if mask & SOUTH else "---+" for mask in range(16))
+# Whole cells (blank body plus eastern boundary) for when nothing is drawn inside them
+_BLANK_CELLS = tuple("   " + boundary for boundary in _EAST_BOUNDARIES)
+
+
+class TextRenderer:
+    """
+    ASCII drawing of a maze, produced one line at a time so a maze of any size can be written out with only a row
+    of it in memory. Every cell is three characters wide and draws its own southern and eastern borders:
+
+        +---+---+
+        |       |
+        +   +---+
+        |   |   |
+        +---+---+
+
+    Each text row is joined in one go from fragments precomputed per link mask, reading a row of link masks from the
+    grid at a time. contents_of_cell is an optional hook picking the character drawn inside each cell (it's given
+    the cell, masked out cells are always blank), without it no cell objects are touched at all.
+    """
+
+    def __init__(
+        self, grid, contents_of_cell: Union[Callable[["Cell"], str], None] = None
+    ):
+        self.grid = grid
+        self.contents_of_cell = contents_of_cell
+
+    def lines(self) -> Generator[str, None, None]:
+        """
+        Generator over the lines of the drawing, newlines included
+        """
+        columns = self.grid.columns
+        # Draw the top border
+        yield "+" + "---+" * columns + "\n"
+
+        rows = self.grid.each_row() if self.contents_of_cell else None
+        for row in range(self.grid.rows):
+            masks = self.grid.link_masks(row, 1)
+
+            if rows is None:
+                cells = "".join(map(_BLANK_CELLS.__getitem__, masks))
+            else:
+                contents = self.contents_of_cell
+                cells = "".join(
+                    f" {contents(cell) if cell is not None else ' '} {_EAST_BOUNDARIES[mask]}"
+                    for cell, mask in zip(next(rows), masks)
+                )
+
+            yield "|" + cells + "\n"
+            yield "+" + "".join(map(_SOUTH_BOUNDARIES.__getitem__, masks)) + "\n"
+
+    def write(self, fp: TextIO) -> None:
+        """
+        Write the drawing to a file-like object line by line
+        """
+        for line in self.lines():
+            fp.write(line)
+
+    def render(self) -> str:
+        """
+        Return the whole drawing as a single string
+        """
+        return "".join(self.lines())
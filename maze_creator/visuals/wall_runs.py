@@ -0,0 +1,78 @@
+"""
+Wall geometry shared by the renderers. Instead of one wall per cell side, walls that line up along the same gridline
+are merged into maximal runs, so a renderer makes one call per run rather than one per cell.
+
+A wall sits on a gridline when it's the edge of the grid, or when a cell on either side of it is part of the grid
+and the two aren't linked. Runs are (gridline, start, end) with end exclusive: for horizontal runs the gridline is the
+row boundary (0 is the top edge, rows the bottom) and start / end are columns, for vertical runs the gridline is the
+column boundary and start / end are rows.
+"""
+
+import re
+from typing import List, Tuple
+
+from maze_creator.core.directions import EAST, SOUTH
+
+# Translation tables giving 1 where a cell has no link in that direction
+_NO_SOUTH = bytes(int(not value & SOUTH) for value in range(256))
+_NO_EAST = bytes(int(not value & EAST) for value in range(256))
+
+_RUN = re.compile(b"\x01+")
+
+
+def _runs(
+    gridline: int, no_link: bytes, first: bytes, second: bytes
+) -> List[Tuple[int, int, int]]:
+    """
+    Find the runs along one interior gridline given, for each cell along it, whether the cells on the two sides
+    are linked and whether each side is part of the grid
+    """
+    length = len(no_link)
+    walls = (
+        int.from_bytes(no_link, "little")
+        & (int.from_bytes(first, "little") | int.from_bytes(second, "little"))
+    ).to_bytes(length, "little")
+    return [(gridline, match.start(), match.end()) for match in _RUN.finditer(walls)]
+
+
+def horizontal_wall_runs(grid) -> List[Tuple[int, int, int]]:
+    """
+    Return the horizontal walls as runs, one pass over the rows
+    """
+    rows, columns = grid.rows, grid.columns
+    masks = grid.link_masks()
+    present = grid.present_cells()
+
+    runs = [(0, 0, columns)]
+    for gridline in range(1, rows):
+        above = (gridline - 1) * columns
+        below = above + columns
+        runs += _runs(
+            gridline,
+            masks[above:below].translate(_NO_SOUTH),
+            present[above:below],
+            present[below : below + columns],
+        )
+    runs.append((rows, 0, columns))
+    return runs
+
+
+def vertical_wall_runs(grid) -> List[Tuple[int, int, int]]:
+    """
+    Return the vertical walls as runs, one pass over the columns
+    """
+    rows, columns = grid.rows, grid.columns
+    masks = grid.link_masks()
+    present = grid.present_cells()
+
+    runs = [(0, 0, rows)]
+    for gridline in range(1, columns):
+        # Every columns-th byte starting from a column is that column read top to bottom
+        runs += _runs(
+            gridline,
+            masks[gridline - 1 :: columns].translate(_NO_EAST),
+            present[gridline - 1 :: columns],
+            present[gridline::columns],
+        )
+    runs.append((columns, 0, rows))
+    return runs
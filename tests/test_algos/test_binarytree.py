@@ -0,0 +1,41 @@
+import random
+import unittest
+
+from maze_creator.algos.binarytree import BinaryTree
+from maze_creator.core.distances import Distances
+from maze_creator.grids.compact_grid import CompactGrid
+from maze_creator.grids.grid import Grid
+
+
+class TestBinaryTree(unittest.TestCase):
+    def setUp(self):
+        random.seed(7)
+
+    def assert_perfect_maze(self, grid):
+        links = sum(cell.link_count() for cell in grid.each_cell()) // 2
+        distances = Distances(grid[0, 0])
+        distances.calc_distances()
+
+        self.assertEqual(links, grid.size() - 1)
+        self.assertEqual(len(distances.get_all_cells()), grid.size())
+
+    def test_vectorized_creates_perfect_maze(self):
+        for grid in (Grid(12, 9), CompactGrid(12, 9)):
+            self.assert_perfect_maze(BinaryTree.create_maze(grid, 0.3, vectorized=True))
+
+    def test_vectorized_edge_rules(self):
+        grid = BinaryTree.create_maze(Grid(6, 6), vectorized=True)
+
+        for column in range(5):
+            self.assertTrue(grid[0, column].is_linked(grid[0, column + 1]))
+        for row in range(1, 6):
+            self.assertTrue(grid[row, 5].is_linked(grid[row - 1, 5]))
+
+    def test_vectorized_bias_extremes(self):
+        all_north = BinaryTree.create_maze(Grid(5, 5), 0.0, vectorized=True)
+        all_east = BinaryTree.create_maze(Grid(5, 5), 1.0, vectorized=True)
+
+        self.assertTrue(all_north[3, 2].is_linked(all_north[2, 2]))
+        self.assertFalse(all_north[3, 2].is_linked(all_north[3, 3]))
+        self.assertTrue(all_east[3, 2].is_linked(all_east[3, 3]))
+        self.assertFalse(all_east[3, 2].is_linked(all_east[2, 2]))
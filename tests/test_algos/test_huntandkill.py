@@ -0,0 +1,34 @@
+import random
+import unittest
+
+from maze_creator.algos.huntandkill import HuntAndKill
+from maze_creator.core.mask import Mask
+from maze_creator.grids.compact_grid import CompactGrid
+from maze_creator.grids.grid import Grid
+from maze_creator.grids.masked_grid import MaskedGrid
+
+
+class TestHuntAndKill(unittest.TestCase):
+    def test_frontier_does_not_change_the_maze(self):
+        mask = Mask(9, 9)
+        mask.bits[4][4] = False
+        mask.bits[0][8] = False
+
+        for make_grid in (
+            lambda: Grid(15, 12),
+            lambda: CompactGrid(15, 12),
+            lambda: MaskedGrid(mask),
+        ):
+            random.seed(21)
+            full_scan = str(HuntAndKill.create_maze(make_grid(), frontier=False))
+            random.seed(21)
+            with_frontier = str(HuntAndKill.create_maze(make_grid(), frontier=True))
+
+            self.assertEqual(full_scan, with_frontier)
+
+    def test_creates_perfect_maze(self):
+        random.seed(4)
+        grid = HuntAndKill.create_maze(Grid(10, 10))
+        links = sum(cell.link_count() for cell in grid.each_cell()) // 2
+
+        self.assertEqual(links, grid.size() - 1)
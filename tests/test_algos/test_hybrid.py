@@ -0,0 +1,52 @@
+import random
+import unittest
+from unittest import mock
+
+from maze_creator.algos.hybrid import AldousBroderWilson
+from maze_creator.core.distances import Distances
+from maze_creator.core.mask import Mask
+from maze_creator.grids.compact_grid import CompactGrid
+from maze_creator.grids.grid import Grid
+from maze_creator.grids.masked_grid import MaskedGrid
+from maze_creator.masked_maze import MaskedMaze
+from maze_creator.maze import Maze
+
+
+class TestAldousBroderWilson(unittest.TestCase):
+    def setUp(self):
+        random.seed(9)
+
+    def assert_perfect_maze(self, grid):
+        links = sum(cell.link_count() for cell in grid.each_cell()) // 2
+        distances = Distances(next(grid.each_cell()))
+        distances.calc_distances()
+
+        self.assertEqual(links, grid.size() - 1)
+        self.assertEqual(len(distances.get_all_cells()), grid.size())
+
+    def test_creates_perfect_maze(self):
+        mask = Mask(7, 7)
+        mask.bits[2][2] = False
+
+        for grid in (Grid(9, 12), CompactGrid(9, 12), MaskedGrid(mask)):
+            self.assert_perfect_maze(AldousBroderWilson.create_maze(grid))
+
+    def test_fixed_switch_points(self):
+        for switch_at in (0.0, 0.5, 1.0):
+            self.assert_perfect_maze(
+                AldousBroderWilson.create_maze(Grid(8, 8), switch_at)
+            )
+
+    def test_switch_point_from_maze(self):
+        mask = Mask(6, 6)
+        mask.bits[0][0] = False
+        with mock.patch.object(
+            AldousBroderWilson, "create_maze", wraps=AldousBroderWilson.create_maze
+        ) as create_maze:
+            maze = Maze(6, 6, "hybrid", switch_at=0.25)
+            masked = MaskedMaze(mask, "hybrid", switch_at=0.75)
+
+        self.assertEqual(create_maze.call_args_list[0].args[1], 0.25)
+        self.assertEqual(create_maze.call_args_list[1].args[1], 0.75)
+        self.assert_perfect_maze(maze.grid)
+        self.assert_perfect_maze(masked.grid)
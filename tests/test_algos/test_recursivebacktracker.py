@@ -0,0 +1,34 @@
+import random
+import unittest
+
+from maze_creator.algos.recursivebacktracker import RecursiveBackTracker
+from maze_creator.core.distances import Distances
+from maze_creator.core.mask import Mask
+from maze_creator.grids.compact_grid import CompactGrid, MaskedCompactGrid
+from maze_creator.grids.grid import Grid
+from maze_creator.grids.masked_grid import MaskedGrid
+
+
+class TestRecursiveBackTracker(unittest.TestCase):
+    def setUp(self):
+        random.seed(13)
+
+    def test_compact_creates_perfect_maze(self):
+        mask = Mask(8, 8)
+        mask.bits[0][3] = False
+        mask.bits[5][5] = False
+
+        for grid in (
+            Grid(10, 7),
+            CompactGrid(10, 7),
+            MaskedGrid(mask),
+            MaskedCompactGrid(mask),
+            Grid(1, 6),
+        ):
+            RecursiveBackTracker.create_maze(grid, compact=True)
+            links = sum(cell.link_count() for cell in grid.each_cell()) // 2
+            distances = Distances(next(grid.each_cell()))
+            distances.calc_distances()
+
+            self.assertEqual(links, grid.size() - 1)
+            self.assertEqual(len(distances.get_all_cells()), grid.size())
@@ -0,0 +1,40 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from maze_creator.algos.sidewinder import SideWinder
+from maze_creator.core.distances import Distances
+from maze_creator.grids.compact_grid import CompactGrid
+from maze_creator.grids.grid import Grid
+
+
+class TestSideWinder(unittest.TestCase):
+    def setUp(self):
+        random.seed(11)
+
+    # Tiny bands so even small grids are carved in several pieces
+    @patch("maze_creator.algos.sidewinder.BAND_CELLS", 64)
+    def test_batched_creates_perfect_maze(self):
+        for grid in (Grid(10, 13), CompactGrid(10, 13), Grid(7, 1), Grid(1, 7)):
+            SideWinder.create_maze(grid, 0.4, batched=True)
+            links = sum(cell.link_count() for cell in grid.each_cell()) // 2
+            distances = Distances(grid[0, 0])
+            distances.calc_distances()
+
+            self.assertEqual(links, grid.size() - 1)
+            self.assertEqual(len(distances.get_all_cells()), grid.size())
+
+    def test_batched_top_row_is_open(self):
+        grid = SideWinder.create_maze(Grid(5, 8), batched=True)
+
+        for column in range(7):
+            self.assertTrue(grid[0, column].is_linked(grid[0, column + 1]))
+
+    @patch("maze_creator.algos.sidewinder.BAND_CELLS", 64)
+    def test_workers_do_not_change_the_maze(self):
+        random.seed(3)
+        single = SideWinder.create_maze(CompactGrid(40, 30), batched=True)
+        random.seed(3)
+        pooled = SideWinder.create_maze(CompactGrid(40, 30), batched=True, workers=2)
+
+        self.assertEqual(single.flags, pooled.flags)
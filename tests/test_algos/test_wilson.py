@@ -0,0 +1,43 @@
+import random
+import unittest
+
+from maze_creator.algos.wilson import Wilson
+from maze_creator.core.distances import Distances
+from maze_creator.core.mask import Mask
+from maze_creator.core.unvisited import UnvisitedCells
+from maze_creator.grids.compact_grid import CompactGrid
+from maze_creator.grids.grid import Grid
+from maze_creator.grids.masked_grid import MaskedGrid
+
+
+class TestWilson(unittest.TestCase):
+    def setUp(self):
+        random.seed(5)
+
+    def test_creates_perfect_maze(self):
+        mask = Mask(6, 6)
+        mask.bits[0][0] = False
+        mask.bits[3][3] = False
+
+        for grid in (Grid(8, 11), CompactGrid(8, 11), MaskedGrid(mask), Grid(1, 1)):
+            Wilson.create_maze(grid)
+            links = sum(cell.link_count() for cell in grid.each_cell()) // 2
+            root = next(grid.each_cell())
+            distances = Distances(root)
+            distances.calc_distances()
+
+            self.assertEqual(links, grid.size() - 1)
+            self.assertEqual(len(distances.get_all_cells()), grid.size())
+
+
+class TestUnvisitedCells(unittest.TestCase):
+    def test_visit_removes_from_pool(self):
+        unvisited = UnvisitedCells(Grid(3, 3))
+        unvisited.visit(4)
+        unvisited.visit(0)
+        unvisited.visit(4)
+
+        self.assertEqual(len(unvisited), 7)
+        self.assertNotIn(4, unvisited)
+        self.assertIn(8, unvisited)
+        self.assertEqual(sorted(unvisited.pool), [1, 2, 3, 5, 6, 7, 8])
@@ -28,15 +28,31 @@ class TestCells(unittest.TestCase):
 
     def test_link_cells(self):
         test_cell = Cell(1, 1)
-        test_cell_2 = Cell(2, 2)
+        test_cell_2 = Cell(2, 1)
         test_cell.link(test_cell_2)
 
         self.assertTrue(test_cell.is_linked(test_cell_2))
         self.assertTrue(test_cell_2.is_linked(test_cell))
 
-    def test_unlink_cells(self):
+    def test_link_non_neighbor_raises(self):
         test_cell = Cell(1, 1)
         test_cell_2 = Cell(2, 2)
+
+        with self.assertRaises(ValueError):
+            test_cell.link(test_cell_2)
+
+    def test_unlink_cells(self):
+        test_cell = Cell(1, 1)
+        test_cell_2 = Cell(2, 1)
         test_cell.link(test_cell_2)
         test_cell.unlink(test_cell_2)
         self.assertFalse(test_cell.is_linked(test_cell_2))
+        self.assertFalse(test_cell.is_visited())
+
+    def test_link_count(self):
+        test_cell = Cell(1, 1)
+        test_cell.link(Cell(0, 1))
+        test_cell.link(Cell(1, 0))
+
+        self.assertEqual(test_cell.link_count(), 2)
+        self.assertTrue(test_cell.is_visited())
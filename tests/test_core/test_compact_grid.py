@@ -0,0 +1,55 @@
+import unittest
+
+from maze_creator.algos.recursivebacktracker import RecursiveBackTracker
+from maze_creator.core.distances import Distances
+from maze_creator.core.mask import Mask
+from maze_creator.grids.compact_grid import CompactGrid, MaskedCompactGrid
+
+
+class TestCompactGrid(unittest.TestCase):
+    def test_grid_size(self):
+        test_grid = CompactGrid(2, 5)
+
+        expected = 10
+        self.assertEqual(test_grid.size(), expected)
+        self.assertEqual(len(test_grid.flags), expected)
+
+    def test_link_cells(self):
+        test_grid = CompactGrid(2, 2)
+        test_grid[0, 0].link(test_grid[0, 1])
+
+        self.assertTrue(test_grid[0, 0].is_linked(test_grid[0, 1]))
+        self.assertTrue(test_grid[0, 1].is_linked(test_grid[0, 0]))
+        self.assertFalse(test_grid[0, 0].is_linked(test_grid[1, 0]))
+
+    def test_unlink_cells(self):
+        test_grid = CompactGrid(2, 2)
+        test_grid[0, 0].link(test_grid[1, 0])
+        test_grid[0, 0].unlink(test_grid[1, 0])
+
+        self.assertEqual(len(test_grid[0, 0].links()), 0)
+        self.assertEqual(len(test_grid[1, 0].links()), 0)
+
+    def test_link_non_neighbor_raises(self):
+        test_grid = CompactGrid(3, 3)
+
+        with self.assertRaises(ValueError):
+            test_grid[0, 0].link(test_grid[1, 1])
+
+    def test_masked_cells(self):
+        mask = Mask(3, 3)
+        mask.bits[1][1] = False
+        test_grid = MaskedCompactGrid(mask)
+
+        self.assertIsNone(test_grid[1, 1])
+        self.assertIsNone(test_grid[0, 1].south)
+        self.assertEqual(test_grid.size(), 8)
+        self.assertEqual(len(list(test_grid.each_cell())), 8)
+
+    def test_algorithm_runs_unchanged(self):
+        test_grid = RecursiveBackTracker.create_maze(CompactGrid(5, 5))
+        distances = Distances(test_grid[0, 0])
+        distances.calc_distances()
+
+        # A perfect maze reaches every cell from any root
+        self.assertEqual(len(distances.get_all_cells()), 25)
@@ -0,0 +1,101 @@
+import random
+import unittest
+
+from maze_creator.algos.recursivebacktracker import RecursiveBackTracker
+from maze_creator.core.distance_fields import MultiSourceDistanceGrid, distance_matrix
+from maze_creator.core.distance_grid import UNREACHABLE, DistanceGrid
+from maze_creator.core.mask import Mask
+from maze_creator.grids.compact_grid import CompactGrid
+from maze_creator.grids.grid import Grid
+from maze_creator.grids.masked_grid import MaskedGrid
+from maze_creator.maze import Maze
+from maze_creator.views.distances_view import DistancesView
+
+
+def single_source(grid, cell):
+    distances = DistanceGrid(grid, cell)
+    distances.calc_distances()
+    return distances
+
+
+class TestMultiSourceDistanceGrid(unittest.TestCase):
+    def setUp(self):
+        random.seed(14)
+        self.grid = RecursiveBackTracker.create_maze(Grid(8, 8))
+        self.sources = [self.grid[0, 0], self.grid[7, 7], self.grid[3, 5]]
+
+    def test_distance_to_nearest_source(self):
+        nearest = MultiSourceDistanceGrid(self.grid, self.sources)
+        nearest.calc_distances()
+        fields = [single_source(self.grid, source) for source in self.sources]
+
+        for cell in self.grid.each_cell():
+            distances = [field.get_cell_distance(cell) for field in fields]
+            self.assertEqual(nearest.get_cell_distance(cell), min(distances))
+            source = nearest.get_cell_source(cell)
+            self.assertEqual(
+                distances[self.sources.index(source)], nearest.get_cell_distance(cell)
+            )
+
+    def test_path_leads_to_nearest_source(self):
+        nearest = MultiSourceDistanceGrid(self.grid, self.sources)
+        nearest.calc_distances()
+        goal = self.grid[4, 4]
+        path = nearest.path_to(goal)
+
+        source = nearest.get_cell_source(goal)
+        self.assertEqual(path[0], (source.row, source.column))
+        self.assertEqual(path.distance(), nearest.get_cell_distance(goal))
+
+    def test_duplicate_sources(self):
+        grid = Grid(1, 3)
+        grid[0, 0].link(grid[0, 1])
+        nearest = MultiSourceDistanceGrid(grid, [grid[0, 0], grid[0, 0]])
+        nearest.calc_distances()
+
+        self.assertEqual(nearest.get_cell_distance(grid[0, 1]), 1)
+        self.assertEqual(nearest.get_cell_source(grid[0, 1]), grid[0, 0])
+        self.assertIsNone(nearest.get_cell_source(grid[0, 2]))
+
+    def test_no_sources(self):
+        with self.assertRaises(Exception):
+            MultiSourceDistanceGrid(self.grid, [])
+
+    def test_distances_view_sources(self):
+        maze = Maze(6, 6, "recursive")
+        view = DistancesView(maze, 0, 0, sources=[(0, 0), (5, 5)])
+        self.assertIsInstance(view.distances, MultiSourceDistanceGrid)
+        self.assertEqual(view.distances.get_cell_distance(maze.grid[5, 5]), 0)
+
+
+class TestDistanceMatrix(unittest.TestCase):
+    def setUp(self):
+        random.seed(14)
+
+    def test_rows_match_single_source(self):
+        grid = RecursiveBackTracker.create_maze(CompactGrid(6, 7))
+        cells = [grid[0, 0], grid[5, 6], grid[2, 3]]
+        matrix = distance_matrix(grid, cells)
+        size = grid.rows * grid.columns
+
+        self.assertEqual(len(matrix), len(cells) * size)
+        for k, cell in enumerate(cells):
+            field = single_source(grid, cell)
+            self.assertEqual(
+                list(matrix[k * size : (k + 1) * size]), list(field.distances)
+            )
+
+    def test_workers_match_serial(self):
+        grid = RecursiveBackTracker.create_maze(Grid(5, 5))
+        cells = [grid.random_cell() for _ in range(5)]
+        self.assertEqual(
+            distance_matrix(grid, cells, workers=2), distance_matrix(grid, cells)
+        )
+
+    def test_masked_cells_unreachable(self):
+        mask = Mask(2, 2)
+        mask.bits[1][1] = False
+        grid = RecursiveBackTracker.create_maze(MaskedGrid(mask))
+        matrix = distance_matrix(grid, [grid[0, 0]])
+        self.assertEqual(matrix[3], UNREACHABLE)
+        self.assertEqual(list(matrix[:3]), [0, 1, 1])
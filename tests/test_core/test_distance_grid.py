@@ -1,6 +1,81 @@
 import unittest
 
+from maze_creator.core.distance_grid import DistanceGrid
+from maze_creator.core.mask import Mask
+from maze_creator.grids.compact_grid import CompactGrid
+from maze_creator.grids.grid import Grid
+from maze_creator.grids.masked_grid import MaskedGrid
+
+# A 3x3 grid carved into a single snaking corridor
+CORRIDOR = [(0, 0), (0, 1), (0, 2), (1, 2), (1, 1), (1, 0), (2, 0), (2, 1), (2, 2)]
+
+
+def carve_corridor(grid):
+    for (row, column), (next_row, next_column) in zip(CORRIDOR, CORRIDOR[1:]):
+        grid[row, column].link(grid[next_row, next_column])
+    return grid
+
 
 class TestDistanceGrids(unittest.TestCase):
+    def setUp(self):
+        self.grid = carve_corridor(Grid(3, 3))
+
     def test_grid_setup(self):
-        pass
+        distances = DistanceGrid(self.grid, self.grid[0, 0])
+
+        self.assertEqual(len(distances.distances), 9)
+        self.assertEqual(distances.get_cell_distance(self.grid[0, 0]), 0)
+        self.assertIsNone(distances.get_cell_distance(self.grid[2, 2]))
+
+    def test_distances_follow_links(self):
+        distances = DistanceGrid(self.grid, self.grid[0, 0])
+        distances.calc_distances()
+
+        for expected, (row, column) in enumerate(CORRIDOR):
+            self.assertEqual(
+                distances.get_cell_distance(self.grid[row, column]), expected
+            )
+        self.assertEqual(distances.max(), (self.grid[2, 2], 8))
+
+    def test_path_to(self):
+        for grid in (self.grid, carve_corridor(CompactGrid(3, 3))):
+            distances = DistanceGrid(grid, grid[1, 2])
+            distances.calc_distances()
+            path = distances.path_to(grid[2, 0])
+
+            self.assertEqual(list(path), [(1, 2), (1, 1), (1, 0), (2, 0)])
+            self.assertEqual(path.distance(), 3)
+
+    def test_path_to_with_parents(self):
+        distances = DistanceGrid(self.grid, self.grid[0, 0], track_parents=True)
+        distances.calc_distances()
+        path = distances.path_to(self.grid[2, 2])
+
+        self.assertEqual(list(path), CORRIDOR)
+        self.assertEqual(distances.get_cell_distance(self.grid[2, 2]), 8)
+
+    def test_path_membership(self):
+        distances = DistanceGrid(self.grid, self.grid[0, 2], track_parents=True)
+        distances.calc_distances()
+        path = distances.path_to(self.grid[1, 0])
+
+        self.assertIn(self.grid[1, 1], path)
+        self.assertIn((0, 2), path)
+        self.assertNotIn(self.grid[0, 0], path)
+        self.assertNotIn(None, path)
+        self.assertEqual(path[-1], (1, 0))
+
+    def test_unreachable_cells(self):
+        mask = Mask(2, 2)
+        mask.bits[1][1] = False
+        grid = MaskedGrid(mask)
+        grid[0, 0].link(grid[0, 1])
+        distances = DistanceGrid(grid, grid[0, 0])
+        distances.calc_distances()
+
+        self.assertEqual(distances.get_cell_distance(grid[0, 1]), 1)
+        self.assertIsNone(distances.get_cell_distance(grid[1, 0]))
+        # Masked out locations come back from the grid as None
+        self.assertIsNone(distances.get_cell_distance(grid[1, 1]))
+        with self.assertRaises(Exception):
+            distances.path_to(grid[1, 0])
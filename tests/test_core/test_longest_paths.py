@@ -0,0 +1,62 @@
+import random
+import unittest
+
+from maze_creator.algos.wilson import Wilson
+from maze_creator.core.distance_grid import DistanceGrid
+from maze_creator.core.longest_paths import (
+    component_longest_paths,
+    diameter,
+    longest_path,
+)
+from maze_creator.core.mask import Mask
+from maze_creator.grids.compact_grid import CompactGrid
+from maze_creator.grids.grid import Grid
+from maze_creator.grids.masked_grid import MaskedGrid
+
+
+def brute_force_diameter(grid):
+    longest = 0
+    for cell in grid.each_cell():
+        distances = DistanceGrid(grid, cell)
+        distances.calc_distances()
+        longest = max(longest, distances.max()[1])
+    return longest
+
+
+class TestLongestPaths(unittest.TestCase):
+    def setUp(self):
+        random.seed(15)
+
+    def test_matches_brute_force(self):
+        for grid in (
+            Wilson.create_maze(Grid(7, 8)),
+            Wilson.create_maze(CompactGrid(5, 9)),
+        ):
+            path = longest_path(grid)
+            self.assertEqual(path.distance(), brute_force_diameter(grid))
+            self.assertEqual(diameter(grid), path.distance())
+
+            # The path has to be a real route between its two ends
+            for (row, column), step in zip(path, list(path)[1:]):
+                self.assertTrue(grid[row, column].is_linked(grid[step]))
+
+    def test_components(self):
+        # Two 2x3 islands split by a masked-out column, carved into straight corridors of different lengths
+        mask = Mask(2, 5)
+        mask.bits[0][2] = mask.bits[1][2] = False
+        grid = MaskedGrid(mask)
+        grid[0, 0].link(grid[0, 1])
+        grid[0, 1].link(grid[1, 1])
+        grid[1, 1].link(grid[1, 0])
+        grid[0, 3].link(grid[0, 4])
+
+        paths = component_longest_paths(grid)
+        self.assertEqual([path.distance() for path in paths], [3, 1])
+        self.assertEqual({paths[0][0], paths[0][-1]}, {(0, 0), (1, 0)})
+        self.assertEqual(longest_path(grid).distance(), 3)
+
+    def test_unlinked_grid(self):
+        grid = Grid(1, 1)
+        self.assertEqual(component_longest_paths(grid), [])
+        self.assertEqual(list(longest_path(grid)), [(0, 0)])
+        self.assertEqual(diameter(grid), 0)
@@ -0,0 +1,138 @@
+import os
+import pickle
+import random
+import tempfile
+import unittest
+
+from maze_creator.core.distance_grid import DistanceGrid
+from maze_creator.core.mask import Mask
+from maze_creator.grids.grid import Grid
+from maze_creator.grids.mapped_grid import HEADER, MappedGrid
+from maze_creator.grids.masked_grid import MaskedGrid
+from maze_creator.masked_maze import MaskedMaze
+from maze_creator.maze import Maze
+
+
+class TestMappedGrid(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "maze.bin")
+
+    def save_and_open(self, grid):
+        MappedGrid.save(grid, self.path)
+        mapped = MappedGrid.from_file(self.path)
+        self.addCleanup(mapped.close)
+        return mapped
+
+    def test_round_trip(self):
+        random.seed(23)
+        # Widths that do and don't fill whole bytes of the link plane
+        for columns in (1, 4, 7, 8):
+            for compact in (False, True):
+                maze = Maze(5, columns, "wilson", compact=compact)
+                mapped = self.save_and_open(maze.grid)
+
+                self.assertEqual((mapped.rows, mapped.columns), (5, columns))
+                self.assertEqual(mapped.link_masks(), maze.grid.link_masks())
+                self.assertEqual(str(mapped), str(maze))
+                for cell in maze.grid.each_cell():
+                    self.assertEqual(
+                        {
+                            (c.row, c.column)
+                            for c in mapped[cell.row, cell.column].links()
+                        },
+                        {(c.row, c.column) for c in cell.links()},
+                    )
+
+    def test_two_bits_per_cell(self):
+        MappedGrid.save(Grid(4, 8), self.path)
+        self.assertEqual(os.path.getsize(self.path), HEADER.size + 4 * 2)
+
+    def test_link_mask_bands(self):
+        random.seed(24)
+        grid = Maze(6, 5, "recursive").grid
+        mapped = self.save_and_open(grid)
+
+        for first_row in range(6):
+            for row_count in (1, 2, 6):
+                self.assertEqual(
+                    mapped.link_masks(first_row, row_count),
+                    grid.link_masks(first_row, row_count),
+                )
+
+    def test_masked_round_trip(self):
+        random.seed(25)
+        mask = Mask(6, 10)
+        mask.bits[1][1] = False
+        mask.bits[5][9] = False
+        maze = MaskedMaze(mask, "recursive")
+        mapped = self.save_and_open(maze.grid)
+
+        self.assertIsNone(mapped[1, 1])
+        self.assertIsNone(mapped[5, 9])
+        self.assertEqual(mapped.size(), 58)
+        self.assertEqual(mapped.present_cells(), maze.grid.present_cells())
+        self.assertEqual(str(mapped), str(maze))
+        for _ in range(20):
+            self.assertIsNotNone(mapped.random_cell())
+
+    def test_random_cell_on_sparse_mask(self):
+        random.seed(29)
+        cells = bytearray(400)
+        cells[17] = cells[333] = 1
+        mapped = self.save_and_open(MaskedGrid(Mask.from_cells(20, 20, cells)))
+
+        picks = {
+            (cell.row, cell.column) for cell in (mapped.random_cell() for _ in range(50))
+        }
+        self.assertEqual(picks, {(0, 17), (16, 13)})
+
+    def test_read_only(self):
+        mapped = self.save_and_open(Grid(2, 2))
+        with self.assertRaises(Exception):
+            mapped[0, 0].link(mapped[0, 1])
+        with self.assertRaises(Exception):
+            mapped.merge_link_masks(bytes(4))
+
+    def test_distances_and_pickling(self):
+        random.seed(26)
+        maze = Maze(8, 8, "wilson", compact=True)
+        mapped = self.save_and_open(maze.grid)
+
+        expected = DistanceGrid(maze.grid, maze.grid[0, 0])
+        expected.calc_distances()
+        distances = DistanceGrid(mapped, mapped[0, 0])
+        distances.calc_distances()
+        self.assertEqual(distances.distances, expected.distances)
+
+        reopened = pickle.loads(pickle.dumps(mapped))
+        self.addCleanup(reopened.close)
+        self.assertEqual(reopened.link_masks(), mapped.link_masks())
+
+    def test_saving_over_an_open_file(self):
+        random.seed(28)
+        first = Maze(3, 3, "wilson")
+        mapped = self.save_and_open(first.grid)
+        MappedGrid.save(Maze(5, 5, "wilson").grid, self.path)
+
+        self.assertEqual(str(mapped), str(first))
+
+    def test_not_a_maze_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a maze at all")
+        with self.assertRaises(Exception):
+            MappedGrid.from_file(self.path)
+
+    def test_maze_from_file(self):
+        random.seed(27)
+        maze = Maze(4, 6, "wilson")
+        MappedGrid.save(maze.grid, self.path)
+        loaded = Maze.from_file(self.path)
+        self.addCleanup(loaded.grid.close)
+
+        self.assertEqual(str(loaded), str(maze))
+
+
+if __name__ == "__main__":
+    unittest.main()
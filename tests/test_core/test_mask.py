@@ -1,5 +1,10 @@
+import os
+import random
+import tempfile
 import unittest
 
+from PIL import Image
+
 from maze_creator.core.mask import Mask
 
 
@@ -11,3 +16,145 @@ class TestMask(unittest.TestCase):
         expected = 14
         actual = mask.count()
         self.assertEqual(expected, actual)
+
+    def test_set_and_get(self):
+        mask = Mask(3, 11)
+        mask[2, 10] = False
+        mask[0, 3] = False
+        mask[0, 3] = True
+
+        self.assertFalse(mask[2, 10])
+        self.assertTrue(mask[0, 3])
+        self.assertIsNone(mask[3, 0])
+        self.assertEqual(mask.count(), 32)
+        self.assertEqual(list(mask.bits[2])[-2:], [True, False])
+        with self.assertRaises(Exception):
+            mask[0, 11] = False
+
+    def test_bits_rows(self):
+        mask = Mask(3, 4)
+        mask.bits[2][1] = False
+
+        self.assertEqual(len(mask.bits), 3)
+        self.assertEqual(
+            [list(row) for row in mask.bits],
+            [[True] * 4, [True] * 4, [True, False, True, True]],
+        )
+        with self.assertRaises(IndexError):
+            mask.bits[3]
+
+    def test_packed_bits(self):
+        mask = Mask(2, 10)
+        mask[0, 0] = False
+        mask[1, 9] = False
+
+        # Each row takes two bytes, first column in the most significant bit and the padding left clear
+        self.assertEqual(bytes(mask.packed), bytes([0x7F, 0xC0, 0xFF, 0x80]))
+
+    def test_enabled_cells_round_trip(self):
+        mask = Mask(3, 5)
+        mask[1, 2] = False
+        cells = mask.enabled_cells()
+
+        self.assertEqual(cells, b"\x01" * 7 + b"\x00" + b"\x01" * 7)
+        self.assertEqual(Mask.from_cells(3, 5, cells).packed, mask.packed)
+
+    def test_random_location_on_sparse_mask(self):
+        random.seed(25)
+        cells = bytearray(400)
+        cells[17] = cells[333] = 1
+        mask = Mask.from_cells(20, 20, cells)
+
+        picks = {mask.random_location() for _ in range(50)}
+        self.assertEqual(picks, {(0, 17), (16, 13)})
+
+    def test_index_follows_changes(self):
+        random.seed(26)
+        mask = Mask(2, 2)
+        self.assertEqual(mask.count(), 4)
+        mask.random_location()
+
+        mask[0, 0] = False
+        mask[0, 1] = False
+        mask[1, 0] = False
+        self.assertEqual(mask.count(), 1)
+        self.assertEqual(mask.random_location(), (1, 1))
+
+        mask[1, 1] = False
+        self.assertEqual(mask.count(), 0)
+        with self.assertRaises(Exception):
+            mask.random_location()
+
+    def test_sample(self):
+        random.seed(27)
+        mask = Mask(4, 5)
+        mask[2, 2] = False
+        picks = mask.sample(19)
+
+        self.assertEqual(len(set(picks)), 19)
+        self.assertNotIn((2, 2), picks)
+        self.assertTrue(all(mask[pick] for pick in picks))
+        with self.assertRaises(Exception):
+            mask.sample(20)
+
+    def test_from_txt(self):
+        mask = Mask.from_txt(
+            os.path.join(os.path.dirname(__file__), "../../docs/masks/simple_mask.txt")
+        )
+
+        self.assertEqual((mask.rows, mask.columns), (10, 10))
+        self.assertFalse(mask[0, 0])
+        self.assertTrue(mask[0, 1])
+        self.assertEqual(mask.count(), 76)
+
+
+class TestMaskFromImage(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def save(self, image, name="mask.png"):
+        path = os.path.join(self.directory, name)
+        image.save(path)
+        return path
+
+    def test_black_pixels_are_disabled(self):
+        image = Image.new("RGB", (9, 3), (255, 255, 255))
+        image.putpixel((0, 0), (0, 0, 0))
+        image.putpixel((8, 2), (0, 0, 0))
+        mask = Mask.from_image(self.save(image))
+
+        self.assertEqual((mask.rows, mask.columns), (3, 9))
+        self.assertFalse(mask[0, 0])
+        self.assertFalse(mask[2, 8])
+        self.assertEqual(mask.count(), 25)
+
+    def test_any_image_mode(self):
+        image = Image.new("RGB", (6, 4), (255, 255, 255))
+        image.putpixel((2, 1), (0, 0, 0))
+        expected = Mask.from_image(self.save(image)).packed
+
+        for mode in ("L", "P", "RGBA", "1"):
+            path = self.save(image.convert(mode), f"mask_{mode}.png")
+            self.assertEqual(Mask.from_image(path).packed, expected, mode)
+
+    def test_cutoff(self):
+        image = Image.new("L", (3, 1))
+        image.putdata([0, 100, 200])
+        path = self.save(image)
+
+        self.assertEqual(Mask.from_image(path).enabled_cells(), b"\x00\x00\x01")
+        self.assertEqual(
+            Mask.from_image(path, cutoff=50).enabled_cells(), b"\x00\x01\x01"
+        )
+        self.assertEqual(Mask.from_image(path, cutoff=0).count(), 3)
+
+    def test_alpha(self):
+        image = Image.new("RGBA", (3, 1), (0, 0, 0, 255))
+        image.putpixel((1, 0), (255, 255, 255, 0))
+        path = self.save(image)
+
+        self.assertEqual(
+            Mask.from_image(path, alpha=True).enabled_cells(), b"\x01\x00\x01"
+        )
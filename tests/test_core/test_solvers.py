@@ -0,0 +1,86 @@
+import random
+import unittest
+
+from maze_creator.algos.binarytree import BinaryTree
+from maze_creator.algos.recursivebacktracker import RecursiveBackTracker
+from maze_creator.core.distance_grid import DistanceGrid
+from maze_creator.core.mask import Mask
+from maze_creator.core.solvers import AStar, BidirectionalBFS
+from maze_creator.grids.compact_grid import CompactGrid
+from maze_creator.grids.grid import Grid
+from maze_creator.grids.masked_grid import MaskedGrid
+from maze_creator.maze import Maze
+from maze_creator.views.path_finder_view import PathFinderView
+
+SOLVERS = (BidirectionalBFS, AStar)
+
+
+def braid(grid, count):
+    """
+    Knock down some extra walls so the maze has loops and more than one route between cells
+    """
+    for _ in range(count):
+        cell = grid.random_cell()
+        neighbor = random.choice(cell.neighbors())
+        cell.link(neighbor)
+    return grid
+
+
+class TestSolvers(unittest.TestCase):
+    def setUp(self):
+        random.seed(12)
+
+    def assert_shortest(self, grid, path, start, goal):
+        search = DistanceGrid(grid, start)
+        search.calc_distances()
+        self.assertEqual(path.distance(), search.get_cell_distance(goal))
+        self.assertEqual(path[0], (start.row, start.column))
+        self.assertEqual(path[-1], (goal.row, goal.column))
+        # Every step of the path has to go through a link
+        for (row, column), step in zip(path, list(path)[1:]):
+            self.assertTrue(grid[row, column].is_linked(grid[step]))
+
+    def test_paths_are_shortest(self):
+        for grid in (
+            RecursiveBackTracker.create_maze(Grid(10, 12)),
+            braid(RecursiveBackTracker.create_maze(CompactGrid(10, 12)), 30),
+        ):
+            for _ in range(20):
+                start, goal = grid.random_cell(), grid.random_cell()
+                for solver in SOLVERS:
+                    path, expanded = solver.solve(grid, start, goal)
+                    self.assert_shortest(grid, path, start, goal)
+                    self.assertLessEqual(expanded, grid.size())
+
+    def test_start_is_goal(self):
+        grid = BinaryTree.create_maze(Grid(4, 4))
+        for solver in SOLVERS:
+            path, expanded = solver.solve(grid, grid[2, 2], grid[2, 2])
+            self.assertEqual(list(path), [(2, 2)])
+            self.assertEqual(expanded, 0)
+
+    def test_nearby_goal_stays_local(self):
+        grid = BinaryTree.create_maze(CompactGrid(200, 200), vectorized=True)
+        # Binary tree mazes always have an open corridor along the top row
+        for solver in SOLVERS:
+            path, expanded = solver.solve(grid, grid[0, 100], grid[0, 102])
+            self.assertEqual(path.distance(), 2)
+            self.assertLess(expanded, 100)
+
+    def test_unreachable_goal(self):
+        mask = Mask(2, 2)
+        mask.bits[1][1] = False
+        grid = MaskedGrid(mask)
+        grid[0, 0].link(grid[0, 1])
+        for solver in SOLVERS:
+            with self.assertRaises(Exception):
+                solver.solve(grid, grid[0, 0], grid[1, 0])
+
+    def test_path_finder_view_solver(self):
+        maze = Maze(8, 8, "wilson")
+        searched = PathFinderView(maze, 0, 0, 7, 7)
+        for solver in ("bidirectional", "astar", "tree"):
+            view = PathFinderView(maze, 0, 0, 7, 7, solver=solver)
+            self.assertEqual(list(view.path), list(searched.path))
+        with self.assertRaises(Exception):
+            PathFinderView(maze, 0, 0, 7, 7, solver="dfs")
@@ -0,0 +1,64 @@
+import random
+import unittest
+
+from maze_creator.algos.wilson import Wilson
+from maze_creator.core.distance_grid import DistanceGrid
+from maze_creator.core.mask import Mask
+from maze_creator.core.tree_distances import TreeDistances
+from maze_creator.grids.grid import Grid
+from maze_creator.grids.masked_grid import MaskedGrid
+from maze_creator.maze import Maze
+from maze_creator.views.path_finder_view import PathFinderView
+
+
+class TestTreeDistances(unittest.TestCase):
+    def setUp(self):
+        random.seed(11)
+        self.grid = Wilson.create_maze(Grid(8, 9))
+        self.index = TreeDistances(self.grid)
+
+    def test_distances_match_breadth_first_search(self):
+        for _ in range(10):
+            start = self.grid.random_cell()
+            search = DistanceGrid(self.grid, start)
+            search.calc_distances()
+            for goal in self.grid.each_cell():
+                self.assertEqual(
+                    self.index.distance(start, goal), search.get_cell_distance(goal)
+                )
+
+    def test_path_matches_breadth_first_search(self):
+        for _ in range(20):
+            start, goal = self.grid.random_cell(), self.grid.random_cell()
+            search = DistanceGrid(self.grid, start)
+            search.calc_distances()
+
+            path = self.index.path(start, goal)
+            self.assertEqual(list(path), list(search.path_to(goal)))
+            self.assertEqual(path.distance(), self.index.distance(start, goal))
+
+    def test_path_to_self(self):
+        cell = self.grid[3, 4]
+        self.assertEqual(self.index.distance(cell, cell), 0)
+        self.assertEqual(list(self.index.path(cell, cell)), [(3, 4)])
+
+    def test_unreachable_cells(self):
+        mask = Mask(2, 2)
+        mask.bits[1][1] = False
+        grid = MaskedGrid(mask)
+        grid[0, 0].link(grid[0, 1])
+        index = TreeDistances(grid)
+
+        self.assertEqual(index.distance(grid[0, 1], grid[0, 0]), 1)
+        self.assertIsNone(index.distance(grid[0, 0], grid[1, 0]))
+        with self.assertRaises(Exception):
+            index.path(grid[0, 0], grid[1, 0])
+
+    def test_indexed_path_finder_view(self):
+        maze = Maze(6, 6, "recursive")
+        self.assertIs(maze.tree_distances(), maze.tree_distances())
+
+        indexed = PathFinderView(maze, 0, 0, 5, 5, solver="tree")
+        searched = PathFinderView(maze, 0, 0, 5, 5)
+        self.assertEqual(list(indexed.path), list(searched.path))
+        self.assertEqual(indexed.path_distance, searched.path_distance)
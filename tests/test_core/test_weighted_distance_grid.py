@@ -0,0 +1,73 @@
+import random
+import unittest
+
+from maze_creator.algos.recursivebacktracker import RecursiveBackTracker
+from maze_creator.core.distance_grid import DistanceGrid
+from maze_creator.core.weighted_distance_grid import WeightedDistanceGrid
+from maze_creator.grids.compact_grid import CompactGrid
+from maze_creator.grids.grid import Grid
+from maze_creator.maze import Maze
+from maze_creator.views.path_finder_view import PathFinderView
+
+
+def open_grid(grid):
+    """
+    Link every cell to its eastern and southern neighbors so there are many routes between cells
+    """
+    for cell in grid.each_cell():
+        for neighbor in (cell.east, cell.south):
+            if neighbor is not None:
+                cell.link(neighbor)
+    return grid
+
+
+class TestWeightedDistanceGrid(unittest.TestCase):
+    def test_unweighted_matches_breadth_first_search(self):
+        random.seed(13)
+        grid = RecursiveBackTracker.create_maze(Grid(7, 9))
+        start = grid[3, 3]
+        weighted = WeightedDistanceGrid(grid, start)
+        weighted.calc_distances()
+        search = DistanceGrid(grid, start)
+        search.calc_distances()
+
+        self.assertEqual(list(weighted.distances), list(search.distances))
+        self.assertEqual(weighted.max(), search.max())
+
+    def test_path_goes_around_heavy_cells(self):
+        for grid in (open_grid(Grid(3, 3)), open_grid(CompactGrid(3, 3))):
+            # Lava straight through the middle row apart from the far east column
+            grid.set_weight(grid[1, 0], 50)
+            grid.set_weight(grid[1, 1], 50)
+
+            distances = WeightedDistanceGrid(grid, grid[0, 0])
+            distances.calc_distances()
+            path = distances.path_to(grid[2, 0])
+
+            self.assertEqual(
+                list(path), [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1), (2, 0)]
+            )
+            self.assertEqual(distances.get_cell_distance(grid[2, 0]), 6)
+            self.assertEqual(grid.get_weight(grid[1, 1]), 50)
+            self.assertEqual(grid.get_weight(grid[2, 2]), 1)
+
+    def test_cheaper_to_cross_than_go_around(self):
+        grid = open_grid(Grid(3, 3))
+        grid.set_weight(grid[1, 0], 3)
+
+        distances = WeightedDistanceGrid(grid, grid[0, 0])
+        distances.calc_distances()
+
+        self.assertEqual(list(distances.path_to(grid[2, 0])), [(0, 0), (1, 0), (2, 0)])
+        self.assertEqual(distances.get_cell_distance(grid[2, 0]), 4)
+
+    def test_negative_weight(self):
+        grid = Grid(2, 2)
+        with self.assertRaises(Exception):
+            grid.set_weight(grid[0, 0], -1)
+
+    def test_path_finder_view_solver(self):
+        maze = Maze(6, 6, "hunt")
+        weighted = PathFinderView(maze, 0, 0, 5, 5, solver="dijkstra")
+        searched = PathFinderView(maze, 0, 0, 5, 5)
+        self.assertEqual(list(weighted.path), list(searched.path))
@@ -0,0 +1,74 @@
+import random
+import unittest
+from array import array
+
+from maze_creator.maze import Maze
+from maze_creator.views.distances_view import DistancesView
+from maze_creator.visuals.maze_image_creator import MazeImageCreator
+from maze_creator.visuals.palettes import (
+    LEVELS,
+    PALETTES,
+    ColorChoice,
+    distance_levels,
+    heatmap_rgb,
+    make_palette,
+    palette_for,
+)
+from maze_creator.visuals.raster_image_creator import RasterImageCreator
+
+GREYS = make_palette(lambda intensity: (int(255 * intensity),) * 3)
+
+
+class TestPalettes(unittest.TestCase):
+    def test_palette_ends(self):
+        blue = PALETTES[ColorChoice.BLUE]
+        self.assertEqual(len(blue), 3 * LEVELS)
+        # Root first, farthest cell last
+        self.assertEqual(tuple(blue[:3]), (1, 255, 255))
+        self.assertEqual(tuple(blue[-3:]), (0, 0, 128))
+        self.assertEqual(tuple(GREYS[:3]), (255, 255, 255))
+
+    def test_palette_for(self):
+        self.assertIs(palette_for(ColorChoice.RED), PALETTES[ColorChoice.RED])
+        self.assertEqual(palette_for(GREYS), GREYS)
+        with self.assertRaises(Exception):
+            palette_for(GREYS[:-3])
+        with self.assertRaises(Exception):
+            palette_for("plaid")
+
+    def test_levels(self):
+        distances = array("i", [0, 5, 10, -1, 2])
+        self.assertEqual(list(distance_levels(distances, 10)), [0, 127, 255, 0, 51])
+        # Distances past the number of cells, like weighted ones
+        self.assertEqual(
+            list(distance_levels(array("q", [0, 700, -1]), 1000)), [0, 178, 0]
+        )
+
+    def test_heatmap_rgb(self):
+        distances = array("i", [0, 3, -1, 6])
+        rgb = heatmap_rgb(distances, 6, GREYS, b"\x01\x02\x03")
+        self.assertEqual(list(rgb), [255, 255, 255, 128, 128, 128, 1, 2, 3, 0, 0, 0])
+
+    def test_matches_per_cell_colors(self):
+        random.seed(20)
+        view = DistancesView(Maze(6, 7, "wilson"), 3, 3)
+        for choice in (ColorChoice.BLUE, ColorChoice.YELLOW, GREYS):
+            creator = MazeImageCreator(view, "distance", choice)
+            rgb = heatmap_rgb(view.distances.distances, view.max, palette_for(choice))
+            for cell in view.grid.each_cell():
+                position = 3 * (cell.row * 7 + cell.column)
+                self.assertEqual(
+                    tuple(rgb[position : position + 3]),
+                    creator.background_color_for(cell, (255, 255, 255), choice),
+                )
+            # The renderers take their colors straight from the heatmap buffer
+            self.assertEqual(creator._cell_colors(b"\xff\xff\xff"), bytes(rgb))
+
+    def test_custom_palette_render(self):
+        random.seed(20)
+        view = DistancesView(Maze(4, 4, "recursive"), 0, 0)
+        image = RasterImageCreator(view, "distance", GREYS).render(
+            cell_size=10, line_thickness=2
+        )
+        # The root cell is the brightest
+        self.assertEqual(image.getpixel((15, 15)), (255, 255, 255))
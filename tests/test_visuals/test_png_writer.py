@@ -0,0 +1,84 @@
+import io
+import random
+import unittest
+import zlib
+
+from PIL import Image
+
+from maze_creator.maze import Maze
+from maze_creator.views.distances_view import DistancesView
+from maze_creator.visuals.maze_image_creator import MazeImageCreator
+from maze_creator.visuals.png_writer import PNGWriter
+from maze_creator.visuals.raster_image_creator import RasterImageCreator
+
+
+def encode(width, height, pixels, rows_per_write):
+    output = io.BytesIO()
+    writer = PNGWriter(output, width, height)
+    stride = 3 * width * rows_per_write
+    for offset in range(0, len(pixels), stride):
+        writer.write_rows(pixels[offset : offset + stride])
+    writer.close()
+    return output.getvalue()
+
+
+class TestPNGWriter(unittest.TestCase):
+    def test_decodes_to_same_pixels(self):
+        random.seed(18)
+        width, height = 37, 23
+        pixels = random.randbytes(3 * width * height)
+        image = Image.open(io.BytesIO(encode(width, height, pixels, 5)))
+
+        self.assertEqual(image.size, (width, height))
+        self.assertEqual(image.mode, "RGB")
+        self.assertEqual(image.tobytes(), pixels)
+
+    def test_bytes_do_not_depend_on_band_size(self):
+        random.seed(18)
+        width, height = 200, 180
+        # Noise compresses badly, so the data spans several IDAT chunks
+        pixels = random.randbytes(3 * width * height)
+        whole = encode(width, height, pixels, height)
+        self.assertEqual(encode(width, height, pixels, 1), whole)
+        self.assertEqual(encode(width, height, pixels, 7), whole)
+
+    def test_rows_use_up_filter(self):
+        random.seed(18)
+        width, height = 9, 6
+        row = random.randbytes(3 * width)
+        png = encode(width, height, row * height, 4)
+
+        # The test image fits in a single IDAT chunk
+        start = png.index(b"IDAT") + 4
+        length = int.from_bytes(png[start - 8 : start - 4], "big")
+        scanlines = zlib.decompress(png[start : start + length])
+        stride = 3 * width + 1
+        self.assertEqual(scanlines[:stride], b"\x02" + row)
+        # Every later row repeats the one above it, so it filters down to nothing but zeros
+        self.assertEqual(scanlines[stride:], (b"\x02" + bytes(3 * width)) * (height - 1))
+
+    def test_row_count_checked(self):
+        writer = PNGWriter(io.BytesIO(), 2, 2)
+        with self.assertRaises(Exception):
+            writer.write_rows(b"\x00" * 5)
+        writer.write_rows(b"\x00" * 6)
+        with self.assertRaises(Exception):
+            writer.close()
+
+
+class TestStreamingExport(unittest.TestCase):
+    def test_streamed_png_matches_in_memory_render(self):
+        random.seed(18)
+        maze = Maze(5, 6, "wilson")
+        view = DistancesView(maze, 2, 2)
+
+        streamed = io.BytesIO()
+        RasterImageCreator(view, "distance").write_png(
+            streamed, cell_size=20, line_thickness=2
+        )
+        image = MazeImageCreator(view, "distance").render(cell_size=20, line_thickness=2)
+
+        self.assertEqual(
+            Image.open(io.BytesIO(streamed.getvalue())).tobytes(), image.tobytes()
+        )
+        self.assertEqual(streamed.getvalue(), MazeImageCreator.to_png(image))
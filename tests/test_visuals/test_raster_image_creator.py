@@ -0,0 +1,107 @@
+import random
+import unittest
+
+from maze_creator.core.mask import Mask
+from maze_creator.masked_maze import MaskedMaze
+from maze_creator.maze import Maze
+from maze_creator.views.distances_view import DistancesView
+from maze_creator.views.path_finder_view import PathFinderView
+from maze_creator.visuals.maze_image_creator import BORDER, MazeImageCreator
+from maze_creator.visuals.raster_image_creator import RasterImageCreator
+
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+
+
+class TestRasterImageCreator(unittest.TestCase):
+    def setUp(self):
+        random.seed(16)
+        self.maze = Maze(4, 5, "recursive")
+
+    def pixel(self, image, x, y):
+        # Coordinates inside the frame
+        return image.getpixel((BORDER + x, BORDER + y))
+
+    def test_same_size_as_pillow_renderer(self):
+        for creator in (RasterImageCreator, MazeImageCreator):
+            image = creator(self.maze).render(cell_size=20, line_thickness=2)
+            self.assertEqual(
+                image.size, (20 * 5 + 1 + 2 * BORDER, 20 * 4 + 1 + 2 * BORDER)
+            )
+
+    def test_same_pixels_as_pillow_renderer(self):
+        mask = Mask(4, 5)
+        mask.bits[1][1] = False
+        mask.bits[3][4] = False
+        masked = MaskedMaze(mask, "recursive")
+        views = [
+            (self.maze, "bw"),
+            (self.maze, "openings"),
+            (DistancesView(self.maze, 1, 1), "distance"),
+            (PathFinderView(self.maze, 0, 0, 3, 4), "path"),
+            (masked, "bw"),
+            (DistancesView(masked, 0, 0), "distance"),
+        ]
+        for view, mode in views:
+            for cell_size, line_thickness in ((20, 2), (15, 3), (10, 1), (6, 9)):
+                options = dict(cell_size=cell_size, line_thickness=line_thickness)
+                self.assertEqual(
+                    RasterImageCreator(view, mode).render(**options).tobytes(),
+                    MazeImageCreator(view, mode).render(**options).tobytes(),
+                    (mode, cell_size, line_thickness),
+                )
+
+    def test_walls_follow_links(self):
+        image = RasterImageCreator(self.maze).render(cell_size=20, line_thickness=2)
+        grid = self.maze.grid
+
+        for cell in grid.each_cell():
+            x, y = cell.column * 20, cell.row * 20
+            self.assertEqual(self.pixel(image, x + 10, y + 10), WHITE)
+            # Middle of the eastern and southern gridlines of the cell
+            east = BLACK if not cell.is_linked(cell.east) else WHITE
+            south = BLACK if not cell.is_linked(cell.south) else WHITE
+            self.assertEqual(self.pixel(image, x + 20, y + 10), east)
+            self.assertEqual(self.pixel(image, x + 10, y + 20), south)
+        # The frame is black all the way round
+        self.assertEqual(image.getpixel((0, 0)), BLACK)
+
+    def test_modes(self):
+        path = PathFinderView(self.maze, 0, 0, 3, 4)
+        image = RasterImageCreator(path, "path").render(cell_size=20, line_thickness=2)
+        for row, column in path.path:
+            self.assertEqual(
+                self.pixel(image, column * 20 + 10, row * 20 + 10), (200, 200, 200)
+            )
+
+        distances = DistancesView(self.maze, 0, 0)
+        creator = RasterImageCreator(distances, "distance")
+        image = creator.render(cell_size=20, line_thickness=2)
+        for cell in self.maze.grid.each_cell():
+            self.assertEqual(
+                self.pixel(image, cell.column * 20 + 10, cell.row * 20 + 10),
+                creator.background_color_for(cell, WHITE, creator.color_choice),
+            )
+
+        creator = RasterImageCreator(self.maze, "openings")
+        image = creator.render(cell_size=20, line_thickness=2)
+        for cell in self.maze.grid.each_cell():
+            self.assertEqual(
+                self.pixel(image, cell.column * 20 + 10, cell.row * 20 + 10),
+                creator.background_color_for(cell, WHITE, creator.color_choice),
+            )
+
+    def test_masked_cells(self):
+        mask = Mask(3, 3)
+        mask.bits[1][1] = False
+        maze = MaskedMaze(mask, "recursive")
+        image = RasterImageCreator(maze).render(cell_size=20, line_thickness=2)
+
+        # Every gridline around the masked cell borders a real cell that can't be linked to it
+        self.assertEqual(self.pixel(image, 30, 20), BLACK)
+        self.assertEqual(self.pixel(image, 20, 30), BLACK)
+        self.assertEqual(self.pixel(image, 30, 30), WHITE)
+
+    def test_png(self):
+        image = RasterImageCreator(self.maze).render(cell_size=10, line_thickness=2)
+        self.assertTrue(MazeImageCreator.to_png(image).startswith(b"\x89PNG\r\n\x1a\n"))
@@ -0,0 +1,71 @@
+import random
+import unittest
+
+from maze_creator.core.directions import EAST, NORTH
+from maze_creator.core.mask import Mask
+from maze_creator.masked_maze import MaskedMaze
+from maze_creator.maze import Maze
+from maze_creator.views.path_finder_view import PathFinderView
+from maze_creator.visuals.maze_image_creator import BORDER
+from maze_creator.visuals.raster_image_creator import RasterImageCreator
+from maze_creator.visuals.sprite_image_creator import SpriteImageCreator, cell_sprite
+
+WHITE = bytes((255, 255, 255))
+BLACK = bytes((0, 0, 0))
+
+
+class TestCellSprite(unittest.TestCase):
+    def test_walls_and_posts(self):
+        sprite = cell_sprite(10, 4, BLACK, WHITE, NORTH | EAST)
+
+        self.assertEqual(sprite.size, (10, 10))
+        self.assertEqual(sprite.getpixel((5, 1)), (0, 0, 0))  # North wall
+        self.assertEqual(sprite.getpixel((5, 2)), (255, 255, 255))
+        self.assertEqual(sprite.getpixel((8, 5)), (0, 0, 0))  # East wall
+        self.assertEqual(sprite.getpixel((1, 5)), (255, 255, 255))  # No west wall
+        self.assertEqual(sprite.getpixel((1, 9)), (0, 0, 0))  # South west post
+
+    def test_cached(self):
+        self.assertIs(
+            cell_sprite(12, 2, BLACK, WHITE, NORTH),
+            cell_sprite(12, 2, BLACK, WHITE, NORTH),
+        )
+
+
+class TestSpriteImageCreator(unittest.TestCase):
+    def setUp(self):
+        random.seed(19)
+
+    def assert_matches_raster(self, maze, type="bw"):
+        sprite = SpriteImageCreator(maze, type).render(cell_size=20, line_thickness=4)
+        raster = RasterImageCreator(maze, type).render(cell_size=20, line_thickness=4)
+        self.assertEqual(sprite.size, raster.size)
+
+        # Cell centres and the middle of every gridline look the same in both
+        for row in range(maze.grid.rows):
+            for column in range(maze.grid.columns):
+                x, y = BORDER + column * 20, BORDER + row * 20
+                for point in ((x + 10, y + 10), (x + 20, y + 10), (x + 10, y + 20)):
+                    self.assertEqual(sprite.getpixel(point), raster.getpixel(point))
+        self.assertEqual(sprite.getpixel((0, 0)), (0, 0, 0))
+
+    def test_matches_raster(self):
+        maze = Maze(5, 6, "wilson")
+        self.assert_matches_raster(maze)
+        self.assert_matches_raster(maze, "openings")
+        self.assert_matches_raster(PathFinderView(maze, 0, 0, 4, 5), "path")
+
+    def test_masked_cells(self):
+        mask = Mask(4, 4)
+        mask.bits[1][1] = mask.bits[1][2] = False
+        self.assert_matches_raster(MaskedMaze(mask, "recursive"))
+
+    def test_sprites_shared_between_mazes(self):
+        cell_sprite.cache_clear()
+        SpriteImageCreator(Maze(6, 6, "recursive")).render(cell_size=8, line_thickness=2)
+        misses = cell_sprite.cache_info().misses
+        SpriteImageCreator(Maze(6, 6, "recursive")).render(cell_size=8, line_thickness=2)
+
+        # At most 16 wall layouts on a single background color
+        self.assertLessEqual(misses, 16)
+        self.assertLessEqual(cell_sprite.cache_info().misses - misses, 16 - misses)
@@ -0,0 +1,98 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from maze_creator.core.mask import Mask
+from maze_creator.grids.compact_grid import CompactGrid, MaskedCompactGrid
+from maze_creator.grids.grid import Grid
+from maze_creator.grids.masked_grid import MaskedGrid
+from maze_creator.masked_maze import MaskedMaze
+from maze_creator.maze import Maze
+from maze_creator.views.distances_view import DistancesView
+from maze_creator.views.path_finder_view import PathFinderView
+from maze_creator.visuals.text_parser import TextParser
+
+
+class TestTextParser(unittest.TestCase):
+    def test_small_grid(self):
+        grid = TextParser.parse(
+            ["+---+---+", "|       |", "+   +---+", "|       |", "+---+---+"]
+        )
+
+        self.assertIsInstance(grid, Grid)
+        self.assertEqual((grid.rows, grid.columns), (2, 2))
+        self.assertTrue(grid[0, 0].is_linked(grid[0, 1]))
+        self.assertTrue(grid[0, 0].is_linked(grid[1, 0]))
+        self.assertTrue(grid[1, 0].is_linked(grid[1, 1]))
+        self.assertFalse(grid[0, 1].is_linked(grid[1, 1]))
+
+    def test_round_trip(self):
+        random.seed(22)
+        for compact in (False, True):
+            maze = Maze(9, 11, "wilson", compact=compact)
+            drawing = str(maze)
+            grid = TextParser.parse(drawing.splitlines(keepends=True), compact)
+
+            self.assertIsInstance(grid, CompactGrid if compact else Grid)
+            self.assertEqual(str(grid), drawing)
+            self.assertEqual(grid.link_masks(), maze.grid.link_masks())
+
+    def test_cell_contents_are_ignored(self):
+        random.seed(23)
+        maze = Maze(6, 6, "recursive")
+        drawing = str(PathFinderView(maze, 0, 0, 5, 5))
+
+        self.assertEqual(str(TextParser.parse(io.StringIO(drawing))), str(maze))
+
+    def test_masked_round_trip(self):
+        random.seed(24)
+        mask = Mask(6, 7)
+        mask.bits[0][0] = False
+        mask.bits[2][3] = False
+        for compact in (False, True):
+            maze = MaskedMaze(mask, "recursive", compact=compact)
+            grid = TextParser.parse(str(maze).splitlines(), compact)
+
+            self.assertIsInstance(grid, MaskedCompactGrid if compact else MaskedGrid)
+            self.assertIsNone(grid[0, 0])
+            self.assertIsNone(grid[2, 3])
+            self.assertEqual(grid.size(), 40)
+            self.assertEqual(str(grid), str(maze))
+
+    def test_outer_wall_stays_shut(self):
+        grid = TextParser.parse(
+            ["+---+---+", "|        ", "+   +   +", "|       |", "+   +   +"]
+        )
+
+        self.assertEqual(grid[0, 1].east, None)
+        self.assertEqual(str(grid).splitlines()[1], "|       |")
+        self.assertEqual(str(grid).splitlines()[4], "+---+---+")
+
+    def test_malformed_drawings(self):
+        with self.assertRaises(Exception):
+            TextParser.parse([])
+        with self.assertRaises(Exception):
+            TextParser.parse(["+---+---+", "|   |", "+---+"])
+        with self.assertRaises(Exception):
+            TextParser.parse(["+---+"])
+
+    def test_loaded_maze_feeds_views(self):
+        random.seed(25)
+        maze = Maze(5, 5, "wilson")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "maze.txt")
+            with open(path, "w") as f:
+                f.write(str(maze))
+            loaded = Maze.from_txt(path)
+
+        self.assertEqual(str(loaded), str(maze))
+        self.assertEqual(
+            DistancesView(loaded, 0, 0).distances.distances,
+            DistancesView(maze, 0, 0).distances.distances,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import io
+import random
+import unittest
+
+from maze_creator.algos.wilson import Wilson
+from maze_creator.core.mask import Mask
+from maze_creator.grids.compact_grid import CompactGrid, MaskedCompactGrid
+from maze_creator.grids.grid import Grid
+from maze_creator.grids.masked_grid import MaskedGrid
+from maze_creator.maze import Maze
+from maze_creator.views.path_finder_view import PathFinderView
+from maze_creator.visuals.text_renderer import TextRenderer
+
+
+class TestTextRenderer(unittest.TestCase):
+    def test_small_grid(self):
+        grid = Grid(2, 2)
+        grid[0, 0].link(grid[0, 1])
+        grid[0, 0].link(grid[1, 0])
+        grid[1, 0].link(grid[1, 1])
+
+        self.assertEqual(
+            TextRenderer(grid).render(),
+            "\n".join(
+                ["+---+---+", "|       |", "+   +---+", "|       |", "+---+---+", ""]
+            ),
+        )
+
+    def test_write_matches_render(self):
+        random.seed(3)
+        grid = Wilson.create_maze(Grid(8, 9))
+        renderer = TextRenderer(grid)
+
+        fp = io.StringIO()
+        renderer.write(fp)
+        self.assertEqual(fp.getvalue(), renderer.render())
+        self.assertEqual(str(grid), renderer.render())
+        self.assertEqual(len(list(renderer.lines())), 2 * 8 + 1)
+
+    def test_compact_grid_matches_grid(self):
+        random.seed(5)
+        grid = Wilson.create_maze(Grid(6, 7))
+        compact = CompactGrid(6, 7)
+        for cell in grid.each_cell():
+            for neighbor in cell.links():
+                compact[cell.row, cell.column].link(
+                    compact[neighbor.row, neighbor.column]
+                )
+
+        self.assertEqual(TextRenderer(compact).render(), TextRenderer(grid).render())
+
+    def test_contents_of_cell(self):
+        grid = Grid(1, 3)
+        grid[0, 0].link(grid[0, 1])
+        renderer = TextRenderer(grid, lambda cell: str(cell.column))
+
+        self.assertEqual(
+            renderer.render(), "+---+---+---+\n| 0   1 | 2 |\n+---+---+---+\n"
+        )
+
+    def test_masked_cells_keep_alignment(self):
+        mask = Mask(2, 3)
+        mask.bits[0][1] = False
+        for grid in (MaskedGrid(mask), MaskedCompactGrid(mask)):
+            grid[1, 0].link(grid[1, 1])
+            lines = TextRenderer(grid, lambda cell: "*").render().splitlines()
+
+            self.assertEqual(lines[1], "| * |   | * |")
+            self.assertEqual(lines[3], "| *   * | * |")
+            self.assertTrue(all(len(line) == 13 for line in lines))
+
+    def test_path_finder_view(self):
+        random.seed(9)
+        for compact in (False, True):
+            maze = Maze(5, 6, "wilson", compact=compact)
+            view = PathFinderView(maze, 0, 0, 4, 5)
+            drawing = str(view)
+
+            self.assertEqual(drawing.count("*"), len(view.path))
+            # The path drawn through the maze never crosses a wall
+            self.assertEqual(drawing.replace("*", " "), str(maze))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import random
+import unittest
+
+from maze_creator.algos.wilson import Wilson
+from maze_creator.core.mask import Mask
+from maze_creator.grids.compact_grid import CompactGrid
+from maze_creator.grids.grid import Grid
+from maze_creator.grids.masked_grid import MaskedGrid
+from maze_creator.visuals.wall_runs import horizontal_wall_runs, vertical_wall_runs
+
+
+def expand(runs):
+    return {(gridline, i) for gridline, start, end in runs for i in range(start, end)}
+
+
+class TestWallRuns(unittest.TestCase):
+    def test_open_corridor(self):
+        grid = Grid(2, 3)
+        grid[0, 0].link(grid[0, 1])
+        grid[0, 1].link(grid[0, 2])
+        grid[1, 0].link(grid[1, 1])
+
+        self.assertEqual(horizontal_wall_runs(grid), [(0, 0, 3), (1, 0, 3), (2, 0, 3)])
+        self.assertEqual(vertical_wall_runs(grid), [(0, 0, 2), (2, 1, 2), (3, 0, 2)])
+
+    def test_runs_match_links(self):
+        random.seed(17)
+        for grid in (
+            Wilson.create_maze(Grid(6, 7)),
+            Wilson.create_maze(CompactGrid(6, 7)),
+        ):
+            horizontal = expand(horizontal_wall_runs(grid))
+            vertical = expand(vertical_wall_runs(grid))
+            for cell in grid.each_cell():
+                row, column = cell.row, cell.column
+                self.assertEqual(
+                    (row + 1, column) in horizontal, not cell.is_linked(cell.south)
+                )
+                self.assertEqual(
+                    (column + 1, row) in vertical, not cell.is_linked(cell.east)
+                )
+
+            # Runs are maximal, two runs on the same gridline never touch
+            for runs in (horizontal_wall_runs(grid), vertical_wall_runs(grid)):
+                for (line, _, end), (next_line, start, _) in zip(runs, runs[1:]):
+                    if line == next_line:
+                        self.assertLess(end, start)
+
+    def test_masked_cells(self):
+        mask = Mask(2, 2)
+        mask.bits[1][0] = mask.bits[1][1] = False
+        grid = MaskedGrid(mask)
+        grid[0, 0].link(grid[0, 1])
+
+        # No walls between two masked cells, but the outer edge is always walled
+        self.assertEqual(horizontal_wall_runs(grid), [(0, 0, 2), (1, 0, 2), (2, 0, 2)])
+        self.assertEqual(vertical_wall_runs(grid), [(0, 0, 2), (2, 0, 2)])